@@ -0,0 +1,56 @@
+"""Tests for the guild config cache in tux.database.controllers.guild_config."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from tux.database.controllers.guild_config import GuildConfigCache, GuildConfigController
+
+GUILD_ID = 1
+
+
+def config(prefix: str) -> Any:
+    """Build a stand-in for a GuildConfig row."""
+    return SimpleNamespace(prefix=prefix)
+
+
+class TestGuildConfigCache:
+    """Test cases for GuildConfigCache."""
+
+    def test_fill_is_dropped_after_a_write(self) -> None:
+        """A read that started before a write or invalidation does not cache its stale row."""
+        cache = GuildConfigCache()
+
+        version = cache.version(GUILD_ID)
+        cache.set(GUILD_ID, config("new"))
+        cache.fill(GUILD_ID, config("old"), version)
+        assert cache.get(GUILD_ID)[1].prefix == "new"
+
+        version = cache.version(GUILD_ID)
+        cache.invalidate()
+        cache.fill(GUILD_ID, config("old"), version)
+        assert cache.get(GUILD_ID) == (False, None)
+
+    async def test_read_racing_a_write_keeps_the_write(self) -> None:
+        """A lookup whose query is overtaken by a write leaves the written config cached."""
+        cache = GuildConfigCache()
+        query_started = asyncio.Event()
+        write_done = asyncio.Event()
+
+        async def find_first(**_: Any) -> Any:
+            query_started.set()
+            await write_done.wait()
+            return config("old")
+
+        # Skip __init__, which needs a connected Prisma client
+        controller = GuildConfigController.__new__(GuildConfigController)
+        controller.cache = cache
+        controller.table = SimpleNamespace(find_first=find_first)
+
+        read = asyncio.create_task(controller._fetch_config(GUILD_ID))
+        await query_started.wait()
+        cache.set(GUILD_ID, config("new"))
+        write_done.set()
+
+        assert (await read).prefix == "old"
+        assert cache.get(GUILD_ID)[1].prefix == "new"
@@ -0,0 +1,89 @@
+"""Tests for the buffered levels writes in tux.database.controllers.levels."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from prisma.errors import DataError
+from tux.database.controllers import levels
+from tux.database.controllers.levels import LevelsController, LevelsStateCache, MemberLevelState
+
+GUILD_ID = 1
+
+
+@asynccontextmanager
+async def failing_batch() -> AsyncIterator[Any]:
+    msg = "connection lost"
+    raise ConnectionError(msg)
+    yield
+
+
+def make_controller(cache: LevelsStateCache, upsert: Any) -> LevelsController:
+    """Build a controller over ``cache`` whose single-row upserts call ``upsert``."""
+    # Skip __init__, which needs a connected Prisma client
+    controller = LevelsController.__new__(LevelsController)
+    controller.state_cache = cache
+    controller.table = SimpleNamespace(upsert=upsert)
+    controller.table_name = "levels"
+    return controller
+
+
+def buffer_xp(cache: LevelsStateCache, member_id: int, xp: float) -> MemberLevelState:
+    """Add a dirty entry to the cache, as an XP gain would."""
+    state = MemberLevelState(xp=xp, level=1, last_message=None, blacklisted=False, version=1)
+    return cache.add(member_id, GUILD_ID, state)
+
+
+class TestFlushDirtyLevels:
+    """Test cases for LevelsController.flush_dirty_levels."""
+
+    @pytest.fixture(autouse=True)
+    def batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(levels, "db", SimpleNamespace(client=SimpleNamespace(batch_=failing_batch)))
+
+    async def test_entries_stay_dirty_when_writes_fail(self) -> None:
+        """If both the batch and the row writes fail, every entry is kept for the next flush."""
+        cache = LevelsStateCache()
+        states = [buffer_xp(cache, member_id, 10.0) for member_id in (1, 2)]
+
+        async def upsert(**_: Any) -> None:
+            msg = "connection lost"
+            raise ConnectionError(msg)
+
+        with pytest.raises(ConnectionError):
+            await make_controller(cache, upsert).flush_dirty_levels()
+
+        assert all(state.dirty for state in states)
+        assert len(cache.dirty_items()) == 2
+
+    async def test_rejected_rows_are_dropped(self) -> None:
+        """A row the database rejects is dropped, and the other rows are still written."""
+        cache = LevelsStateCache()
+        rejected, accepted = buffer_xp(cache, 1, 10.0), buffer_xp(cache, 2, 20.0)
+        written: list[int] = []
+
+        async def upsert(**kwargs: Any) -> None:
+            member_id = kwargs["where"]["member_id_guild_id"]["member_id"]
+            if member_id == 1:
+                raise DataError({"user_facing_error": {"message": "bad row"}})
+            written.append(member_id)
+
+        assert await make_controller(cache, upsert).flush_dirty_levels() == 1
+        assert written == [2]
+        assert not rejected.dirty
+        assert not accepted.dirty
+
+    async def test_changes_made_during_a_flush_stay_dirty(self) -> None:
+        """XP gained while a row is being written is not marked as flushed."""
+        cache = LevelsStateCache()
+        state = buffer_xp(cache, 1, 10.0)
+
+        async def upsert(**_: Any) -> None:
+            state.xp += 5
+            state.version += 1
+
+        assert await make_controller(cache, upsert).flush_dirty_levels() == 1
+        assert state.dirty
@@ -0,0 +1,68 @@
+"""Tests for the snippet cache in tux.database.controllers.snippet."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tux.database.controllers import snippet
+from tux.database.controllers.snippet import SnippetCache, SnippetController
+
+GUILD_ID = 1
+
+
+def make_controller(rows: list[Any], before_return: Any = None) -> SnippetController:
+    """Build a controller whose snippet table returns ``rows``, awaiting ``before_return`` first."""
+
+    async def find_many(**_: Any) -> list[Any]:
+        if before_return is not None:
+            await before_return()
+        return rows
+
+    # Skip __init__, which needs a connected Prisma client
+    controller = SnippetController.__new__(SnippetController)
+    controller.table = SimpleNamespace(find_many=find_many)
+    controller.table_name = "snippet"
+    return controller
+
+
+class TestSnippetCache:
+    """Test cases for the guild snippet cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self, monkeypatch: pytest.MonkeyPatch) -> SnippetCache:
+        cache = SnippetCache()
+        monkeypatch.setattr(snippet, "snippet_cache", cache)
+        return cache
+
+    async def test_snippets_are_loaded_once(self, cache: SnippetCache) -> None:
+        """A guild's snippets are cached by lowercased name, with buffered uses applied."""
+        row = SimpleNamespace(snippet_id=7, snippet_name="Hello", uses=2)
+        cache.pending_uses[7] = 3
+        controller = make_controller([row])
+
+        snippets = await controller._get_guild_snippets(GUILD_ID)
+
+        assert snippets == {"hello": row}
+        assert row.uses == 5
+        assert cache.guilds[GUILD_ID] is snippets
+
+    async def test_load_racing_a_write_is_not_cached(self, cache: SnippetCache) -> None:
+        """Rows read before an invalidation are returned but not kept in the cache."""
+        query_started = asyncio.Event()
+        write_done = asyncio.Event()
+
+        async def wait_for_write() -> None:
+            query_started.set()
+            await write_done.wait()
+
+        controller = make_controller([SimpleNamespace(snippet_id=7, snippet_name="old", uses=0)], wait_for_write)
+
+        load = asyncio.create_task(controller._get_guild_snippets(GUILD_ID))
+        await query_started.wait()
+        cache.invalidate(GUILD_ID)
+        write_done.set()
+
+        assert list(await load) == ["old"]
+        assert GUILD_ID not in cache.guilds
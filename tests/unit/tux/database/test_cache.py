@@ -0,0 +1,44 @@
+"""Tests for the tux.database.cache module."""
+
+from tux.database.cache import RowCache
+
+
+class TestRowCache:
+    """Test cases for RowCache."""
+
+    def test_fill_never_overwrites_a_write(self) -> None:
+        """A database read filled after a write keeps the written value, including None."""
+        cache: RowCache[int, str] = RowCache()
+
+        cache.set(1, None)
+        cache.fill(1, "stale")
+        cache.fill(2, "row")
+
+        assert cache.get(1) == (True, None)
+        assert cache.get(2) == (True, "row")
+        assert cache.get(3) == (False, None)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Reads refresh a key, so the least recently read or written key is evicted."""
+        cache: RowCache[int, str] = RowCache(maxsize=2)
+
+        cache.set(1, "a")
+        cache.set(2, "b")
+        cache.get(1)
+        cache.set(3, "c")
+
+        assert cache.get(2) == (False, None)
+        assert cache.get(1) == (True, "a")
+        assert cache.get(3) == (True, "c")
+
+    def test_pop_and_discard(self) -> None:
+        """Keys can be dropped one at a time or by predicate."""
+        cache: RowCache[tuple[int, int], str] = RowCache()
+        for key in [(1, 1), (1, 2), (2, 1)]:
+            cache.set(key, "row")
+
+        cache.pop((2, 1))
+        cache.pop((3, 3))
+        cache.discard(lambda key: key[0] == 1)
+
+        assert all(cache.get(key) == (False, None) for key in [(1, 1), (1, 2), (2, 1)])
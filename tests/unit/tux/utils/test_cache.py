@@ -0,0 +1,43 @@
+"""Tests for the tux.utils.cache module."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tux.utils import cache
+from tux.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Reads refresh a key, so the least recently read or written key is evicted."""
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=60, maxsize=2)
+
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        assert ttl_cache.get("a") == 1
+        ttl_cache.set("c", 3)
+
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An entry is served up to its time-to-live and dropped after it."""
+        now = 1000.0
+        monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now))
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=60, maxsize=2)
+
+        ttl_cache.set("a", 1)
+        now += 60
+        assert ttl_cache.get("a") == 1
+
+        now += 1
+        assert ttl_cache.get("a") is None
+
+        # Setting a key again restarts its time-to-live
+        ttl_cache.set("a", 2)
+        now += 30
+        assert ttl_cache.get("a") == 2
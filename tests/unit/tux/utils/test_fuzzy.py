@@ -0,0 +1,32 @@
+"""Tests for the tux.utils.fuzzy module."""
+
+import Levenshtein
+
+from tux.utils.fuzzy import BKTree
+
+NAMES = ["arch", "archwiki", "debian", "fedora", "gentoo", "nix", "nixos", "void", "ubuntu", "mint"]
+
+
+class TestBKTree:
+    """Test cases for BKTree."""
+
+    def test_matches_linear_scan(self) -> None:
+        """Search returns exactly the names a full scan would, closest first."""
+        tree = BKTree(NAMES)
+
+        for query in ["arc", "fedra", "nixo", "ubunto", "zzzzzz", "voids"]:
+            for max_distance in range(4):
+                expected = sorted(
+                    (Levenshtein.distance(query, name), name)
+                    for name in NAMES
+                    if Levenshtein.distance(query, name) <= max_distance
+                )
+                assert tree.search(query, max_distance) == expected
+
+    def test_duplicates_and_limit(self) -> None:
+        """Duplicate names are stored once and limit caps the results."""
+        tree = BKTree([*NAMES, "arch", "nix"])
+
+        assert len(tree) == len(NAMES)
+        assert tree.search("nixo", 1, limit=1) == [(1, "nix")]
+        assert BKTree().search("anything", 3) == []
@@ -0,0 +1,103 @@
+"""Tests for the tux.utils.scheduler module."""
+
+import asyncio
+from collections.abc import Hashable
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tux.utils.scheduler import Scheduler
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(UTC) + timedelta(seconds=seconds)
+
+
+class Recorder:
+    """Timer handler that records the keys it was called with."""
+
+    def __init__(self) -> None:
+        self.keys: list[Hashable] = []
+        self.called = asyncio.Event()
+
+    async def __call__(self, key: Hashable) -> None:
+        self.keys.append(key)
+        self.called.set()
+
+
+class TestScheduler:
+    """Test cases for Scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_fires_in_deadline_order(self) -> None:
+        """Timers fire in deadline order regardless of scheduling order."""
+        scheduler = Scheduler()
+        recorder = Recorder()
+        scheduler.register("test", recorder)
+
+        scheduler.schedule("test", "late", _in(0.1))
+        scheduler.schedule("test", "early", _in(0.02))
+
+        await asyncio.sleep(0.2)
+        assert recorder.keys == ["early", "late"]
+        assert scheduler.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_past_deadline_fires_immediately(self) -> None:
+        """A deadline in the past fires on the next loop iteration."""
+        scheduler = Scheduler()
+        recorder = Recorder()
+        scheduler.register("test", recorder)
+
+        scheduler.schedule("test", 1, _in(-60))
+
+        await asyncio.wait_for(recorder.called.wait(), 1)
+        assert recorder.keys == [1]
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_reschedule(self) -> None:
+        """Cancelled timers never fire and rescheduling replaces the deadline."""
+        scheduler = Scheduler()
+        recorder = Recorder()
+        scheduler.register("test", recorder)
+
+        scheduler.schedule("test", "cancelled", _in(0.02))
+        scheduler.schedule("test", "moved", _in(0.02))
+        assert scheduler.cancel("test", "cancelled")
+        assert not scheduler.cancel("test", "missing")
+        scheduler.schedule("test", "moved", _in(10))
+
+        await asyncio.sleep(0.1)
+        assert recorder.keys == []
+        assert scheduler.pending("test") == 1
+
+    @pytest.mark.asyncio
+    async def test_held_until_handler_registered(self) -> None:
+        """Due timers without a handler are held and fired on registration."""
+        scheduler = Scheduler()
+        recorder = Recorder()
+
+        scheduler.schedule("test", 1, _in(-1))
+        await asyncio.sleep(0.02)
+        assert scheduler.pending("test") == 1
+
+        scheduler.register("test", recorder)
+        await asyncio.wait_for(recorder.called.wait(), 1)
+        assert recorder.keys == [1]
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_stop_scheduler(self) -> None:
+        """An exception in one handler does not prevent later timers from firing."""
+        scheduler = Scheduler()
+        recorder = Recorder()
+
+        async def failing(key: Hashable) -> None:
+            raise RuntimeError(key)
+
+        scheduler.register("fail", failing)
+        scheduler.register("test", recorder)
+        scheduler.schedule("fail", 1, _in(-1))
+        scheduler.schedule("test", 2, _in(0.02))
+
+        await asyncio.wait_for(recorder.called.wait(), 1)
+        assert recorder.keys == [2]
@@ -0,0 +1,65 @@
+"""Tests for the GitHub read cache in tux.wrappers.github."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from githubkit import GitHub
+
+from tux.wrappers import github
+from tux.wrappers.github import GITHUB_CACHE_FRESHNESS, GithubResponseCache, GithubService
+
+
+class TestGithubResponseCache:
+    """Test cases for GithubResponseCache."""
+
+    async def test_reads_are_reused_until_stale(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A repeated read within the freshness window does not reach the API, one after it does."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[])
+
+        now = 1000.0
+        monkeypatch.setattr(github, "time", SimpleNamespace(monotonic=lambda: now))
+        monkeypatch.setattr(github, "github_response_cache", GithubResponseCache())
+
+        # Skip __init__, which sets up GitHub App authentication
+        service = GithubService.__new__(GithubService)
+        service.github = GitHub("token", async_transport=httpx.MockTransport(handler), http_cache=False)
+
+        assert await service.get_open_issues() == []
+        now += GITHUB_CACHE_FRESHNESS - 1
+        assert await service.get_open_issues() == []
+        assert len(requests) == 1
+
+        now += 2
+        assert await service.get_open_issues() == []
+        assert len(requests) == 2
+        assert requests[-1].url.params["state"] == "open"
+
+    async def test_stale_reads_are_revalidated_with_etags(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Once the freshness window passes, a 304 from GitHub is answered with the stored body."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=[], headers={"ETag": '"v1"', "Cache-Control": "private, max-age=60"})
+
+        now = 1000.0
+        monkeypatch.setattr(github, "time", SimpleNamespace(monotonic=lambda: now))
+        monkeypatch.setattr(github, "github_response_cache", GithubResponseCache())
+
+        service = GithubService.__new__(GithubService)
+        service.github = GitHub("token", async_transport=httpx.MockTransport(handler))
+
+        assert await service.get_open_issues() == []
+        now += GITHUB_CACHE_FRESHNESS + 1
+        assert await service.get_open_issues() == []
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,68 @@
+"""Tests for the TLDR page store in tux.wrappers.tldr."""
+
+from pathlib import Path
+
+import pytest
+
+from tux.wrappers import tldr
+from tux.wrappers.tldr import TldrPageStore
+
+
+@pytest.fixture
+def store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TldrPageStore:
+    """A page store over a small extracted archive."""
+    pages = {
+        "common": ["git", "git-add", "grep", "ls", "tar"],
+        "linux": ["apt", "apt-get", "ls"],
+        "osx": ["brew"],
+    }
+    for platform, commands in pages.items():
+        (tmp_path / "pages" / platform).mkdir(parents=True)
+        for command in commands:
+            (tmp_path / "pages" / platform / f"{command}.md").write_text(f"# {command}\n", encoding="utf-8")
+
+    monkeypatch.setattr(tldr, "CACHE_DIR", tmp_path)
+    return TldrPageStore()
+
+
+class TestTldrPageStore:
+    """Test cases for TldrPageStore."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_and_listing(self, store: TldrPageStore) -> None:
+        """Pages are served from memory and listings merge the requested platforms."""
+        await store.ensure_loaded("en_US")
+
+        assert store.get_page("ls", "linux", "en") == "# ls\n"
+        assert store.get_page("brew", "linux", "en") is None
+        assert store.list_commands("en", ["linux", "common"]) == [
+            "apt",
+            "apt-get",
+            "git",
+            "git-add",
+            "grep",
+            "ls",
+            "tar",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_orders_prefix_before_substring(self, store: TldrPageStore) -> None:
+        """Prefix matches come first, then substring matches, then close spellings."""
+        await store.ensure_loaded("en")
+        platforms = ["linux", "common"]
+
+        assert store.search_commands("en", platforms, "") == store.list_commands("en", platforms)
+        assert store.search_commands("en", platforms, "Git") == ["git", "git-add"]
+        assert store.search_commands("en", platforms, "a") == ["apt", "apt-get", "git-add", "tar"]
+        assert store.search_commands("en", platforms, "a", limit=1) == ["apt"]
+        assert store.search_commands("en", platforms, "grpe") == ["grep"]
+
+    @pytest.mark.asyncio
+    async def test_added_pages_are_listed(self, store: TldrPageStore) -> None:
+        """Pages fetched outside the archive show up in later searches."""
+        await store.ensure_loaded("en")
+        assert store.search_commands("en", ["linux"], "ap") == ["apt", "apt-get"]
+
+        store.add_page("# apk\n", "apk", "linux", "en")
+
+        assert store.search_commands("en", ["linux"], "ap") == ["apk", "apt", "apt-get"]
@@ -19,11 +19,13 @@ from rich.console import Console
 
 from tux.cog_loader import CogLoader
 from tux.database.client import db
+from tux.database.controllers import DatabaseController
 from tux.utils.banner import create_banner
 from tux.utils.config import Config
 from tux.utils.emoji import EmojiManager
 from tux.utils.env import is_dev_mode
 from tux.utils.sentry import start_span, start_transaction
+from tux.wrappers.http_client import http_clients
 
 # Create console for rich output
 console = Console(stderr=True, force_terminal=True)
@@ -45,6 +47,11 @@ class Tux(commands.Bot):
     Handles setup, cog loading, error handling, Sentry tracing, and resource cleanup.
     """
 
+    # Bumped whenever a top-level command is added or removed, including on
+    # extension (re)loads, so indexes built from the command tree know to rebuild.
+    # A class attribute because discord.py registers the help command during __init__.
+    command_version: int = 0
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Tux bot and start setup process."""
         super().__init__(*args, **kwargs)
@@ -61,6 +68,8 @@ class Tux(commands.Bot):
         self._startup_task = None
 
         self.emoji_manager = EmojiManager(self)
+        # Named pooled HTTP clients shared by cogs and wrappers, closed on shutdown
+        self.http_clients = http_clients
         self.console = Console(stderr=True, force_terminal=True)
 
         logger.debug("Creating bot setup task")
@@ -210,6 +219,19 @@ class Tux(commands.Bot):
                     "Bot disconnected from Discord, this happens sometimes and is fine as long as it's not happening too often",
                 )
 
+    # --- Command Registration ---
+
+    def add_command(self, command: commands.Command[Any, ..., Any], /) -> None:
+        """Register a command and mark the command tree as changed."""
+        super().add_command(command)
+        self.command_version += 1
+
+    def remove_command(self, name: str, /) -> commands.Command[Any, ..., Any] | None:
+        """Unregister a command and mark the command tree as changed."""
+        command = super().remove_command(name)
+        self.command_version += 1
+        return command
+
     # --- Sentry Transaction Tracking ---
 
     def start_interaction_transaction(self, interaction_id: int, name: str) -> Any:
@@ -342,6 +364,9 @@ class Tux(commands.Bot):
             await self._cleanup_tasks()
             transaction.set_tag("tasks_cleaned", True)
 
+            await self._flush_buffered_writes()
+            transaction.set_tag("buffers_flushed", True)
+
             await self._close_connections()
             transaction.set_tag("connections_closed", True)
 
@@ -423,8 +448,40 @@ class Tux(commands.Bot):
 
                 logger.debug(f"Cancelled {task_type}")
 
+    async def _flush_buffered_writes(self) -> None:
+        """Persist writes buffered in memory before the database connection closes."""
+        with start_span("bot.flush_buffers", "Flushing buffered database writes") as span:
+            if not db.is_connected():
+                logger.warning("Database is not connected, buffered writes cannot be flushed.")
+                span.set_tag("db_connected", False)
+                return
+
+            try:
+                flushed = await DatabaseController().levels.flush_dirty_levels()
+                logger.debug(f"Flushed {flushed} buffered levels rows.")
+                span.set_data("levels_flushed", flushed)
+
+            except Exception as e:
+                logger.error(f"Error flushing buffered levels rows: {e}")
+                span.set_data("levels_error", str(e))
+
+                if sentry_sdk.is_initialized():
+                    sentry_sdk.capture_exception(e)
+
+            try:
+                flushed = await DatabaseController().snippet.flush_snippet_uses()
+                logger.debug(f"Flushed uses of {flushed} snippets.")
+                span.set_data("snippet_uses_flushed", flushed)
+
+            except Exception as e:
+                logger.error(f"Error flushing buffered snippet uses: {e}")
+                span.set_data("snippet_uses_error", str(e))
+
+                if sentry_sdk.is_initialized():
+                    sentry_sdk.capture_exception(e)
+
     async def _close_connections(self) -> None:
-        """Close Discord and database connections."""
+        """Close Discord, database and HTTP connections."""
         with start_span("bot.close_connections", "Closing connections") as span:
             try:
                 logger.debug("Closing Discord connections.")
@@ -462,6 +519,23 @@ class Tux(commands.Bot):
                 if sentry_sdk.is_initialized():
                     sentry_sdk.capture_exception(e)
 
+            try:
+                logger.debug("Closing HTTP connections.")
+
+                for name, metrics in self.http_clients.metrics().items():
+                    logger.debug(
+                        f"HTTP client {name}: {metrics.requests} requests, {metrics.failures} failed, "
+                        f"{metrics.average_time:.3f}s average, {metrics.max_time:.3f}s max",
+                    )
+
+                await self.http_clients.aclose()
+                span.set_tag("http_closed", True)
+
+            except Exception as e:
+                logger.error(f"Error during HTTP client shutdown: {e}")
+                span.set_tag("http_closed", False)
+                span.set_data("http_error", str(e))
+
     async def _load_cogs(self) -> None:
         """Load bot cogs using CogLoader."""
         with start_span("bot.load_cogs", "Loading all cogs") as span:
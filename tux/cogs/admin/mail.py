@@ -74,23 +74,22 @@ class Mail(commands.Cog):
             password = self._generate_password()
             mailbox_data = self._prepare_mailbox_data(username, password, member.id)
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                try:
-                    response = await client.post(
-                        f"{self.api_url}/add/mailbox",
-                        headers=self.headers,
-                        json=mailbox_data,
-                    )
-
-                    await self._handle_response(interaction, response, member, password)
-
-                except httpx.RequestError as exc:
-                    await interaction.response.send_message(
-                        f"An error occurred while requesting {exc.request.url!r}.",
-                        ephemeral=True,
-                        delete_after=30,
-                    )
-                    logger.error(f"HTTP request error: {exc}")
+            try:
+                response = await self.bot.http_clients.get("mail").post(
+                    f"{self.api_url}/add/mailbox",
+                    headers=self.headers,
+                    json=mailbox_data,
+                )
+
+                await self._handle_response(interaction, response, member, password)
+
+            except httpx.RequestError as exc:
+                await interaction.response.send_message(
+                    f"An error occurred while requesting {exc.request.url!r}.",
+                    ephemeral=True,
+                    delete_after=30,
+                )
+                logger.error(f"HTTP request error: {exc}")
         else:
             await interaction.response.send_message(
                 "This command can only be used in a guild (server).",
@@ -1,14 +1,16 @@
 import io
+from concurrent.futures.process import BrokenProcessPool
 
 import discord
 import httpx
 from discord import app_commands
 from discord.ext import commands
 from loguru import logger
-from PIL import Image, ImageEnhance, ImageOps
+from PIL import UnidentifiedImageError
 
 from tux.bot import Tux
 from tux.ui.embeds import EmbedCreator
+from tux.utils.images import MAX_IMAGE_BYTES, ImageTooLargeError, deepfry, image_pool
 
 
 class ImgEffect(commands.Cog):
@@ -16,6 +18,9 @@ class ImgEffect(commands.Cog):
         self.bot = bot
         self.allowed_mimetypes = ["image/jpeg", "image/png"]
 
+    async def cog_unload(self) -> None:
+        image_pool.shutdown()
+
     imgeffect = app_commands.Group(name="imgeffect", description="Image effects")
 
     @imgeffect.command(name="deepfry", description="Deepfry an image")
@@ -26,41 +31,40 @@ class ImgEffect(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
-        pil_image = await self.fetch_image(image.url)
+        image_data = await self.fetch_image(image.url)
 
-        if pil_image:
-            deepfried_image = self.deepfry_image(pil_image)
-            await self.send_deepfried_image(interaction, deepfried_image)
+        if image_data is None:
+            await self.send_error_response(interaction)
+            return
 
-        else:
+        try:
+            deepfried_image = await image_pool.run(deepfry, image_data)
+        except (ImageTooLargeError, UnidentifiedImageError, OSError, BrokenProcessPool) as e:
+            logger.warning(f"Could not deepfry image {image.url}: {e}")
             await self.send_error_response(interaction)
+        else:
+            await self.send_deepfried_image(interaction, deepfried_image)
 
     def is_valid_image(self, image: discord.Attachment) -> bool:
-        return image.content_type in self.allowed_mimetypes
+        return image.content_type in self.allowed_mimetypes and image.size <= MAX_IMAGE_BYTES
 
-    @staticmethod
-    async def fetch_image(url: str) -> Image.Image:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-
-        return Image.open(io.BytesIO(response.content)).convert("RGB")
-
-    @staticmethod
-    def deepfry_image(pil_image: Image.Image) -> Image.Image:
-        pil_image = pil_image.resize((int(pil_image.width * 0.25), int(pil_image.height * 0.25)))
-        pil_image = ImageEnhance.Sharpness(pil_image).enhance(100.0)
+    async def fetch_image(self, url: str) -> bytes | None:
+        """Download an image, giving up once it exceeds MAX_IMAGE_BYTES."""
+        data = bytearray()
 
-        r = pil_image.split()[0]
-        r = ImageEnhance.Contrast(r).enhance(2.0)
-        r = ImageEnhance.Brightness(r).enhance(1.5)
+        try:
+            async with self.bot.http_clients.get("media").stream("GET", url) as response:
+                response.raise_for_status()
 
-        black_color = f"#{254:02x}{0:02x}{2:02x}"  # (254, 0, 2) as hex
-        white_color = f"#{255:02x}{255:02x}{15:02x}"  # (255, 255, 15) as hex
+                async for chunk in response.aiter_bytes():
+                    data += chunk
+                    if len(data) > MAX_IMAGE_BYTES:
+                        return None
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not download image {url}: {e}")
+            return None
 
-        r = ImageOps.colorize(r, black_color, white_color)
-        pil_image = Image.blend(pil_image, r, 0.75)
-
-        return pil_image.resize((int(pil_image.width * 4), int(pil_image.height * 4)))
+        return bytes(data)
 
     async def send_invalid_image_response(self, interaction: discord.Interaction) -> None:
         logger.error("The file is not a permitted image.")
@@ -71,7 +75,10 @@ class ImgEffect(commands.Cog):
             user_name=interaction.user.name,
             user_display_avatar=interaction.user.display_avatar.url,
             title="Invalid File",
-            description="The file must be an image. Allowed types are PNG, JPEG, and JPG.",
+            description=(
+                "The file must be an image. Allowed types are PNG, JPEG, and JPG, "
+                f"up to {MAX_IMAGE_BYTES // (1024 * 1024)} MB."
+            ),
         )
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -88,15 +95,12 @@ class ImgEffect(commands.Cog):
             description="An error occurred while processing the image.",
         )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        # The response has already been deferred while the image was processed
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @staticmethod
-    async def send_deepfried_image(interaction: discord.Interaction, deepfried_image: Image.Image) -> None:
-        arr = io.BytesIO()
-        deepfried_image.save(arr, format="JPEG", quality=1)
-        arr.seek(0)
-
-        file = discord.File(arr, filename="deepfried.jpg")
+    async def send_deepfried_image(interaction: discord.Interaction, deepfried_image: bytes) -> None:
+        file = discord.File(io.BytesIO(deepfried_image), filename="deepfried.jpg")
 
         await interaction.followup.send(file=file, ephemeral=True)
 
@@ -1,5 +1,5 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from loguru import logger
 
 from tux.bot import Tux
@@ -18,6 +18,20 @@ class Xkcd(commands.Cog):
         self.random.usage = generate_usage(self.random)
         self.specific.usage = generate_usage(self.specific)
 
+    async def cog_load(self) -> None:
+        self.prefetch_latest_comic.start()
+
+    async def cog_unload(self) -> None:
+        self.prefetch_latest_comic.cancel()
+
+    @tasks.loop(seconds=xkcd.LATEST_COMIC_TTL)
+    async def prefetch_latest_comic(self) -> None:
+        """Keep the latest comic cached so latest and random requests are served from the cache."""
+        try:
+            await self.client.prefetch_latest_comic()
+        except Exception as e:
+            logger.warning(f"Failed to prefetch the latest xkcd comic: {e}")
+
     @commands.hybrid_group(
         name="xkcd",
         aliases=["xk"],
@@ -117,12 +131,13 @@ class Xkcd(commands.Cog):
         Get the xkcd comic and create an embed.
         """
         try:
+            # The embed links the image by URL, so the raw image is never downloaded
             if latest:
-                comic = self.client.get_latest_comic(raw_comic_image=True)
+                comic = await self.client.get_latest_comic()
             elif number:
-                comic = self.client.get_comic(number, raw_comic_image=True)
+                comic = await self.client.get_comic(number)
             else:
-                comic = self.client.get_random_comic(raw_comic_image=True)
+                comic = await self.client.get_random_comic()
 
             embed = EmbedCreator.create_embed(
                 bot=self.bot,
@@ -2,15 +2,12 @@ import mimetypes
 from io import BytesIO
 
 import discord
-import httpx
 from discord import app_commands
 from discord.ext import commands
 
 from tux.bot import Tux
 from tux.utils.functions import generate_usage
 
-client = httpx.AsyncClient()
-
 
 class Avatar(commands.Cog):
     def __init__(self, bot: Tux) -> None:
@@ -104,8 +101,7 @@ class Avatar(commands.Cog):
             else:
                 await source.reply("You have no avatar.", ephemeral=True, delete_after=30)
 
-    @staticmethod
-    async def create_avatar_file(url: str) -> discord.File:
+    async def create_avatar_file(self, url: str) -> discord.File:
         """
         Create a discord file from an avatar url.
 
@@ -120,7 +116,7 @@ class Avatar(commands.Cog):
             The discord file.
         """
 
-        response = await client.get(url, timeout=10)
+        response = await self.bot.http_clients.get("media").get(url)
         response.raise_for_status()
 
         content_type = response.headers.get("Content-Type")
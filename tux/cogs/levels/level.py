@@ -41,8 +41,12 @@ class Level(commands.Cog):
         if member is None:
             member = ctx.author
 
-        xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
-        level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
+        record = await self.db.levels.get_member_record(member.id, ctx.guild.id)
+        xp: float = record.xp
+        level: int = record.level
+        # Blacklisted members are not ranked; 0 means the rank could not be queried
+        rank: int = 0 if record.blacklisted else await self.db.levels.get_rank(member.id, ctx.guild.id)
+        rank_display: str = f" • Rank #{rank}" if rank else ""
 
         if self.levels_service.enable_xp_cap and level >= self.levels_service.max_level:
             max_xp: float = self.levels_service.calculate_xp_for_level(self.levels_service.max_level)
@@ -65,12 +69,12 @@ class Level(commands.Cog):
                 custom_color=discord.Color.blurple(),
                 custom_author_text=f"{member.name}",
                 custom_author_icon_url=member.display_avatar.url,
-                custom_footer_text=f"Total XP: {xp_display}",
+                custom_footer_text=f"Total XP: {xp_display}{rank_display}",
             )
         else:
             embed: discord.Embed = EmbedCreator.create_embed(
                 embed_type=EmbedType.DEFAULT,
-                description=f"**Level {level_display}** - `XP: {xp_display}`",
+                description=f"**Level {level_display}** - `XP: {xp_display}`{rank_display}",
                 custom_color=discord.Color.blurple(),
                 custom_author_text=f"{member.name}",
                 custom_author_icon_url=member.display_avatar.url,
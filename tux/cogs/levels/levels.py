@@ -1,4 +1,5 @@
 import datetime
+import math
 
 import discord
 from discord.ext import commands
@@ -10,6 +11,8 @@ from tux.ui.embeds import EmbedCreator, EmbedType
 from tux.utils import checks
 from tux.utils.functions import generate_usage
 
+LEADERBOARD_PAGE_SIZE = 10
+
 
 class Levels(commands.Cog):
     def __init__(self, bot: Tux) -> None:
@@ -21,6 +24,7 @@ class Levels(commands.Cog):
         self.reset.usage = generate_usage(self.reset)
         self.blacklist.usage = generate_usage(self.blacklist)
         self.set_xp.usage = generate_usage(self.set_xp)
+        self.leaderboard.usage = generate_usage(self.leaderboard)
 
     @commands.hybrid_group(
         name="levels",
@@ -56,8 +60,9 @@ class Levels(commands.Cog):
 
         assert ctx.guild
 
-        old_level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
-        old_xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
+        record = await self.db.levels.get_member_record(member.id, ctx.guild.id)
+        old_level: int = record.level
+        old_xp: float = record.xp
 
         if embed_result := self.levels_service.valid_xplevel_input(new_level):
             await ctx.send(embed=embed_result)
@@ -105,8 +110,9 @@ class Levels(commands.Cog):
             await ctx.send(embed=embed_result)
             return
 
-        old_level: int = await self.db.levels.get_level(member.id, ctx.guild.id)
-        old_xp: float = await self.db.levels.get_xp(member.id, ctx.guild.id)
+        record = await self.db.levels.get_member_record(member.id, ctx.guild.id)
+        old_level: int = record.level
+        old_xp: float = record.xp
 
         new_level: int = self.levels_service.calculate_level(xp_amount)
         await self.db.levels.update_xp_and_level(
@@ -187,6 +193,49 @@ class Levels(commands.Cog):
 
         await ctx.send(embed=embed)
 
+    @commands.guild_only()
+    @levels.command(name="leaderboard", aliases=["lb", "top"])
+    async def leaderboard(self, ctx: commands.Context[Tux], page: int = 1) -> None:
+        """
+        Shows a page of the members with the most XP.
+
+        Parameters
+        ----------
+        ctx : commands.Context[Tux]
+            The context object for the command.
+
+        page : int
+            The page of the leaderboard to show.
+        """
+        assert ctx.guild
+
+        page = max(page, 1)
+        leaderboard = await self.db.levels.get_leaderboard(
+            ctx.guild.id,
+            limit=LEADERBOARD_PAGE_SIZE,
+            skip=(page - 1) * LEADERBOARD_PAGE_SIZE,
+            member_id=ctx.author.id,
+        )
+        pages = max(math.ceil(leaderboard.total / LEADERBOARD_PAGE_SIZE), 1)
+
+        lines = [
+            f"**#{entry.rank}** <@{entry.member_id}> - Level {entry.level} (`{round(entry.xp)}` XP)"
+            for entry in leaderboard.entries
+        ]
+        footer = f"Page {min(page, pages)}/{pages}"
+        if leaderboard.member is not None:
+            footer += f" • Your rank: #{leaderboard.member.rank}"
+
+        embed: discord.Embed = EmbedCreator.create_embed(
+            embed_type=EmbedType.INFO,
+            title=f"XP Leaderboard - {ctx.guild.name}",
+            description="\n".join(lines) or "No ranked members on this page.",
+            custom_color=discord.Color.blurple(),
+            custom_footer_text=footer,
+        )
+
+        await ctx.send(embed=embed)
+
 
 async def setup(bot: Tux) -> None:
     await bot.add_cog(Levels(bot))
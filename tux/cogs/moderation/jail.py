@@ -57,16 +57,13 @@ class Jail(ModerationCogBase):
         bool
             True if the user is jailed, False otherwise.
         """
-        # Get latest case for this user (more efficient than counting all cases)
-        latest_case = await self.db.case.get_latest_case_by_user(
+        return await self.db.case.is_user_under_restriction(
             guild_id=guild_id,
             user_id=user_id,
-            case_types=[CaseType.JAIL, CaseType.UNJAIL],
+            active_restriction_type=CaseType.JAIL,
+            inactive_restriction_type=CaseType.UNJAIL,
         )
 
-        # If no cases exist or latest case is an unjail, user is not jailed
-        return bool(latest_case and latest_case.case_type == CaseType.JAIL)
-
     @commands.hybrid_command(
         name="jail",
         aliases=["j"],
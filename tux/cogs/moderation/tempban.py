@@ -1,7 +1,7 @@
 from datetime import UTC, datetime, timedelta
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from loguru import logger
 
 from prisma.enums import CaseType
@@ -10,16 +10,17 @@ from tux.bot import Tux
 from tux.utils import checks
 from tux.utils.flags import TempBanFlags
 from tux.utils.functions import generate_usage
+from tux.utils.scheduler import scheduler
 
 from . import ModerationCogBase
 
+TEMPBAN_RETRY_DELAY = timedelta(minutes=1)
+
 
 class TempBan(ModerationCogBase):
     def __init__(self, bot: Tux) -> None:
         super().__init__(bot)
         self.tempban.usage = generate_usage(self.tempban, TempBanFlags)
-        self._processing_tempbans = False  # Lock to prevent overlapping task runs
-        self.tempban_check.start()
 
     @commands.hybrid_command(name="tempban", aliases=["tb"])
     @commands.guild_only()
@@ -89,8 +90,9 @@ class TempBan(ModerationCogBase):
 
         guild = self.bot.get_guild(case.guild_id)
         if not guild:
+            # Count as failed so the expiry is retried once the guild is available again
             logger.warning(f"Guild {case.guild_id} not found for case {case.case_id}")
-            return 0, 0
+            return 0, 1
 
         # Check ban status
         try:
@@ -152,53 +154,42 @@ class TempBan(ModerationCogBase):
 
         return processed_count, failed_count
 
-    @tasks.loop(minutes=1)
-    async def tempban_check(self) -> None:
-        """
-        Check for expired tempbans at a set interval and unban the user if the ban has expired.
+    async def cog_load(self) -> None:
+        """Schedule every pending tempban and start handling their expiry."""
+        for case in await self.db.case.get_pending_tempbans():
+            if case.case_expires_at is not None:
+                scheduler.schedule("tempban", case.case_id, case.case_expires_at)
 
-        Uses a simple locking mechanism to prevent overlapping executions.
-        Processes bans in smaller batches to prevent timeout issues.
-
-        Raises
-        ------
-        Exception
-            If an error occurs while checking for expired tempbans.
-        """
-        # Skip if already processing
-        if self._processing_tempbans:
-            return
+        scheduler.register("tempban", self.expire_tempban)
 
-        try:
-            self._processing_tempbans = True
+    async def cog_unload(self) -> None:
+        """Stop handling tempban expiry when the cog is unloaded."""
+        scheduler.unregister("tempban")
 
-            # Get expired tempbans
-            expired_cases = await self.db.case.get_expired_tempbans()
-            processed_cases = 0
-            failed_cases = 0
+    async def expire_tempban(self, case_id: int) -> None:
+        """
+        Unban the user of a tempban case once its expiry is reached.
 
-            for case in expired_cases:
-                # Process each case using the helper method
-                processed, failed = await self._process_tempban_case(case)
-                processed_cases += processed
-                failed_cases += failed
+        Called by the scheduler when the case expires. Failed unbans are
+        retried after a delay, as the previous polling loop would have done.
 
-            if processed_cases > 0 or failed_cases > 0:
-                logger.info(f"Tempban check: processed {processed_cases} cases, {failed_cases} failures")
+        Parameters
+        ----------
+        case_id : int
+            The ID of the expired tempban case.
+        """
+        await self.bot.wait_until_ready()
 
-        except Exception as e:
-            logger.error(f"Failed to check tempbans: {e}")
-        finally:
-            self._processing_tempbans = False
+        case = await self.db.case.get_case_by_id(case_id)
+        if case is None or case.case_tempban_expired:
+            return
 
-    @tempban_check.before_loop
-    async def before_tempban_check(self) -> None:
-        """Wait for the bot to be ready before starting the loop."""
-        await self.bot.wait_until_ready()
+        processed, failed = await self._process_tempban_case(case)
 
-    async def cog_unload(self) -> None:
-        """Cancel the tempban check loop when the cog is unloaded."""
-        self.tempban_check.cancel()
+        if failed:
+            scheduler.schedule("tempban", case_id, datetime.now(UTC) + TEMPBAN_RETRY_DELAY)
+        elif processed:
+            logger.info(f"Tempban case {case_id} expired")
 
 
 async def setup(bot: Tux) -> None:
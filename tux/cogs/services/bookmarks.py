@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import io
 
-import aiohttp
 import discord
+import httpx
 from discord.abc import Messageable
 from discord.ext import commands
 from loguru import logger
@@ -19,11 +19,7 @@ class Bookmarks(commands.Cog):
         self.add_bookmark_emojis = CONST.ADD_BOOKMARK
         self.remove_bookmark_emojis = CONST.REMOVE_BOOKMARK
         self.valid_emojis = self.add_bookmark_emojis + self.remove_bookmark_emojis
-        self.session = aiohttp.ClientSession()
-
-    async def cog_unload(self) -> None:
-        """Cleans up the cog, closing the aiohttp session."""
-        await self.session.close()
+        self.http_client = bot.http_clients.get("media")
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
@@ -160,12 +156,11 @@ class Bookmarks(commands.Cog):
 
             if embed.image and embed.image.url:
                 try:
-                    async with self.session.get(embed.image.url) as resp:
-                        if resp.status == 200:
-                            data = await resp.read()
-                            filename = embed.image.url.split("/")[-1].split("?")[0]
-                            files.append(discord.File(io.BytesIO(data), filename=filename))
-                except aiohttp.ClientError as e:
+                    resp = await self.http_client.get(embed.image.url)
+                    if resp.status_code == 200:
+                        filename = embed.image.url.split("/")[-1].split("?")[0]
+                        files.append(discord.File(io.BytesIO(resp.content), filename=filename))
+                except httpx.HTTPError as e:
                     logger.error(f"Failed to fetch embed image {embed.image.url}: {e}")
 
     async def _get_files_from_message(self, message: discord.Message) -> list[discord.File]:
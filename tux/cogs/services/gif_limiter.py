@@ -6,6 +6,7 @@ import discord
 from discord.ext import commands, tasks
 
 from tux.bot import Tux
+from tux.handlers.message import MessageContext, message_processor
 from tux.utils.config import CONFIG
 
 
@@ -106,19 +107,19 @@ class GifLimiter(commands.Cog):
         await message.delete()
         await message.channel.send(f"-# GIF ratelimit exceeded {epilogue}", delete_after=3)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    @message_processor
+    async def gif_message_processor(self, context: MessageContext) -> None:
         """
         Checks for GIFs in every sent message
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        context : MessageContext
+            The message pipeline context.
         """
 
-        if await self._should_process_message(message):
-            await self._handle_gif_message(message)
+        if await self._should_process_message(context.message):
+            await self._handle_gif_message(context.message)
 
     @tasks.loop(seconds=20)
     async def old_gif_remover(self) -> None:
@@ -1,20 +1,27 @@
+import asyncio
 from typing import Any
 
 from discord.ext import commands, tasks
 from influxdb_client.client.influxdb_client import InfluxDBClient
 from influxdb_client.client.write.point import Point
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.client.write_api import WriteOptions
 from loguru import logger
 
 from tux.bot import Tux
 from tux.database.controllers import DatabaseController
 from tux.utils.config import CONFIG
 
+# Points are queued and written from a background thread in batches of this size,
+# or after this many milliseconds, whichever comes first
+INFLUX_BATCH_SIZE = 500
+INFLUX_FLUSH_INTERVAL = 10_000
+
 
 class InfluxLogger(commands.Cog):
     def __init__(self, bot: Tux):
         self.bot = bot
         self.db = DatabaseController()
+        self.influx_client: InfluxDBClient | None = None
         self.influx_write_api: Any | None = None
         self.influx_org: str = ""
 
@@ -36,12 +43,26 @@ class InfluxLogger(commands.Cog):
         self.influx_org: str = CONFIG.INFLUXDB_ORG
 
         if (influx_token != "") and (influx_url != "") and (self.influx_org != ""):
-            write_client = InfluxDBClient(url=influx_url, token=influx_token, org=self.influx_org)
+            self.influx_client = InfluxDBClient(url=influx_url, token=influx_token, org=self.influx_org)
+            # Batching writes never block the event loop; the client flushes them from its own thread
             # Using Any type to avoid complex typing issues with InfluxDB client
-            self.influx_write_api = write_client.write_api(write_options=SYNCHRONOUS)  # type: ignore
+            self.influx_write_api = self.influx_client.write_api(  # type: ignore
+                write_options=WriteOptions(batch_size=INFLUX_BATCH_SIZE, flush_interval=INFLUX_FLUSH_INTERVAL),
+            )
             return True
         return False
 
+    async def cog_unload(self) -> None:
+        """Stop collecting metrics and flush the points that are still queued."""
+        self.logger.cancel()
+
+        if self.influx_write_api:
+            # Closing waits for queued batches to be written, so keep it off the event loop
+            await asyncio.to_thread(self.influx_write_api.close)
+
+        if self.influx_client:
+            self.influx_client.close()
+
     @tasks.loop(seconds=60)
     async def logger(self) -> None:
         """Log statistics to InfluxDB at regular intervals.
@@ -54,37 +75,38 @@ class InfluxLogger(commands.Cog):
 
         influx_bucket = "tux stats"
 
-        # Collect the guild list from the database
+        # Count every table with one grouped query for all guilds
         try:
-            guild_list = await self.db.guild.find_many(where={})
-
-            # Iterate through each guild and collect metrics
-            for guild in guild_list:
-                if not guild.guild_id:
-                    continue
-
-                guild_id = int(guild.guild_id)
-
-                # Collect data by querying controllers
-                starboard_stats = await self.db.starboard_message.find_many(where={"message_guild_id": guild_id})
-
-                snippet_stats = await self.db.snippet.find_many(where={"guild_id": guild_id})
-
-                afk_stats = await self.db.afk.find_many(where={"guild_id": guild_id})
-
-                case_stats = await self.db.case.find_many(where={"guild_id": guild_id})
-
-                # Create data points with type ignores for InfluxDB methods
-                # The InfluxDB client's type hints are incomplete
-                points: list[Point] = [
-                    Point("guild stats").tag("guild", guild_id).field("starboard count", len(starboard_stats)),  # type: ignore
-                    Point("guild stats").tag("guild", guild_id).field("snippet count", len(snippet_stats)),  # type: ignore
-                    Point("guild stats").tag("guild", guild_id).field("afk count", len(afk_stats)),  # type: ignore
-                    Point("guild stats").tag("guild", guild_id).field("case count", len(case_stats)),  # type: ignore
-                ]
-
-                # Write to InfluxDB
-                self.influx_write_api.write(bucket=influx_bucket, org=self.influx_org, record=points)
+            guild_list, starboard_counts, snippet_counts, afk_counts, case_counts = await asyncio.gather(
+                self.db.guild.find_many(where={}),
+                self.db.starboard_message.count_by("message_guild_id"),
+                self.db.snippet.count_by("guild_id"),
+                self.db.afk.count_by("guild_id"),
+                self.db.case.count_by("guild_id"),
+            )
+
+            # group_by returns the query engine's raw JSON, which encodes BigInt values as strings
+            metrics = {
+                field: {int(guild_id): count for guild_id, count in counts.items()}
+                for field, counts in (
+                    ("starboard count", starboard_counts),
+                    ("snippet count", snippet_counts),
+                    ("afk count", afk_counts),
+                    ("case count", case_counts),
+                )
+            }
+
+            # Create data points with type ignores for InfluxDB methods
+            # The InfluxDB client's type hints are incomplete
+            points: list[Point] = [
+                Point("guild stats").tag("guild", int(guild.guild_id)).field(field, counts.get(int(guild.guild_id), 0))  # type: ignore
+                for guild in guild_list
+                if guild.guild_id
+                for field, counts in metrics.items()
+            ]
+
+            # Queue the points; the batching writer sends them in the background
+            self.influx_write_api.write(bucket=influx_bucket, org=self.influx_org, record=points)
 
         except Exception as e:
             logger.error(f"Error collecting metrics for InfluxDB: {e}")
@@ -2,12 +2,12 @@ import datetime
 import time
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from loguru import logger
 
-from tux.app import get_prefix
 from tux.bot import Tux
 from tux.database.controllers import DatabaseController
+from tux.handlers.message import MessageContext, message_processor
 from tux.ui.embeds import EmbedCreator
 from tux.utils.config import CONFIG
 
@@ -23,28 +23,41 @@ class LevelsService(commands.Cog):
         self.max_level = max(item["level"] for item in CONFIG.XP_ROLES)
         self.enable_xp_cap = CONFIG.ENABLE_XP_CAP
 
-    @commands.Cog.listener("on_message")
-    async def xp_listener(self, message: discord.Message) -> None:
+    async def cog_load(self) -> None:
+        """Start flushing buffered XP once the cog is registered with the bot."""
+        self.flush_xp.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the flush loop and persist any XP still buffered in memory."""
+        self.flush_xp.cancel()
+        await self.db.levels.flush_dirty_levels()
+
+    @tasks.loop(seconds=15)
+    async def flush_xp(self) -> None:
+        """Persist buffered XP gains in a single batched write."""
+        try:
+            if flushed := await self.db.levels.flush_dirty_levels():
+                logger.debug(f"Flushed {flushed} buffered levels rows")
+        except Exception as e:
+            logger.error(f"Failed to flush buffered XP: {e}")
+
+    @message_processor
+    async def xp_listener(self, context: MessageContext) -> None:
         """
-        Listens for messages to process XP gain.
+        Processes XP gain for messages.
 
         Parameters
         ----------
-        message : discord.Message
-            The message object.
+        context : MessageContext
+            The message pipeline context.
         """
-        if message.author.bot or message.guild is None or message.channel.id in CONFIG.XP_BLACKLIST_CHANNELS:
-            return
-
-        prefixes = await get_prefix(self.bot, message)
-        if any(message.content.startswith(prefix) for prefix in prefixes):
+        if context.is_bot or context.is_command or context.message.channel.id in CONFIG.XP_BLACKLIST_CHANNELS:
             return
 
-        member = message.guild.get_member(message.author.id)
-        if member is None:
+        if context.member is None:
             return
 
-        await self.process_xp_gain(member, message.guild)
+        await self.process_xp_gain(context.member, context.member.guild)
 
     async def process_xp_gain(self, member: discord.Member, guild: discord.Guild) -> None:
         """
@@ -57,24 +70,22 @@ class LevelsService(commands.Cog):
         guild : discord.Guild
             The guild where the member is gaining XP.
         """
-        # Get blacklist status
-        is_blacklisted = await self.db.levels.is_blacklisted(member.id, guild.id)
-        if is_blacklisted:
+        # Served from memory once the member is cached; changes are flushed by flush_xp
+        state = await self.db.levels.get_member_record(member.id, guild.id)
+        if state.blacklisted:
             return
 
-        last_message_time = await self.db.levels.get_last_message_time(member.id, guild.id)
-        if last_message_time and self.is_on_cooldown(last_message_time):
+        if state.last_message and self.is_on_cooldown(state.last_message):
             return
 
-        current_xp, current_level = await self.db.levels.get_xp_and_level(member.id, guild.id)
+        current_level = state.level
 
         xp_increment = self.calculate_xp_increment(member)
-        new_xp = current_xp + xp_increment
+        new_xp = state.xp + xp_increment
         new_level = self.calculate_level(new_xp)
 
-        await self.db.levels.update_xp_and_level(
-            member.id,
-            guild.id,
+        self.db.levels.stage_xp_and_level(
+            state,
             new_xp,
             new_level,
             datetime.datetime.fromtimestamp(time.time(), tz=datetime.UTC),
@@ -1,4 +1,6 @@
+import asyncio
 import contextlib
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 
 import discord
@@ -11,6 +13,11 @@ from tux.ui.embeds import EmbedCreator, EmbedType
 from tux.utils import checks
 from tux.utils.functions import generate_usage
 
+# Reaction events on a message within this window are merged into a single recount
+STARBOARD_COALESCE_DELAY = 2.0
+# Number of messages whose starboard reactors are tracked in memory
+STARBOARD_REACTOR_CACHE_SIZE = 1000
+
 
 class Starboard(commands.Cog):
     def __init__(self, bot: Tux) -> None:
@@ -19,6 +26,17 @@ class Starboard(commands.Cog):
         self.starboard.usage = generate_usage(self.starboard)
         self.setup_starboard.usage = generate_usage(self.setup_starboard)
         self.remove_starboard.usage = generate_usage(self.remove_starboard)
+        # Message ID -> task recounting it, and messages that changed mid-recount
+        self._pending_updates: dict[int, asyncio.Task[None]] = {}
+        self._dirty_messages: set[int] = set()
+        # Message ID -> users that reacted with the starboard emoji, kept up to date from raw
+        # reaction events, and events received while a message's reactors are being fetched
+        self._reactors: OrderedDict[int, set[int]] = OrderedDict()
+        self._reconciling: dict[int, list[tuple[int, bool]]] = {}
+
+    async def cog_unload(self) -> None:
+        for task in list(self._pending_updates.values()):
+            task.cancel()
 
     @commands.Cog.listener("on_raw_reaction_add")
     async def starboard_on_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
@@ -181,46 +199,6 @@ class Starboard(commands.Cog):
             logger.error(f"Error removing starboard configuration: {e}")
             await ctx.send(f"An error occurred while removing the starboard configuration: {e}")
 
-    async def get_existing_starboard_message(
-        self,
-        starboard_channel: discord.TextChannel,
-        original_message: discord.Message,
-    ) -> discord.Message | None:
-        """
-        Get the existing starboard message for a given original message.
-
-        Parameters
-        ----------
-        starboard_channel : discord.TextChannel
-            The starboard channel.
-        original_message : discord.Message`
-            The original message.
-
-        Returns
-        -------
-        discord.Message | None
-            The existing starboard message or None if it does not exist.
-        """
-
-        assert original_message.guild
-
-        try:
-            starboard_message = await self.db.starboard_message.get_starboard_message_by_id(
-                original_message.id,
-                original_message.guild.id,
-            )
-
-            return (
-                await starboard_channel.fetch_message(starboard_message.starboard_message_id)
-                if starboard_message
-                else None
-            )
-
-        except Exception as e:
-            logger.error(f"Error while fetching starboard message: {e}")
-
-        return None
-
     async def create_or_update_starboard_message(
         self,
         starboard_channel: discord.TextChannel,
@@ -230,6 +208,9 @@ class Starboard(commands.Cog):
         """
         Create or update a starboard message.
 
+        The starboard message is only edited when the star count changed since
+        it was last written.
+
         Parameters
         ----------
         starboard_channel : discord.TextChannel
@@ -249,6 +230,13 @@ class Starboard(commands.Cog):
             if not starboard:
                 return
 
+            existing = await self.db.starboard_message.get_starboard_message_by_id(
+                original_message.id,
+                original_message.guild.id,
+            )
+            if existing and existing.star_count == reaction_count:
+                return
+
             embed = EmbedCreator.create_embed(
                 embed_type=EmbedType.INFO,
                 description=original_message.content,
@@ -261,16 +249,16 @@ class Starboard(commands.Cog):
             )
             embed.add_field(name="Source", value=f"[Jump to message]({original_message.jump_url})")
 
-            starboard_message = await self.get_existing_starboard_message(starboard_channel, original_message)
+            starboard_message: discord.Message | None = None
 
-            if starboard_message:
-                if starboard_message.embeds:
-                    existing_embed = starboard_message.embeds[0]
-                    if existing_embed.footer != embed.footer:
-                        await starboard_message.edit(embed=embed)
-                    else:
-                        return
-            else:
+            if existing:
+                # Edit through a partial message to avoid fetching the starboard message first
+                with contextlib.suppress(discord.NotFound):
+                    starboard_message = await starboard_channel.get_partial_message(
+                        existing.starboard_message_id,
+                    ).edit(embed=embed)
+
+            if starboard_message is None:
                 starboard_message = await starboard_channel.send(embed=embed)
 
             await self.db.starboard_message.create_or_update_starboard_message(
@@ -287,30 +275,219 @@ class Starboard(commands.Cog):
         except Exception as e:
             logger.error(f"Error while creating or updating starboard message: {e}")
 
-    async def handle_starboard_reaction(self, payload: discord.RawReactionActionEvent) -> None:
-        """Handle starboard reaction add or remove"""
-        if not payload.guild_id:
+    async def remove_starboard_message(
+        self,
+        starboard_channel: discord.TextChannel,
+        original_message: discord.Message,
+    ) -> None:
+        """
+        Remove the starboard message for a message that fell below the threshold.
+
+        Parameters
+        ----------
+        starboard_channel : discord.TextChannel
+            The starboard channel.
+        original_message : discord.Message
+            The original message.
+        """
+
+        assert original_message.guild
+
+        existing = await self.db.starboard_message.get_starboard_message_by_id(
+            original_message.id,
+            original_message.guild.id,
+        )
+        if not existing:
+            return
+
+        with contextlib.suppress(discord.NotFound):
+            await starboard_channel.get_partial_message(existing.starboard_message_id).delete()
+
+        await self.db.starboard_message.delete_starboard_message(original_message.id, original_message.guild.id)
+
+    async def is_starboard_reaction(self, guild_id: int | None, emoji: discord.PartialEmoji | None = None) -> bool:
+        """
+        Check whether a reaction event concerns the starboard of its guild.
+
+        Parameters
+        ----------
+        guild_id : int | None
+            The ID of the guild the event happened in.
+        emoji : discord.PartialEmoji | None
+            The emoji of the event, or None if all reactions were cleared.
+
+        Returns
+        -------
+        bool
+            True if the guild has a starboard and the emoji matches it.
+        """
+        if not guild_id:
+            return False
+
+        starboard = await self.db.starboard.get_starboard_by_guild_id(guild_id)
+        return starboard is not None and (emoji is None or str(emoji) == starboard.starboard_emoji)
+
+    def queue_starboard_update(self, guild_id: int, channel_id: int, message_id: int) -> None:
+        """
+        Queue a recount of a message after a reaction event.
+
+        Events for a message that already has a recount queued are merged into
+        it, so a burst of reactions results in a single fetch and at most one
+        starboard edit.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild the reaction happened in.
+        channel_id : int
+            The ID of the channel of the reacted message.
+        message_id : int
+            The ID of the reacted message.
+        """
+        if message_id in self._pending_updates:
+            self._dirty_messages.add(message_id)
             return
 
-        starboard = await self.db.starboard.get_starboard_by_guild_id(payload.guild_id)
-        if not starboard or str(payload.emoji) != starboard.starboard_emoji:
+        self._pending_updates[message_id] = asyncio.create_task(
+            self._run_starboard_updates(guild_id, channel_id, message_id),
+            name=f"starboard-update:{message_id}",
+        )
+
+    def _store_reactors(self, message_id: int, reactors: set[int]) -> None:
+        self._reactors[message_id] = reactors
+        self._reactors.move_to_end(message_id)
+
+        if len(self._reactors) > STARBOARD_REACTOR_CACHE_SIZE:
+            self._reactors.popitem(last=False)
+
+    def track_reaction(self, message_id: int, user_id: int, added: bool) -> None:
+        """
+        Apply a starboard reaction add or remove to the tracked reactors of a message.
+
+        Messages whose reactors are unknown are left alone; they are fetched
+        once when the message is next recounted.
+
+        Parameters
+        ----------
+        message_id : int
+            The ID of the reacted message.
+        user_id : int
+            The ID of the user who reacted.
+        added : bool
+            Whether the reaction was added or removed.
+        """
+        if (events := self._reconciling.get(message_id)) is not None:
+            events.append((user_id, added))
+            return
+
+        if (reactors := self._reactors.get(message_id)) is None:
+            return
+
+        if added:
+            reactors.add(user_id)
+        else:
+            reactors.discard(user_id)
+
+    def clear_reactors(self, message_id: int) -> None:
+        """Mark a message as having no starboard reactors after its reactions were cleared."""
+        # Any fetch in progress started before the clear, so its result is discarded
+        self._reconciling.pop(message_id, None)
+        self._store_reactors(message_id, set())
+
+    async def get_reactors(self, message: discord.Message, reaction: discord.Reaction | None) -> set[int]:
+        """
+        Get the users that reacted to a message with the starboard emoji.
+
+        Tracked reactors are returned as is. Otherwise, for example after a
+        restart, the reactors are fetched once and tracked from then on.
+
+        Parameters
+        ----------
+        message : discord.Message
+            The message to get the reactors of.
+        reaction : discord.Reaction | None
+            The starboard reaction of the message, if it has one.
+
+        Returns
+        -------
+        set[int]
+            The IDs of the users that reacted with the starboard emoji.
+        """
+        if (reactors := self._reactors.get(message.id)) is not None:
+            self._reactors.move_to_end(message.id)
+            return reactors
+
+        if reaction is None:
+            self._store_reactors(message.id, set())
+            return set()
+
+        events: list[tuple[int, bool]] = []
+        self._reconciling[message.id] = events
+
+        try:
+            reactors = {user.id async for user in reaction.users()}
+        finally:
+            reconciled = self._reconciling.get(message.id) is events
+            if reconciled:
+                del self._reconciling[message.id]
+
+        if not reconciled:
+            return self._reactors.get(message.id, set())
+
+        # Replay events received while paginating; adds and removes are idempotent
+        for user_id, added in events:
+            if added:
+                reactors.add(user_id)
+            else:
+                reactors.discard(user_id)
+
+        self._store_reactors(message.id, reactors)
+        return reactors
+
+    async def _run_starboard_updates(self, guild_id: int, channel_id: int, message_id: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(STARBOARD_COALESCE_DELAY)
+
+                # Events received from here on need another recount after this one
+                self._dirty_messages.discard(message_id)
+                await self.update_starboard(guild_id, channel_id, message_id)
+
+                if message_id not in self._dirty_messages:
+                    return
+        finally:
+            self._pending_updates.pop(message_id, None)
+
+    async def update_starboard(self, guild_id: int, channel_id: int, message_id: int) -> None:
+        """
+        Recount the starboard reactions of a message and update its starboard message.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild of the message.
+        channel_id : int
+            The ID of the channel of the message.
+        message_id : int
+            The ID of the message.
+        """
+        starboard = await self.db.starboard.get_starboard_by_guild_id(guild_id)
+        if not starboard:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
+        channel = self.bot.get_channel(channel_id)
         if not isinstance(channel, discord.TextChannel):
             return
 
         try:
-            message = await channel.fetch_message(payload.message_id)
+            message = await channel.fetch_message(message_id)
             reaction = discord.utils.get(message.reactions, emoji=starboard.starboard_emoji)
             reaction_count = reaction.count if reaction else 0
 
-            if reaction:
-                async for user in reaction.users():
-                    if user.id == message.author.id:
-                        reaction_count -= 1
-                        with contextlib.suppress(Exception):
-                            await message.remove_reaction(starboard.starboard_emoji, message.author)
+            if message.author.id in await self.get_reactors(message, reaction):
+                reaction_count -= 1
+                with contextlib.suppress(Exception):
+                    await message.remove_reaction(starboard.starboard_emoji, message.author)
 
             starboard_channel = channel.guild.get_channel(starboard.starboard_channel_id)
             if not isinstance(starboard_channel, discord.TextChannel):
@@ -320,12 +497,18 @@ class Starboard(commands.Cog):
                 await self.create_or_update_starboard_message(starboard_channel, message, reaction_count)
 
             else:
-                existing_starboard_message = await self.get_existing_starboard_message(starboard_channel, message)
-                if existing_starboard_message:
-                    await existing_starboard_message.delete()
+                await self.remove_starboard_message(starboard_channel, message)
 
         except Exception as e:
-            logger.error(f"Unexpected error in handle_starboard_reaction: {e}")
+            logger.error(f"Unexpected error in update_starboard: {e}")
+
+    async def handle_starboard_reaction(self, payload: discord.RawReactionActionEvent) -> None:
+        """Handle starboard reaction add or remove"""
+        if not payload.guild_id or not await self.is_starboard_reaction(payload.guild_id, payload.emoji):
+            return
+
+        self.track_reaction(payload.message_id, payload.user_id, added=payload.event_type == "REACTION_ADD")
+        self.queue_starboard_update(payload.guild_id, payload.channel_id, payload.message_id)
 
     async def handle_reaction_clear(
         self,
@@ -342,30 +525,11 @@ class Starboard(commands.Cog):
         emoji : discord.PartialEmoji | None
             The emoji to handle the reaction clear for.
         """
-        if not payload.guild_id:
+        if not payload.guild_id or not await self.is_starboard_reaction(payload.guild_id, emoji):
             return
 
-        try:
-            channel = self.bot.get_channel(payload.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                return
-
-            message = await channel.fetch_message(payload.message_id)
-            starboard = await self.db.starboard.get_starboard_by_guild_id(payload.guild_id)
-
-            if not starboard or (emoji and str(emoji) != starboard.starboard_emoji):
-                return
-
-            starboard_channel = channel.guild.get_channel(starboard.starboard_channel_id)
-            if not isinstance(starboard_channel, discord.TextChannel):
-                return
-
-            starboard_message = await self.get_existing_starboard_message(starboard_channel, message)
-            if starboard_message:
-                await starboard_message.delete()
-
-        except Exception as e:
-            logger.error(f"Error in handle_reaction_clear: {e}")
+        self.clear_reactors(payload.message_id)
+        self.queue_starboard_update(payload.guild_id, payload.channel_id, payload.message_id)
 
 
 async def setup(bot: Tux) -> None:
@@ -188,7 +188,10 @@ class SnippetsBaseCog(commands.Cog):
         assert ctx.guild
         snippet = await self.db.snippet.get_snippet_by_name_and_guild_id(name, ctx.guild.id)
         if snippet is None:
-            await self.send_snippet_error(ctx, description="Snippet not found.")
+            description = "Snippet not found."
+            if suggestions := await self.db.snippet.suggest_snippet_names(name, ctx.guild.id):
+                description += f" Did you mean: {', '.join(f'`{suggestion}`' for suggestion in suggestions)}?"
+            await self.send_snippet_error(ctx, description=description)
             return None
         return snippet
 
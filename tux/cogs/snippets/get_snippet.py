@@ -1,5 +1,6 @@
 from discord import AllowedMentions, Message
-from discord.ext import commands
+from discord.ext import commands, tasks
+from loguru import logger
 from reactionmenu import ViewButton, ViewMenu
 
 from tux.bot import Tux
@@ -14,6 +15,24 @@ class Snippet(SnippetsBaseCog):
         super().__init__(bot)
         self.snippet.usage = generate_usage(self.snippet)
 
+    async def cog_load(self) -> None:
+        """Start flushing buffered snippet uses once the cog is registered with the bot."""
+        self.flush_uses.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the flush loop and persist any uses still buffered in memory."""
+        self.flush_uses.cancel()
+        await self.db.snippet.flush_snippet_uses()
+
+    @tasks.loop(seconds=30)
+    async def flush_uses(self) -> None:
+        """Persist buffered snippet uses in a single batched write."""
+        try:
+            if flushed := await self.db.snippet.flush_snippet_uses():
+                logger.debug(f"Flushed uses of {flushed} snippets")
+        except Exception as e:
+            logger.error(f"Failed to flush snippet uses: {e}")
+
     @commands.command(
         name="snippet",
         aliases=["s"],
@@ -39,8 +58,8 @@ class Snippet(SnippetsBaseCog):
         if not snippet:
             return
 
-        # Increment uses before potentially resolving alias
-        await self.db.snippet.increment_snippet_uses(snippet.snippet_id)
+        # Count the use before potentially resolving alias; it is persisted in the next batch
+        self.db.snippet.record_snippet_use(snippet)
 
         # Handle aliases
         if snippet.alias:
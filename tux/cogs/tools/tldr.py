@@ -10,7 +10,7 @@ from tux.ui.embeds import EmbedCreator
 from tux.ui.views.tldr import TldrPaginatorView
 from tux.utils.flags import TldrFlags
 from tux.utils.functions import generate_usage
-from tux.wrappers.tldr import SUPPORTED_PLATFORMS, TldrClient
+from tux.wrappers.tldr import SUPPORTED_PLATFORMS, TldrClient, page_store
 
 
 class Tldr(commands.Cog):
@@ -43,7 +43,7 @@ class Tldr(commands.Cog):
             if TldrClient.cache_needs_update(lang_code):
                 logger.info(f"TLDR Cog: Cache for '{lang_code}' is older than 168 hours, updating...")
                 try:
-                    result_msg = await self.bot.loop.run_in_executor(None, TldrClient.update_tldr_cache, lang_code)
+                    result_msg = await TldrClient.update_tldr_cache(lang_code)
                     if "Failed" in result_msg:
                         logger.error(f"TLDR Cog: Cache update for '{lang_code}' - {result_msg}")
                     else:
@@ -53,6 +53,8 @@ class Tldr(commands.Cog):
             else:
                 logger.debug(f"TLDR Cog: Cache for '{lang_code}' is recent, skipping update.")
 
+            await page_store.ensure_loaded(lang_code)
+
         self._cache_checked = True
         logger.debug("TLDR Cog: Cache check completed.")
 
@@ -76,20 +78,14 @@ class Tldr(commands.Cog):
         final_language = language_value or self.default_language
         final_platform_for_list = platform_value or TldrClient.detect_platform()
 
-        commands_to_show = TldrClient.list_tldr_commands(
+        await page_store.ensure_loaded(final_language)
+        commands_to_show = TldrClient.search_tldr_commands(
+            current,
             language=final_language,
             platform_filter=final_platform_for_list,
         )
 
-        # Filter commands based on current input
-        if not current:
-            filtered_commands = [app_commands.Choice(name=cmd, value=cmd) for cmd in commands_to_show]
-        else:
-            filtered_commands = [
-                app_commands.Choice(name=cmd, value=cmd) for cmd in commands_to_show if current.lower() in cmd.lower()
-            ]
-
-        return filtered_commands[:25]
+        return [app_commands.Choice(name=cmd, value=cmd) for cmd in commands_to_show]
 
     async def platform_autocomplete(
         self,
@@ -206,7 +202,7 @@ class Tldr(commands.Cog):
         chosen_language = language or self.default_language
         languages_to_try = TldrClient.get_language_priority(chosen_language)
 
-        if result := TldrClient.fetch_tldr_page(command_norm, languages_to_try, platform):
+        if result := await TldrClient.fetch_tldr_page(command_norm, languages_to_try, platform):
             page_content, found_platform = result
             description = TldrClient.format_tldr_for_discord(page_content, show_short, show_long, show_both)
             embed_title = f"TLDR for {command_norm} ({found_platform}/{chosen_language})"
@@ -259,7 +255,7 @@ class Tldr(commands.Cog):
         chosen_language = language or self.default_language
         languages_to_try = TldrClient.get_language_priority(chosen_language)
 
-        if result := TldrClient.fetch_tldr_page(command_norm, languages_to_try, platform):
+        if result := await TldrClient.fetch_tldr_page(command_norm, languages_to_try, platform):
             page_content, found_platform = result
             description = TldrClient.format_tldr_for_discord(page_content, show_short, show_long, show_both)
             embed_title = f"TLDR for {command_norm} ({found_platform}/{chosen_language})"
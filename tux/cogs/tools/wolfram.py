@@ -2,7 +2,6 @@ import asyncio
 import io
 from urllib.parse import quote_plus
 
-import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -57,11 +56,10 @@ class Wolfram(commands.Cog):
         url = f"https://api.wolframalpha.com/v1/simple?appid={CONFIG.WOLFRAM_APP_ID}&i={encoded}"
 
         try:
-            # Perform async HTTP GET with a 10-second timeout
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession() as session, session.get(url, timeout=timeout) as resp:
-                resp.raise_for_status()
-                img_data = await resp.read()
+            # Perform async HTTP GET through the pooled client, which has a 10-second timeout
+            resp = await self.bot.http_clients.get("wolfram").get(url)
+            resp.raise_for_status()
+            img_data = resp.content
         except Exception:
             # On error, notify user via an error embed
             embed = EmbedCreator.create_embed(
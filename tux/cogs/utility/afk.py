@@ -5,13 +5,15 @@ from typing import cast
 from zoneinfo import ZoneInfo
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from prisma.models import AFKModel
 from tux.bot import Tux
 from tux.cogs.utility import add_afk, del_afk
 from tux.database.controllers import DatabaseController
+from tux.handlers.message import MessageContext, message_processor
 from tux.utils.functions import generate_usage
+from tux.utils.scheduler import scheduler
 
 # TODO: add `afk until` command, or add support for providing a timeframe in the regular `afk` and `permafk` commands
 
@@ -20,7 +22,6 @@ class Afk(commands.Cog):
     def __init__(self, bot: Tux) -> None:
         self.bot = bot
         self.db = DatabaseController()
-        self.handle_afk_expiration.start()
         self.afk.usage = generate_usage(self.afk)
         self.permafk.usage = generate_usage(self.permafk)
 
@@ -103,20 +104,20 @@ class Afk(commands.Cog):
             ephemeral=True,
         )
 
-    @commands.Cog.listener("on_message")
-    async def remove_afk(self, message: discord.Message) -> None:
+    @message_processor
+    async def remove_afk(self, context: MessageContext) -> None:
         """
         Remove the AFK status of a member when they send a message.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        context : MessageContext
+            The message pipeline context.
         """
-        if not message.guild or message.author.bot:
-            return
+        message = context.message
 
-        assert isinstance(message.author, discord.Member)
+        if not message.guild or context.is_bot or context.member is None:
+            return
 
         entry = await self.db.afk.get_afk_member(message.author.id, guild_id=message.guild.id)
 
@@ -126,7 +127,7 @@ class Afk(commands.Cog):
         if entry.since + timedelta(seconds=10) > datetime.now(ZoneInfo("UTC")):
             return
 
-        if await self.db.afk.is_perm_afk(message.author.id, guild_id=message.guild.id):
+        if entry.perm_afk:
             return
 
         await self.db.afk.remove_afk(message.author.id)
@@ -135,23 +136,24 @@ class Afk(commands.Cog):
 
         # Suppress Forbidden errors if the bot doesn't have permission to change the nickname
         with contextlib.suppress(discord.Forbidden):
-            await message.author.edit(nick=entry.nickname)
+            await context.member.edit(nick=entry.nickname)
 
-    @commands.Cog.listener("on_message")
-    async def check_afk(self, message: discord.Message) -> None:
+    @message_processor
+    async def check_afk(self, context: MessageContext) -> None:
         """
         Check if a message mentions an AFK member.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        context : MessageContext
+            The message pipeline context.
         """
+        message = context.message
 
         if not message.guild:
             return
 
-        if message.author.bot:
+        if context.is_bot:
             return
 
         # Check if the message is a self-timeout command.
@@ -183,42 +185,42 @@ class Afk(commands.Cog):
             ),
         )
 
-    @tasks.loop(seconds=120)
-    async def handle_afk_expiration(self):
-        """
-        Check AFK database at a regular interval,
-        Remove AFK from users with an entry that has expired.
-        """
-        for guild in self.bot.guilds:
-            expired_entries = await self._get_expired_afk_entries(guild.id)
+    async def cog_load(self) -> None:
+        for entry in await self.db.afk.get_expiring_afk_members():
+            if entry.until is not None:
+                scheduler.schedule("afk", entry.member_id, entry.until)
 
-            for entry in expired_entries:
-                member = guild.get_member(entry.member_id)
+        scheduler.register("afk", self.handle_afk_expiration)
 
-                if member is None:
-                    # Handles the edge case of a user leaving the guild while still temp-AFK
-                    await self.db.afk.remove_afk(entry.member_id)
-                else:
-                    await del_afk(self.db, member, entry.nickname)
+    async def cog_unload(self) -> None:
+        scheduler.unregister("afk")
 
-    async def _get_expired_afk_entries(self, guild_id: int) -> list[AFKModel]:
+    async def handle_afk_expiration(self, member_id: int) -> None:
         """
-        Get all expired AFK entries for a guild.
+        Remove AFK from a member once their entry expires.
+
+        Called by the scheduler at the entry's expiry time. The entry is
+        re-read first so removed or extended AFK statuses are left alone.
 
         Parameters
         ----------
-        guild_id : int
-            The ID of the guild to check.
-
-        Returns
-        -------
-        list[AFKModel]
-            A list of expired AFK entries.
+        member_id : int
+            The ID of the member whose AFK entry expired.
         """
-        entries = await self.db.afk.get_all_afk_members(guild_id)
-        current_time = datetime.now(UTC)
+        await self.bot.wait_until_ready()
+
+        entry = await self.db.afk.get_afk_by_member_id(member_id)
+        if entry is None or entry.until is None or entry.until > datetime.now(UTC):
+            return
+
+        guild = self.bot.get_guild(entry.guild_id)
+        member = guild.get_member(entry.member_id) if guild is not None else None
 
-        return [entry for entry in entries if entry.until is not None and entry.until < current_time]
+        if member is None:
+            # Handles the edge case of a user leaving the guild while still temp-AFK
+            await self.db.afk.remove_afk(entry.member_id)
+        else:
+            await del_afk(self.db, member, entry.nickname)
 
 
 async def setup(bot: Tux) -> None:
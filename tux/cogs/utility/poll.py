@@ -8,6 +8,7 @@ from loguru import logger
 from prisma.enums import CaseType
 from tux.bot import Tux
 from tux.database.controllers import DatabaseController
+from tux.handlers.message import MessageContext, message_processor
 from tux.ui.embeds import EmbedCreator
 
 # TODO: Create option inputs for the poll command instead of using a comma separated string
@@ -35,17 +36,16 @@ class Poll(commands.Cog):
         bool
             True if the user is poll banned, False otherwise.
         """
-        latest_case = await self.db.case.get_latest_case_by_user(
+        return await self.db.case.is_user_under_restriction(
             guild_id=guild_id,
             user_id=user_id,
-            case_types=[CaseType.POLLBAN, CaseType.POLLUNBAN],
+            active_restriction_type=CaseType.POLLBAN,
+            inactive_restriction_type=CaseType.POLLUNBAN,
         )
 
-        # If no relevant cases exist, the user is not poll banned.
-        return latest_case.case_type == CaseType.POLLBAN if latest_case else False
-
-    @commands.Cog.listener()  # listen for messages
-    async def on_message(self, message: discord.Message) -> None:
+    @message_processor
+    async def poll_message_processor(self, context: MessageContext) -> None:
+        message = context.message
         poll_channel = self.bot.get_channel(1228717294788673656)
 
         if message.channel != poll_channel:
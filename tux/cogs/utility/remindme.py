@@ -2,7 +2,7 @@ import contextlib
 import datetime
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from loguru import logger
 
 from prisma.models import Reminder
@@ -10,27 +10,53 @@ from tux.bot import Tux
 from tux.database.controllers import DatabaseController
 from tux.ui.embeds import EmbedCreator
 from tux.utils.functions import convert_to_seconds, generate_usage
+from tux.utils.scheduler import scheduler
+
+REMINDER_RETRY_DELAY = datetime.timedelta(minutes=1)
 
 
 class RemindMe(commands.Cog):
     def __init__(self, bot: Tux) -> None:
         self.bot = bot
         self.db = DatabaseController()
-        self.check_reminders.start()
         self.remindme.usage = generate_usage(self.remindme)
 
-    @tasks.loop(seconds=120)
-    async def check_reminders(self):
-        reminders = await self.db.reminder.get_unsent_reminders()
+    async def cog_load(self) -> None:
+        for reminder in await self.db.reminder.get_pending_reminders():
+            scheduler.schedule("reminder", reminder.reminder_id, reminder.reminder_expires_at)
+
+        scheduler.register("reminder", self.handle_reminder)
+
+    async def cog_unload(self) -> None:
+        scheduler.unregister("reminder")
+
+    async def handle_reminder(self, reminder_id: int) -> None:
+        """
+        Send a reminder once it expires.
+
+        Called by the scheduler at the reminder's expiry time. The reminder is
+        re-read first so deleted or already sent reminders are skipped, and a
+        reminder that fails to send is retried after a delay.
+
+        Parameters
+        ----------
+        reminder_id : int
+            The ID of the expired reminder.
+        """
+        await self.bot.wait_until_ready()
 
         try:
-            for reminder in reminders:
-                await self.send_reminder(reminder)
-                await self.db.reminder.update_reminder_status(reminder.reminder_id, sent=True)
-                logger.debug(f'Status of reminder {reminder.reminder_id} updated to "sent".')
+            reminder = await self.db.reminder.get_reminder_by_id(reminder_id)
+            if reminder is None or reminder.reminder_sent:
+                return
+
+            await self.send_reminder(reminder)
+            await self.db.reminder.update_reminder_status(reminder.reminder_id, sent=True)
+            logger.debug(f'Status of reminder {reminder.reminder_id} updated to "sent".')
 
         except Exception as e:
-            logger.error(f"Error sending reminders: {e}")
+            logger.error(f"Failed to handle reminder {reminder_id}, retrying in {REMINDER_RETRY_DELAY}: {e}")
+            scheduler.schedule("reminder", reminder_id, datetime.datetime.now(datetime.UTC) + REMINDER_RETRY_DELAY)
 
     async def send_reminder(self, reminder: Reminder) -> None:
         user = self.bot.get_user(reminder.reminder_user_id)
@@ -69,10 +95,6 @@ class RemindMe(commands.Cog):
                 f"Failed to send reminder {reminder.reminder_id}, user with ID {reminder.reminder_user_id} not found.",
             )
 
-    @check_reminders.before_loop
-    async def before_check_reminders(self):
-        await self.bot.wait_until_ready()
-
     @commands.hybrid_command(
         name="remindme",
         description="Set a reminder for yourself",
@@ -139,8 +161,7 @@ class RemindMe(commands.Cog):
 
             embed.add_field(
                 name="Note",
-                value="- If you have DMs closed, we will attempt to send it in this channel instead.\n"
-                "- The reminder may be delayed by up to 120 seconds due to the way Tux works.",
+                value="- If you have DMs closed, we will attempt to send it in this channel instead.",
             )
 
         except Exception as e:
@@ -6,6 +6,7 @@ like Godbolt and Wandbox, with support for multiple programming languages
 and proper error handling through custom exceptions.
 """
 
+import hashlib
 import re
 from abc import ABC, abstractmethod
 from contextlib import suppress
@@ -15,6 +16,7 @@ from discord.ext import commands
 
 from tux.bot import Tux
 from tux.ui.embeds import EmbedCreator
+from tux.utils.cache import TTLCache
 from tux.utils.exceptions import (
     CompilationError,
     InvalidCodeFormatError,
@@ -29,6 +31,10 @@ ANSI_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 BACKTICKS_PATTERN = re.compile(r"```")
 LOADING_REACTION = "<a:BreakdancePengu:1378346831250985061>"
 
+# Successful outputs are reused for identical runs within this many seconds
+RUN_CACHE_TTL = 600.0
+RUN_CACHE_SIZE = 256
+
 # Compiler mappings
 GODBOLT_COMPILERS = {
     "hs": "ghc984",
@@ -148,6 +154,44 @@ def _remove_backticks(text: str) -> str:
     return BACKTICKS_PATTERN.sub("", text)
 
 
+class RunResultCache(TTLCache[tuple[str, str, str, str], str]):
+    """
+    LRU cache of execution outputs with a time-to-live.
+
+    Entries are keyed by service, compiler, options and a hash of the code, so
+    identical runs are answered without contacting the remote service again.
+    """
+
+    def __init__(self, ttl: float = RUN_CACHE_TTL, maxsize: int = RUN_CACHE_SIZE) -> None:
+        super().__init__(ttl, maxsize)
+
+    @staticmethod
+    def make_key(service: str, compiler: str, options: str | None, code: str) -> tuple[str, str, str, str]:
+        """
+        Build the cache key of a run.
+
+        Parameters
+        ----------
+        service : str
+            The name of the execution service.
+        compiler : str
+            The compiler identifier.
+        options : str | None
+            Additional compiler options.
+        code : str
+            The source code, stored only as a SHA-256 digest.
+
+        Returns
+        -------
+        tuple[str, str, str, str]
+            The cache key.
+        """
+        return service, compiler, options or "", hashlib.sha256(code.encode()).hexdigest()
+
+
+run_result_cache = RunResultCache()
+
+
 class CodeDispatch(ABC):
     """Abstract base class for code execution services."""
 
@@ -183,7 +227,16 @@ class CodeDispatch(ABC):
         compiler = self.compiler_map.get(language)
         if compiler is None:
             return None
-        return await self._execute(compiler, code, options)
+
+        key = run_result_cache.make_key(type(self).__name__, compiler, options, code)
+        if (output := run_result_cache.get(key)) is not None:
+            return output
+
+        # Failed runs are not cached so they can be retried right away
+        if (output := await self._execute(compiler, code, options)) is not None:
+            run_result_cache.set(key, output)
+
+        return output
 
     @abstractmethod
     async def _execute(self, compiler: str, code: str, options: str | None) -> str | None:
@@ -227,7 +280,7 @@ class GodboltService(CodeDispatch):
         str | None
             The execution output with header lines removed, or None if execution failed.
         """
-        output = godbolt.getoutput(code, compiler, options)
+        output = await godbolt.getoutput(code, compiler, options)
         if not output:
             return None
 
@@ -261,7 +314,7 @@ class WandboxService(CodeDispatch):
         -----
         Nim compiler errors are filtered out due to excessive verbosity.
         """
-        result = wandbox.getoutput(code, compiler, options)
+        result = await wandbox.getoutput(code, compiler, options)
         if not result:
             return None
 
@@ -5,8 +5,47 @@ from loguru import logger
 
 from tux.bot import Tux
 from tux.ui.embeds import EmbedCreator
+from tux.utils.cache import TTLCache
 from tux.utils.functions import generate_usage
 
+# How long (in seconds) a search result is reused, and how many are kept
+WIKI_CACHE_TTL = 3600
+WIKI_CACHE_SIZE = 512
+
+
+class WikiSearchCache(TTLCache[tuple[str, str], tuple[str, str]]):
+    """
+    LRU cache of wiki search results with a time-to-live.
+
+    Entries are keyed by wiki API URL and normalized search term, so repeated
+    searches are answered without contacting the wiki again.
+    """
+
+    def __init__(self, ttl: float = WIKI_CACHE_TTL, maxsize: int = WIKI_CACHE_SIZE) -> None:
+        super().__init__(ttl, maxsize)
+
+    @staticmethod
+    def make_key(base_url: str, search_term: str) -> tuple[str, str]:
+        """
+        Build the cache key of a search.
+
+        Parameters
+        ----------
+        base_url : str
+            The base URL of the wiki API.
+        search_term : str
+            The search term, compared case-insensitively and ignoring extra whitespace.
+
+        Returns
+        -------
+        tuple[str, str]
+            The cache key.
+        """
+        return base_url, " ".join(search_term.split()).casefold()
+
+
+wiki_search_cache = WikiSearchCache()
+
 
 class Wiki(commands.Cog):
     def __init__(self, bot: Tux) -> None:
@@ -53,7 +92,7 @@ class Wiki(commands.Cog):
             )
         return embed
 
-    def query_wiki(self, base_url: str, search_term: str) -> tuple[str, str]:
+    async def query_wiki(self, base_url: str, search_term: str) -> tuple[str, str]:
         """
         Query a wiki API for a search term and return the title and URL of the first search result.
 
@@ -70,31 +109,42 @@ class Wiki(commands.Cog):
             The title and URL of the first search result.
         """
 
-        search_term = search_term.capitalize()
+        cache_key = wiki_search_cache.make_key(base_url, search_term)
+        if (cached := wiki_search_cache.get(cache_key)) is not None:
+            return cached
+
+        search_term = cache_key[1].capitalize()
 
         params: dict[str, str] = {"action": "query", "format": "json", "list": "search", "srsearch": search_term}
 
         # Send a GET request to the wiki API
-        with httpx.Client() as client:
-            response = client.get(base_url, params=params)
-            logger.info(f"GET request to {base_url} with params {params}")
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            data = response.json()
-            logger.info(data)
-            if data.get("query") and data["query"].get("search"):
-                search_results = data["query"]["search"]
-                if search_results:
-                    title = search_results[0]["title"]
-                    url_title = title.replace(" ", "_")
-                    if "atl.wiki" in base_url:
-                        url = f"https://atl.wiki/{url_title}"
-                    else:
-                        url = f"https://wiki.archlinux.org/title/{url_title}"
-                    return title, url
+        try:
+            response = await self.bot.http_clients.get("wiki").get(base_url, params=params)
+        except httpx.RequestError as e:
+            logger.error(f"GET request to {base_url} failed: {e}")
+            return "error", "error"
+
+        logger.debug(f"GET request to {base_url} with params {params}")
+
+        # Failed requests are not cached so they are retried next time
+        if response.status_code != 200:
             return "error", "error"
-        return "error", "error"
+
+        result = ("error", "error")
+        data = response.json()
+        if data.get("query") and data["query"].get("search"):
+            search_results = data["query"]["search"]
+            if search_results:
+                title = search_results[0]["title"]
+                url_title = title.replace(" ", "_")
+                if "atl.wiki" in base_url:
+                    url = f"https://atl.wiki/{url_title}"
+                else:
+                    url = f"https://wiki.archlinux.org/title/{url_title}"
+                result = (title, url)
+
+        wiki_search_cache.set(cache_key, result)
+        return result
 
     @commands.hybrid_group(
         name="wiki",
@@ -128,7 +178,7 @@ class Wiki(commands.Cog):
             The search query.
         """
 
-        title: tuple[str, str] = self.query_wiki(self.arch_wiki_api_url, query)
+        title: tuple[str, str] = await self.query_wiki(self.arch_wiki_api_url, query)
 
         embed = self.create_embed(title, ctx)
 
@@ -149,7 +199,7 @@ class Wiki(commands.Cog):
             The search query.
         """
 
-        title: tuple[str, str] = self.query_wiki(self.atl_wiki_api_url, query)
+        title: tuple[str, str] = await self.query_wiki(self.atl_wiki_api_url, query)
 
         embed = self.create_embed(title, ctx)
 
@@ -0,0 +1,52 @@
+"""
+In-process caches of database rows shared by every controller instance.
+
+Rows cached here are only written through their controllers, so entries never
+expire; they are replaced on write and evicted least recently used once
+``maxsize`` is reached.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class RowCache[K: Hashable, V]:
+    """Bounded LRU cache of values written through a controller.
+
+    Missing rows can be cached as ``None`` as well. Reads only fill keys that
+    are absent, so a read racing a write can never overwrite the newer value.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V | None] = OrderedDict()
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        """Return ``(found, value)`` for a key."""
+        if key not in self._entries:
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, self._entries[key]
+
+    def fill(self, key: K, value: V | None) -> None:
+        """Store a value read from the database unless a write already stored one."""
+        if key not in self._entries:
+            self.set(key, value)
+
+    def set(self, key: K, value: V | None) -> None:
+        """Write a value through to the cache."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Drop a key if it is cached."""
+        self._entries.pop(key, None)
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every key matching a predicate."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
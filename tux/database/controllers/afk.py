@@ -1,9 +1,34 @@
+import asyncio
 from datetime import UTC, datetime
 
 from prisma.actions import GuildActions
 from prisma.models import AFKModel, Guild
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
+from tux.utils.scheduler import scheduler
+
+
+class AfkIndex:
+    """Process-wide index of every AFK entry, keyed by member ID.
+
+    Only a small fraction of members is AFK at any time, so the whole table is
+    loaded once and kept up to date by ``set_afk`` and ``remove_afk``. Lookups for
+    members that are not AFK, which is nearly every message author, never reach
+    the database.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[int, AFKModel] = {}
+        self.loaded = False
+        self.lock = asyncio.Lock()
+
+    def drop_guild(self, guild_id: int) -> None:
+        """Drop every entry of a guild."""
+        for member_id in [member_id for member_id, entry in self.entries.items() if entry.guild_id == guild_id]:
+            del self.entries[member_id]
+
+
+afk_index = AfkIndex()
 
 
 class AfkController(BaseController[AFKModel]):
@@ -18,6 +43,24 @@ class AfkController(BaseController[AFKModel]):
         super().__init__("afkmodel")
         self.guild_table: GuildActions[Guild] = db.client.guild
 
+    async def _index(self) -> dict[int, AFKModel]:
+        """Return the AFK index, loading it from the database on first use."""
+        if not afk_index.loaded:
+            async with afk_index.lock:
+                if not afk_index.loaded:
+                    entries = await self.find_many(where={})
+                    afk_index.entries = {entry.member_id: entry for entry in entries}
+                    afk_index.loaded = True
+
+        return afk_index.entries
+
+    def invalidate_index(self, guild_id: int | None = None) -> None:
+        """Drop the entries of a guild from the AFK index, or reload the whole index on next use."""
+        if guild_id is None:
+            afk_index.loaded = False
+        else:
+            afk_index.drop_guild(guild_id)
+
     async def get_afk_member(self, member_id: int, *, guild_id: int) -> AFKModel | None:
         """Get the AFK record for a member in a guild.
 
@@ -33,7 +76,23 @@ class AfkController(BaseController[AFKModel]):
         AFKModel | None
             The AFK record if found, None otherwise
         """
-        return await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
+        entry = (await self._index()).get(member_id)
+        return entry if entry is not None and entry.guild_id == guild_id else None
+
+    async def get_afk_by_member_id(self, member_id: int) -> AFKModel | None:
+        """Get the AFK record for a member regardless of guild.
+
+        Parameters
+        ----------
+        member_id : int
+            The ID of the member to check
+
+        Returns
+        -------
+        AFKModel | None
+            The AFK record if found, None otherwise
+        """
+        return (await self._index()).get(member_id)
 
     async def is_afk(self, member_id: int, *, guild_id: int) -> bool:
         """Check if a member is AFK in a guild.
@@ -68,10 +127,8 @@ class AfkController(BaseController[AFKModel]):
         bool
             True if the member is permanently AFK, False otherwise
         """
-        is_user_perm_afk = await self.find_one(
-            where={"member_id": member_id, "guild_id": guild_id, "perm_afk": True},
-        )
-        return is_user_perm_afk is not None
+        entry = await self.get_afk_member(member_id, guild_id=guild_id)
+        return entry is not None and entry.perm_afk
 
     async def set_afk(
         self,
@@ -97,12 +154,19 @@ class AfkController(BaseController[AFKModel]):
             The ID of the guild
         perm_afk : bool
             Whether the AFK status is permanent
+        until : datetime | None
+            When the AFK status should expire, if ever
+        enforced : bool
+            Whether the AFK status is enforced
 
         Returns
         -------
         AFKModel
             The created or updated AFK record
         """
+        # Load the index before writing so the load cannot miss this write
+        await self._index()
+
         create_data = {
             "member_id": member_id,
             "nickname": nickname,
@@ -122,12 +186,20 @@ class AfkController(BaseController[AFKModel]):
             "since": datetime.now(UTC),
         }
 
-        return await self.upsert(
+        entry = await self.upsert(
             where={"member_id": member_id},
             create=create_data,
             update=update_data,
             include={"guild": True},
         )
+        afk_index.entries[member_id] = entry
+
+        if until is not None:
+            scheduler.schedule("afk", member_id, until)
+        else:
+            scheduler.cancel("afk", member_id)
+
+        return entry
 
     async def remove_afk(self, member_id: int) -> AFKModel | None:
         """Remove an AFK record for a member.
@@ -142,7 +214,12 @@ class AfkController(BaseController[AFKModel]):
         AFKModel | None
             The deleted AFK record if found, None otherwise
         """
-        return await self.delete(where={"member_id": member_id})
+        await self._index()
+
+        scheduler.cancel("afk", member_id)
+        entry = await self.delete(where={"member_id": member_id})
+        afk_index.entries.pop(member_id, None)
+        return entry
 
     async def count_afk_members(self, guild_id: int) -> int:
         """Count the number of AFK members in a guild.
@@ -173,3 +250,13 @@ class AfkController(BaseController[AFKModel]):
             List of AFK members in the guild
         """
         return await self.find_many(where={"guild_id": guild_id})
+
+    async def get_expiring_afk_members(self) -> list[AFKModel]:
+        """Get all AFK records that have an expiry, across all guilds.
+
+        Returns
+        -------
+        list[AFKModel]
+            List of AFK records with an expiry set
+        """
+        return [entry for entry in (await self._index()).values() if entry.until is not None]
@@ -330,6 +330,36 @@ class BaseController[
             f"Failed to count records in {self.table_name} with criteria {where}",
         )
 
+    async def count_by(
+        self,
+        field: str,
+        where: dict[str, Any] | None = None,
+    ) -> dict[Any, int]:
+        """Counts records matching the specified criteria, grouped by a field.
+
+        All groups are counted with a single ``GROUP BY`` query instead of one
+        ``count`` query per group.
+
+        Parameters
+        ----------
+        field : str
+            The scalar field to group records by.
+        where : dict[str, Any], optional
+            Query conditions to match.
+
+        Returns
+        -------
+        dict[Any, int]
+            The number of matching records for each value of the field. Values
+            without any matching record are absent. Keys are not parsed into
+            model types, so BigInt values are returned as strings.
+        """
+        groups = await self._execute_query(
+            lambda: self.table.group_by(by=[field], where=where, count=True),
+            f"Failed to count records in {self.table_name} grouped by {field}",
+        )
+        return {group[field]: group["_count"]["_all"] for group in groups}
+
     async def create(
         self,
         data: dict[str, Any],
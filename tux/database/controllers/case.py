@@ -5,8 +5,72 @@ from prisma.actions import GuildActions
 from prisma.enums import CaseType
 from prisma.models import Case, Guild
 from prisma.types import CaseWhereInput
+from tux.database.cache import RowCache
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
+from tux.utils.scheduler import scheduler
+
+# The case type removing each restriction, keyed by the case type adding it
+RESTRICTION_CASE_TYPES: dict[CaseType, CaseType] = {
+    CaseType.JAIL: CaseType.UNJAIL,
+    CaseType.POLLBAN: CaseType.POLLUNBAN,
+    CaseType.SNIPPETBAN: CaseType.SNIPPETUNBAN,
+}
+
+# The restriction each adding or removing case type belongs to
+RESTRICTION_BY_CASE_TYPE: dict[CaseType, CaseType] = {
+    case_type: active for active, inactive in RESTRICTION_CASE_TYPES.items() for case_type in (active, inactive)
+}
+
+RESTRICTION_CACHE_SIZE = 50_000
+
+# Numbers and inserts a case in one statement. The upsert creates the guild if
+# needed and takes a row lock on it while incrementing case_count, so concurrent
+# inserts for a guild queue on that lock and always get distinct, gapless numbers.
+# The enum and datetime arrive as JSON strings (datetimes as ISO strings with an
+# offset), so they are bound as text and cast in SQL. Datetimes are stored as UTC
+# like Prisma's, so creation times are set here rather than left to column defaults
+# that follow the session time zone.
+INSERT_CASE_QUERY = """
+WITH next AS (
+    INSERT INTO "Guild" (guild_id, guild_joined_at, case_count)
+    VALUES ($1::bigint, now() AT TIME ZONE 'UTC', 1)
+    ON CONFLICT (guild_id) DO UPDATE SET case_count = "Guild".case_count + 1
+    RETURNING guild_id, case_count
+)
+INSERT INTO "Case" (
+    guild_id,
+    case_number,
+    case_user_id,
+    case_moderator_id,
+    case_type,
+    case_reason,
+    case_user_roles,
+    case_created_at,
+    case_expires_at,
+    case_tempban_expired
+)
+SELECT
+    guild_id,
+    case_count,
+    $2::bigint,
+    $3::bigint,
+    $4::text::"CaseType",
+    $5::text,
+    $6::bigint[],
+    now() AT TIME ZONE 'UTC',
+    $7::text::timestamptz AT TIME ZONE 'UTC',
+    $8::boolean
+FROM next
+RETURNING *
+"""
+
+type RestrictionKey = tuple[int, int, CaseType]
+
+
+# Whether users are under a restriction, keyed by (guild_id, user_id, restriction) where the
+# restriction is the case type adding it. Entries are written through by insert_case.
+restriction_cache: RowCache[RestrictionKey, bool] = RowCache(RESTRICTION_CACHE_SIZE)
 
 
 class CaseController(BaseController[Case]):
@@ -22,33 +86,6 @@ class CaseController(BaseController[Case]):
         # Access guild table through client property
         self.guild_table: GuildActions[Guild] = db.client.guild
 
-    async def get_next_case_number(self, guild_id: int) -> int:
-        """Get the next case number for a guild.
-
-        This method automatically handles guild creation if it doesn't exist
-        and atomically increments the case counter.
-
-        Parameters
-        ----------
-        guild_id : int
-            The ID of the guild to get the next case number for.
-
-        Returns
-        -------
-        int
-            The next case number for the guild.
-        """
-        # Use connect_or_create to ensure guild exists and increment case count
-        guild = await self.guild_table.upsert(
-            where={"guild_id": guild_id},
-            data={
-                "create": {"guild_id": guild_id, "case_count": 1},
-                "update": {"case_count": {"increment": 1}},
-            },
-        )
-
-        return self.safe_get_attr(guild, "case_count", 1)
-
     async def insert_case(
         self,
         guild_id: int,
@@ -62,8 +99,9 @@ class CaseController(BaseController[Case]):
     ) -> Case:
         """Insert a case into the database.
 
-        This method automatically handles guild creation if needed using
-        connect_or_create for optimal performance and race condition prevention.
+        The guild is created if needed, and the case is numbered and inserted
+        in a single statement, so numbering stays race-free under concurrent
+        moderators and costs one round-trip.
 
         Parameters
         ----------
@@ -89,24 +127,30 @@ class CaseController(BaseController[Case]):
         Case
             The case database object.
         """
-        case_number = await self.get_next_case_number(guild_id)
-
-        # Create case with relation to guild using connect_or_create
-        return await self.create(
-            data={
-                "case_number": case_number,
-                "case_user_id": case_user_id,
-                "case_moderator_id": case_moderator_id,
-                "case_type": case_type,
-                "case_reason": case_reason,
-                "case_expires_at": case_expires_at,
-                "case_user_roles": case_user_roles if case_user_roles is not None else [],
-                "case_tempban_expired": case_tempban_expired,
-                "guild": self.connect_or_create_relation("guild_id", guild_id),
-            },
-            include={"guild": True},
+        case: Case = await self._execute_query(
+            lambda: db.client.query_first(
+                INSERT_CASE_QUERY,
+                guild_id,
+                case_user_id,
+                case_moderator_id,
+                case_type,
+                case_reason,
+                case_user_roles if case_user_roles is not None else [],
+                case_expires_at,
+                case_tempban_expired,
+                model=Case,
+            ),
+            f"Failed to insert case for guild_id: {guild_id}",
         )
 
+        if case_type == CaseType.TEMPBAN and case_expires_at is not None and not case_tempban_expired:
+            scheduler.schedule("tempban", case.case_id, case_expires_at)
+
+        if (restriction := RESTRICTION_BY_CASE_TYPE.get(case_type)) is not None:
+            restriction_cache.set((guild_id, case_user_id, restriction), case_type == restriction)
+
+        return case
+
     async def get_case_by_id(self, case_id: int, include_guild: bool = False) -> Case | None:
         """Get a case by its primary key ID.
 
@@ -357,7 +401,13 @@ class CaseController(BaseController[Case]):
             case_id = self.safe_get_attr(case, "case_id")
             return await self.delete(where={"case_id": case_id})
 
-        return await self.execute_transaction(delete_case_tx)
+        case = await self.execute_transaction(delete_case_tx)
+
+        # The restriction state falls back to an older case, so it is read again on the next check
+        if case is not None and (restriction := RESTRICTION_BY_CASE_TYPE.get(case.case_type)) is not None:
+            restriction_cache.pop((guild_id, case.case_user_id, restriction))
+
+        return case
 
     async def get_expired_tempbans(self) -> list[Case]:
         """Get all cases that have expired tempbans.
@@ -375,6 +425,22 @@ class CaseController(BaseController[Case]):
             },
         )
 
+    async def get_pending_tempbans(self) -> list[Case]:
+        """Get all tempban cases that have an expiry and have not expired yet.
+
+        Returns
+        -------
+        list[Case]
+            A list of tempban cases that are still in effect.
+        """
+        return await self.find_many(
+            where={
+                "case_type": CaseType.TEMPBAN,
+                "case_expires_at": {"not": None},
+                "case_tempban_expired": False,
+            },
+        )
+
     async def set_tempban_expired(self, case_number: int | None, guild_id: int) -> int | None:
         """Set a tempban case as expired.
 
@@ -421,7 +487,9 @@ class CaseController(BaseController[Case]):
         int
             The number of cases deleted
         """
-        return await self.delete_many(where={"guild_id": guild_id})
+        deleted = await self.delete_many(where={"guild_id": guild_id})
+        restriction_cache.discard(lambda key: key[0] == guild_id)
+        return deleted
 
     async def count_cases_by_guild_id(self, guild_id: int) -> int:
         """Count the number of cases in a guild.
@@ -468,6 +536,10 @@ class CaseController(BaseController[Case]):
         (of either active_restriction_type or inactive_restriction_type) is
         of the active_restriction_type.
 
+        States are served from the restriction cache, which ``insert_case``
+        keeps current; the database is only read the first time a user is
+        checked.
+
         Parameters
         ----------
         guild_id : int
@@ -484,13 +556,25 @@ class CaseController(BaseController[Case]):
         bool
             True if the user is under the specified restriction, False otherwise.
         """
-        latest_case = await self.get_latest_case_by_user(
-            guild_id=guild_id,
-            user_id=user_id,
-            case_types=[active_restriction_type, inactive_restriction_type],
+        key = (guild_id, user_id, active_restriction_type)
+        found, restricted = restriction_cache.get(key)
+        if found and restricted is not None:
+            return restricted
+
+        latest_case = await self.find_one(
+            where={
+                "guild_id": guild_id,
+                "case_user_id": user_id,
+                "case_type": {"in": [active_restriction_type, inactive_restriction_type]},
+            },
+            order={"case_created_at": "desc"},
         )
 
-        if not latest_case:
-            return False  # No relevant cases, so not under active restriction
+        # No relevant cases means no active restriction
+        restricted = latest_case is not None and latest_case.case_type == active_restriction_type
+
+        # Only restrictions added and removed through insert_case are kept current
+        if RESTRICTION_CASE_TYPES.get(active_restriction_type) == inactive_restriction_type:
+            restriction_cache.fill(key, restricted)
 
-        return latest_case.case_type == active_restriction_type
+        return restricted
@@ -1,3 +1,4 @@
+import time
 from typing import Any
 
 from loguru import logger
@@ -10,12 +11,101 @@ from prisma.types import (
 )
 from tux.database.client import db
 
+# Guild configs are only written through this controller, so the TTL is just a
+# safety net for rows edited out-of-band (e.g. directly in the database).
+GUILD_CONFIG_CACHE_TTL = 600.0
+
+
+class GuildConfigCache:
+    """Process-wide cache of guild config rows keyed by guild ID.
+
+    Controllers are instantiated per ``DatabaseController``, so the cache lives at
+    module level and is shared by every ``GuildConfigController`` instance. Missing
+    configs are cached as ``None`` so guilds without a row don't hit the database
+    on every lookup either.
+    """
+
+    def __init__(self, ttl: float = GUILD_CONFIG_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[int, tuple[float, GuildConfig | None]] = {}
+        self._versions: dict[int, int] = {}
+
+    def get(self, guild_id: int) -> tuple[bool, GuildConfig | None]:
+        """Return ``(found, config)`` for a guild, counting the hit or miss."""
+        entry = self._entries.get(guild_id)
+
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        return True, entry[1]
+
+    def version(self, guild_id: int) -> int:
+        """Return the write version of a guild, used to detect racing writes."""
+        return self._versions.get(guild_id, 0)
+
+    def fill(self, guild_id: int, config: GuildConfig | None, version: int) -> None:
+        """Store a freshly read config unless a write happened since the read started."""
+        if self.version(guild_id) == version:
+            self._entries[guild_id] = (time.monotonic(), config)
+
+    def set(self, guild_id: int, config: GuildConfig | None) -> None:
+        """Write a config through to the cache."""
+        self._versions[guild_id] = self.version(guild_id) + 1
+        self._entries[guild_id] = (time.monotonic(), config)
+
+    def invalidate(self, guild_id: int | None = None) -> None:
+        """Drop a single guild, or every guild if no ID is given."""
+        if guild_id is None:
+            for cached_id in self._entries:
+                self._versions[cached_id] = self.version(cached_id) + 1
+            self._entries.clear()
+            return
+
+        self._versions[guild_id] = self.version(guild_id) + 1
+        self._entries.pop(guild_id, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss counters and current size of the cache."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+guild_config_cache = GuildConfigCache()
+
 
 class GuildConfigController:
     def __init__(self):
         """Initialize the controller with database tables."""
         self.table: GuildConfigActions[GuildConfig] = db.client.guildconfig
         self.guild_table: GuildActions[Guild] = db.client.guild
+        self.cache = guild_config_cache
+
+    async def _fetch_config(self, guild_id: int) -> GuildConfig | None:
+        """Get a guild config, serving it from the cache when possible."""
+        found, config = self.cache.get(guild_id)
+        if found:
+            return config
+
+        version = self.cache.version(guild_id)
+        config = await self.table.find_first(where={"guild_id": guild_id})
+        self.cache.fill(guild_id, config, version)
+        return config
+
+    def _store(self, guild_id: int, config: GuildConfig | None) -> Any:
+        """Write a config returned by a write query through to the cache."""
+        self.cache.set(guild_id, config)
+        return config
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get the guild config cache hit/miss counters."""
+        return self.cache.stats()
+
+    def invalidate_cache(self, guild_id: int | None = None) -> None:
+        """Invalidate the cached config of a guild, or of every guild."""
+        self.cache.invalidate(guild_id)
 
     async def ensure_guild_exists(self, guild_id: int) -> Any:
         """Ensure the guild exists in the database."""
@@ -27,15 +117,15 @@ class GuildConfigController:
     async def insert_guild_config(self, guild_id: int) -> Any:
         """Insert a new guild config into the database."""
         await self.ensure_guild_exists(guild_id)
-        return await self.table.create(data={"guild_id": guild_id})
+        return self._store(guild_id, await self.table.create(data={"guild_id": guild_id}))
 
     async def get_guild_config(self, guild_id: int) -> Any:
-        """Get a guild config from the database."""
-        return await self.table.find_first(where={"guild_id": guild_id})
+        """Get a guild config from the cache or the database."""
+        return await self._fetch_config(guild_id)
 
     async def get_guild_prefix(self, guild_id: int) -> str | None:
-        """Get a guild prefix from the database."""
-        config: Any = await self.table.find_first(where={"guild_id": guild_id})
+        """Get a guild prefix from the cache or the database."""
+        config: Any = await self._fetch_config(guild_id)
         return None if config is None else config.prefix
 
     async def get_log_channel(self, guild_id: int, log_type: str) -> int | None:
@@ -99,7 +189,7 @@ class GuildConfigController:
         guild_id: int,
         field: GuildConfigScalarFieldKeys,
     ) -> Any:
-        config: Any = await self.table.find_first(where={"guild_id": guild_id})
+        config: Any = await self._fetch_config(guild_id)
 
         if config is None:
             logger.warning(f"No guild config found for guild_id: {guild_id}")
@@ -157,13 +247,14 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {"guild_id": guild_id, "prefix": prefix},
                 "update": {"prefix": prefix},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_perm_level_role(
         self,
@@ -184,13 +275,14 @@ class GuildConfigController:
             "7": "perm_level_7_role_id",
         }
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {"guild_id": guild_id, perm_level_roles[level]: role_id},  # type: ignore
                 "update": {perm_level_roles[level]: role_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_mod_log_id(
         self,
@@ -199,7 +291,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -209,6 +301,7 @@ class GuildConfigController:
                 "update": {"mod_log_id": mod_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_audit_log_id(
         self,
@@ -217,7 +310,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -227,6 +320,7 @@ class GuildConfigController:
                 "update": {"audit_log_id": audit_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_join_log_id(
         self,
@@ -235,7 +329,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -245,6 +339,7 @@ class GuildConfigController:
                 "update": {"join_log_id": join_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_private_log_id(
         self,
@@ -253,7 +348,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -263,6 +358,7 @@ class GuildConfigController:
                 "update": {"private_log_id": private_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_report_log_id(
         self,
@@ -271,7 +367,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -281,6 +377,7 @@ class GuildConfigController:
                 "update": {"report_log_id": report_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_dev_log_id(
         self,
@@ -289,7 +386,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -299,6 +396,7 @@ class GuildConfigController:
                 "update": {"dev_log_id": dev_log_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_jail_channel_id(
         self,
@@ -307,13 +405,14 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {"guild_id": guild_id, "jail_channel_id": jail_channel_id},
                 "update": {"jail_channel_id": jail_channel_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_general_channel_id(
         self,
@@ -322,7 +421,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -332,6 +431,7 @@ class GuildConfigController:
                 "update": {"general_channel_id": general_channel_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_starboard_channel_id(
         self,
@@ -340,7 +440,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -350,6 +450,7 @@ class GuildConfigController:
                 "update": {"starboard_channel_id": starboard_channel_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_base_staff_role_id(
         self,
@@ -358,7 +459,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -368,6 +469,7 @@ class GuildConfigController:
                 "update": {"base_staff_role_id": base_staff_role_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_base_member_role_id(
         self,
@@ -376,7 +478,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -386,6 +488,7 @@ class GuildConfigController:
                 "update": {"base_member_role_id": base_member_role_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_jail_role_id(
         self,
@@ -394,13 +497,14 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {"guild_id": guild_id, "jail_role_id": jail_role_id},
                 "update": {"jail_role_id": jail_role_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_quarantine_role_id(
         self,
@@ -409,7 +513,7 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.upsert(
+        config = await self.table.upsert(
             where={"guild_id": guild_id},
             data={
                 "create": {
@@ -419,6 +523,7 @@ class GuildConfigController:
                 "update": {"quarantine_role_id": quarantine_role_id},
             },
         )
+        return self._store(guild_id, config)
 
     async def update_guild_config(
         self,
@@ -427,10 +532,13 @@ class GuildConfigController:
     ) -> Any:
         await self.ensure_guild_exists(guild_id)
 
-        return await self.table.update(where={"guild_id": guild_id}, data=data)
+        config = await self.table.update(where={"guild_id": guild_id}, data=data)
+        return self._store(guild_id, config)
 
     async def delete_guild_config(self, guild_id: int) -> None:
         await self.table.delete(where={"guild_id": guild_id})
+        self.cache.invalidate(guild_id)
 
     async def delete_guild_prefix(self, guild_id: int) -> None:
-        await self.table.update(where={"guild_id": guild_id}, data={"prefix": None})
+        config = await self.table.update(where={"guild_id": guild_id}, data={"prefix": None})
+        self._store(guild_id, config)
@@ -1,13 +1,137 @@
+import asyncio
 import datetime
 import math
+import time
+from dataclasses import dataclass
+from typing import Any
 
 from loguru import logger
 
 from prisma.actions import GuildActions
+from prisma.errors import DataError
 from prisma.models import Guild, Levels
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
 
+# Clean entries untouched for this long are dropped from the state cache on flush
+LEVELS_STATE_IDLE_TTL = 3600.0
+
+# Ranks every non-blacklisted member of a guild in one pass over the
+# (guild_id, blacklisted, xp DESC) index and returns a page of positions plus,
+# optionally, the row of a single member. total is the number of ranked members.
+LEADERBOARD_QUERY = """
+SELECT member_id, xp, level, rank, position, total
+FROM (
+    SELECT
+        member_id,
+        xp,
+        level,
+        RANK() OVER (PARTITION BY guild_id ORDER BY xp DESC) AS rank,
+        ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY xp DESC, member_id) AS position,
+        COUNT(*) OVER (PARTITION BY guild_id) AS total
+    FROM "Levels"
+    WHERE guild_id = $1::bigint AND blacklisted = false
+) AS ranked
+WHERE (position > $2::bigint AND position <= $3::bigint) OR member_id = $4::bigint
+ORDER BY position
+"""
+
+
+@dataclass
+class MemberLevelState:
+    """In-memory copy of a member's levels row.
+
+    ``version`` is bumped on every buffered write and ``flushed_version`` records
+    the last version persisted, so an entry is dirty while the two differ.
+    """
+
+    xp: float
+    level: int
+    last_message: datetime.datetime | None
+    blacklisted: bool
+    version: int = 0
+    flushed_version: int = 0
+    touched_at: float = 0.0
+
+    @property
+    def dirty(self) -> bool:
+        return self.version != self.flushed_version
+
+
+@dataclass
+class _PendingLevelsRow:
+    """Snapshot of a dirty entry taken by a flush."""
+
+    member_id: int
+    guild_id: int
+    state: MemberLevelState
+    version: int
+    xp: float
+    level: int
+    last_message: datetime.datetime | None
+
+
+class LevelsStateCache:
+    """Process-wide write-behind store for hot levels rows.
+
+    XP gains are applied to the in-memory state and persisted later in a single
+    batched flush. Direct writes made through ``LevelsController`` hold the same
+    lock as the flush so a buffered snapshot can never overwrite them.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[int, int], MemberLevelState] = {}
+        self.lock = asyncio.Lock()
+
+    def get(self, member_id: int, guild_id: int) -> MemberLevelState | None:
+        if state := self.entries.get((member_id, guild_id)):
+            state.touched_at = time.monotonic()
+        return state
+
+    def add(self, member_id: int, guild_id: int, state: MemberLevelState) -> MemberLevelState:
+        """Insert a state loaded from the database, keeping any entry added meanwhile."""
+        state.touched_at = time.monotonic()
+        return self.entries.setdefault((member_id, guild_id), state)
+
+    def dirty_items(self) -> list[tuple[tuple[int, int], MemberLevelState]]:
+        return [(key, state) for key, state in self.entries.items() if state.dirty]
+
+    def evict_idle(self, max_idle: float = LEVELS_STATE_IDLE_TTL) -> int:
+        """Drop clean entries that have not been touched for ``max_idle`` seconds."""
+        cutoff = time.monotonic() - max_idle
+        idle = [key for key, state in self.entries.items() if not state.dirty and state.touched_at < cutoff]
+
+        for key in idle:
+            del self.entries[key]
+
+        return len(idle)
+
+    def drop_guild(self, guild_id: int) -> None:
+        for key in [key for key in self.entries if key[1] == guild_id]:
+            del self.entries[key]
+
+
+levels_state_cache = LevelsStateCache()
+
+
+@dataclass
+class LeaderboardEntry:
+    """A ranked member of a guild leaderboard."""
+
+    member_id: int
+    xp: float
+    level: int
+    rank: int
+
+
+@dataclass
+class Leaderboard:
+    """A page of a guild leaderboard, optionally with the entry of one member."""
+
+    entries: list[LeaderboardEntry]
+    total: int
+    member: LeaderboardEntry | None = None
+
 
 class LevelsController(BaseController[Levels]):
     """Controller for managing user levels and experience.
@@ -20,6 +144,188 @@ class LevelsController(BaseController[Levels]):
         """Initialize the LevelsController with the levels table."""
         super().__init__("levels")
         self.guild_table: GuildActions[Guild] = db.client.guild
+        self.state_cache = levels_state_cache
+
+    @staticmethod
+    def _state_from_record(record: Levels | None) -> MemberLevelState:
+        """Build a member state from a levels record, using defaults if there is none."""
+        return MemberLevelState(
+            xp=BaseController.safe_get_attr(record, "xp", 0.0),
+            level=BaseController.safe_get_attr(record, "level", 0),
+            last_message=BaseController.safe_get_attr(record, "last_message", None),
+            blacklisted=BaseController.safe_get_attr(record, "blacklisted", False),
+        )
+
+    async def get_member_record(self, member_id: int, guild_id: int) -> MemberLevelState:
+        """Get the full levels record of a member with at most one query.
+
+        Records are served from the state cache when present and added to it
+        otherwise, so subsequent lookups for the same member cost no queries.
+
+        Parameters
+        ----------
+        member_id : int
+            The ID of the member
+        guild_id : int
+            The ID of the guild
+
+        Returns
+        -------
+        MemberLevelState
+            The record of the member, with defaults if they have no levels row
+        """
+        if state := self.state_cache.get(member_id, guild_id):
+            return state
+
+        record = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
+        return self.state_cache.add(member_id, guild_id, self._state_from_record(record))
+
+    async def get_member_records(self, member_ids: list[int], guild_id: int) -> dict[int, MemberLevelState]:
+        """Get the full levels records of many members with at most one query.
+
+        Parameters
+        ----------
+        member_ids : list[int]
+            The IDs of the members
+        guild_id : int
+            The ID of the guild
+
+        Returns
+        -------
+        dict[int, MemberLevelState]
+            The record of every requested member, keyed by member ID
+        """
+        records: dict[int, MemberLevelState] = {}
+        missing: list[int] = []
+
+        for member_id in dict.fromkeys(member_ids):
+            if state := self.state_cache.get(member_id, guild_id):
+                records[member_id] = state
+            else:
+                missing.append(member_id)
+
+        if missing:
+            found = {
+                record.member_id: record
+                for record in await self.find_many(where={"guild_id": guild_id, "member_id": {"in": missing}})
+            }
+
+            for member_id in missing:
+                state = self._state_from_record(found.get(member_id))
+                records[member_id] = self.state_cache.add(member_id, guild_id, state)
+
+        return records
+
+    def stage_xp_and_level(
+        self,
+        state: MemberLevelState,
+        xp: float,
+        level: int,
+        last_message: datetime.datetime,
+    ) -> None:
+        """Buffer an XP and level change to be persisted by the next flush.
+
+        Parameters
+        ----------
+        state : MemberLevelState
+            The record returned by ``get_member_record``
+        xp : float
+            The new XP of the member
+        level : int
+            The new level of the member
+        last_message : datetime.datetime
+            The last message time of the member
+        """
+        state.xp = xp
+        state.level = level
+        state.last_message = last_message
+        state.version += 1
+
+    async def flush_dirty_levels(self) -> int:
+        """Persist every buffered levels change in a single batch.
+
+        If the batch fails, the rows are written one by one instead, so a single
+        bad row cannot hold back everyone else's XP. Rows rejected for their data
+        are logged and dropped; any other error leaves the remaining rows dirty
+        for the next flush.
+
+        Returns
+        -------
+        int
+            The number of rows written
+        """
+        async with self.state_cache.lock:
+            snapshot = [
+                _PendingLevelsRow(member_id, guild_id, state, state.version, state.xp, state.level, state.last_message)
+                for (member_id, guild_id), state in self.state_cache.dirty_items()
+            ]
+
+            if snapshot:
+
+                async def flush_batch() -> None:
+                    async with db.client.batch_() as batcher:
+                        for row in snapshot:
+                            batcher.levels.upsert(**self._upsert_args(row))
+
+                try:
+                    await self._execute_query(flush_batch, f"Failed to flush {len(snapshot)} buffered levels rows")
+                except Exception:
+                    written = await self._flush_rows_individually(snapshot)
+                else:
+                    self._mark_flushed(snapshot)
+                    written = len(snapshot)
+            else:
+                written = 0
+
+            self.state_cache.evict_idle()
+
+        return written
+
+    async def _flush_rows_individually(self, rows: list[_PendingLevelsRow]) -> int:
+        """Write buffered rows one at a time, dropping those the database rejects.
+
+        Returns the number of rows written.
+        """
+        handled: list[_PendingLevelsRow] = []
+        written = 0
+
+        try:
+            for row in rows:
+                try:
+                    await self.table.upsert(**self._upsert_args(row))
+                    written += 1
+                except DataError as e:
+                    logger.warning(
+                        f"Dropping buffered levels change for member_id: {row.member_id}, guild_id: {row.guild_id}: {e}",
+                    )
+                handled.append(row)
+        finally:
+            self._mark_flushed(handled)
+
+        return written
+
+    def _upsert_args(self, row: _PendingLevelsRow) -> dict[str, Any]:
+        """Build the upsert writing a buffered row."""
+        return {
+            "where": {"member_id_guild_id": {"member_id": row.member_id, "guild_id": row.guild_id}},
+            "data": {
+                "create": {
+                    "member_id": row.member_id,
+                    "xp": row.xp,
+                    "level": row.level,
+                    "last_message": row.last_message or datetime.datetime.now(datetime.UTC),
+                    "blacklisted": row.state.blacklisted,
+                    "guild": self.connect_or_create_relation("guild_id", row.guild_id),
+                },
+                "update": {"xp": row.xp, "level": row.level, "last_message": row.last_message},
+            },
+        }
+
+    @staticmethod
+    def _mark_flushed(rows: list[_PendingLevelsRow]) -> None:
+        # Entries staged again during the flush keep their newer version and stay dirty
+        for row in rows:
+            row.state.flushed_version = max(row.state.flushed_version, row.version)
 
     async def get_xp(self, member_id: int, guild_id: int) -> float:
         """Get the XP of a member in a guild.
@@ -37,8 +343,7 @@ class LevelsController(BaseController[Levels]):
             The XP of the member, or 0.0 if not found
         """
         try:
-            levels = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
-            return self.safe_get_attr(levels, "xp", 0.0)
+            return (await self.get_member_record(member_id, guild_id)).xp
         except Exception as e:
             logger.error(f"Error querying XP for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return 0.0
@@ -59,8 +364,7 @@ class LevelsController(BaseController[Levels]):
             The level of the member, or 0 if not found
         """
         try:
-            levels = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
-            return self.safe_get_attr(levels, "level", 0)
+            return (await self.get_member_record(member_id, guild_id)).level
         except Exception as e:
             logger.error(f"Error querying level for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return 0
@@ -81,11 +385,8 @@ class LevelsController(BaseController[Levels]):
             A tuple containing the XP and level of the member, or (0.0, 0) if not found
         """
         try:
-            record = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
-
-            if record:
-                return (self.safe_get_attr(record, "xp", 0.0), self.safe_get_attr(record, "level", 0))
-            return (0.0, 0)  # noqa: TRY300
+            record = await self.get_member_record(member_id, guild_id)
+            return (record.xp, record.level)  # noqa: TRY300
 
         except Exception as e:
             logger.error(f"Error querying XP and level for member_id: {member_id}, guild_id: {guild_id}: {e}")
@@ -107,8 +408,7 @@ class LevelsController(BaseController[Levels]):
             The last message time of the member, or None if not found
         """
         try:
-            levels = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
-            return self.safe_get_attr(levels, "last_message", None)
+            return (await self.get_member_record(member_id, guild_id)).last_message
         except Exception as e:
             logger.error(f"Error querying last message time for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return None
@@ -129,8 +429,7 @@ class LevelsController(BaseController[Levels]):
             True if the member is blacklisted, False otherwise
         """
         try:
-            levels = await self.find_one(where={"member_id": member_id, "guild_id": guild_id})
-            return self.safe_get_attr(levels, "blacklisted", False)
+            return (await self.get_member_record(member_id, guild_id)).blacklisted
         except Exception as e:
             logger.error(f"Error querying blacklist status for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return False
@@ -164,20 +463,29 @@ class LevelsController(BaseController[Levels]):
             The updated levels record, or None if the update failed
         """
         try:
-            return await self.upsert(
-                where={"member_id_guild_id": {"member_id": member_id, "guild_id": guild_id}},
-                create={
-                    "member_id": member_id,
-                    "xp": xp,
-                    "level": level,
-                    "last_message": last_message,
-                    "guild": self.connect_or_create_relation("guild_id", guild_id),
-                },
-                update={"xp": xp, "level": level, "last_message": last_message},
-            )
+            async with self.state_cache.lock:
+                result = await self.upsert(
+                    where={"member_id_guild_id": {"member_id": member_id, "guild_id": guild_id}},
+                    create={
+                        "member_id": member_id,
+                        "xp": xp,
+                        "level": level,
+                        "last_message": last_message,
+                        "guild": self.connect_or_create_relation("guild_id", guild_id),
+                    },
+                    update={"xp": xp, "level": level, "last_message": last_message},
+                )
+
+                # The row now holds everything a buffered write could, so the entry is clean
+                if state := self.state_cache.get(member_id, guild_id):
+                    state.xp, state.level, state.last_message = xp, level, last_message
+                    state.flushed_version = state.version
+
         except Exception as e:
             logger.error(f"Error updating XP and level for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return None
+        else:
+            return result
 
     async def toggle_blacklist(self, member_id: int, guild_id: int) -> bool:
         """Toggle the blacklist status of a member in a guild.
@@ -228,7 +536,13 @@ class LevelsController(BaseController[Levels]):
                 logger.error(f"Error toggling blacklist for member_id: {member_id}, guild_id: {guild_id}: {e}")
                 return False
 
-        return await self.execute_transaction(toggle_tx)
+        async with self.state_cache.lock:
+            new_status = await self.execute_transaction(toggle_tx)
+
+            if state := self.state_cache.get(member_id, guild_id):
+                state.blacklisted = new_status
+
+        return new_status
 
     async def reset_xp(self, member_id: int, guild_id: int) -> Levels | None:
         """Reset the XP and level of a member in a guild.
@@ -246,44 +560,20 @@ class LevelsController(BaseController[Levels]):
             The updated levels record, or None if the update failed
         """
         try:
-            result = await self.update(
-                where={"member_id_guild_id": {"member_id": member_id, "guild_id": guild_id}},
-                data={"xp": 0.0, "level": 0},
-            )
+            async with self.state_cache.lock:
+                result = await self.update(
+                    where={"member_id_guild_id": {"member_id": member_id, "guild_id": guild_id}},
+                    data={"xp": 0.0, "level": 0},
+                )
+
+                if state := self.state_cache.get(member_id, guild_id):
+                    state.xp, state.level = 0.0, 0
         except Exception as e:
             logger.error(f"Error resetting XP for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return None
         else:
             return result
 
-    async def get_top_members(self, guild_id: int, limit: int = 10, skip: int = 0) -> list[Levels]:
-        """Get the top members in a guild by XP.
-
-        Parameters
-        ----------
-        guild_id : int
-            The ID of the guild
-        limit : int
-            The maximum number of members to return
-        skip : int
-            The number of members to skip
-
-        Returns
-        -------
-        list[Levels]
-            The top members in the guild by XP
-        """
-        try:
-            return await self.find_many(
-                where={"guild_id": guild_id, "blacklisted": False},
-                order={"xp": "desc"},
-                take=limit,
-                skip=skip,
-            )
-        except Exception as e:
-            logger.error(f"Error querying top members for guild_id: {guild_id}: {e}")
-            return []
-
     async def add_xp(self, member_id: int, guild_id: int, xp_to_add: float) -> tuple[float, int, bool]:
         """Add XP to a member and calculate if they leveled up.
 
@@ -370,9 +660,92 @@ class LevelsController(BaseController[Levels]):
         """
         return await self.count(where={"guild_id": guild_id, "blacklisted": False})
 
+    async def get_leaderboard(
+        self,
+        guild_id: int,
+        limit: int = 10,
+        skip: int = 0,
+        member_id: int | None = None,
+    ) -> Leaderboard:
+        """Get a page of the guild leaderboard and a member's rank in a single query.
+
+        Ranks use ``RANK()`` semantics, so members with equal XP share a rank, while
+        pages are cut on a stable position so no member appears on two pages.
+        Buffered XP is flushed first so the ranking includes it.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild
+        limit : int
+            The maximum number of members on the page
+        skip : int
+            The number of members to skip
+        member_id : int | None
+            The ID of a member whose entry should also be returned
+
+        Returns
+        -------
+        Leaderboard
+            The requested page, the number of ranked members and the member's entry
+        """
+        try:
+            await self.flush_dirty_levels()
+        except Exception as e:
+            logger.warning(f"Ranking guild_id: {guild_id} without XP still buffered: {e}")
+
+        rows = await self._execute_query(
+            lambda: db.client.query_raw(LEADERBOARD_QUERY, guild_id, skip, skip + limit, member_id),
+            f"Failed to query leaderboard for guild_id: {guild_id}",
+        )
+
+        leaderboard = Leaderboard(entries=[], total=rows[0]["total"] if rows else 0)
+
+        for row in rows:
+            entry = LeaderboardEntry(
+                member_id=row["member_id"],
+                xp=row["xp"],
+                level=row["level"],
+                rank=row["rank"],
+            )
+
+            if skip < row["position"] <= skip + limit:
+                leaderboard.entries.append(entry)
+            if entry.member_id == member_id:
+                leaderboard.member = entry
+
+        return leaderboard
+
+    async def get_top_members(self, guild_id: int, limit: int = 10, skip: int = 0) -> list[LeaderboardEntry]:
+        """Get the top members in a guild by XP.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild
+        limit : int
+            The maximum number of members to return
+        skip : int
+            The number of members to skip
+
+        Returns
+        -------
+        list[LeaderboardEntry]
+            The top members in the guild by XP, or an empty list if the query failed
+        """
+        try:
+            return (await self.get_leaderboard(guild_id, limit=limit, skip=skip)).entries
+        except Exception as e:
+            logger.error(f"Error querying top members for guild_id: {guild_id}: {e}")
+            return []
+
     async def get_rank(self, member_id: int, guild_id: int) -> int:
         """Get the rank of a member in a guild.
 
+        Members without a levels row or who are blacklisted are not on the
+        leaderboard; they get the rank their XP would have, one below every
+        ranked member with more XP.
+
         Parameters
         ----------
         member_id : int
@@ -383,26 +756,22 @@ class LevelsController(BaseController[Levels]):
         Returns
         -------
         int
-            The rank of the member (1-based), or 0 if not found
+            The rank of the member (1-based), or 0 if it could not be queried
         """
         try:
-            # Get the member's XP
-            member_xp = await self.get_xp(member_id, guild_id)
+            leaderboard = await self.get_leaderboard(guild_id, limit=0, member_id=member_id)
+            if leaderboard.member is not None:
+                return leaderboard.member.rank
 
-            # Count members with more XP
+            record = await self.get_member_record(member_id, guild_id)
             higher_ranked = await self.count(
-                where={
-                    "guild_id": guild_id,
-                    "blacklisted": False,
-                    "xp": {"gt": member_xp},
-                },
+                where={"guild_id": guild_id, "blacklisted": False, "xp": {"gt": record.xp}},
             )
-
-            # Rank is position (1-based)
-            return higher_ranked + 1
         except Exception as e:
             logger.error(f"Error getting rank for member_id: {member_id}, guild_id: {guild_id}: {e}")
             return 0
+        else:
+            return higher_ranked + 1
 
     async def bulk_delete_by_guild_id(self, guild_id: int) -> int:
         """Delete all levels data for a guild.
@@ -417,4 +786,6 @@ class LevelsController(BaseController[Levels]):
         int
             The number of records deleted
         """
-        return await self.delete_many(where={"guild_id": guild_id})
+        async with self.state_cache.lock:
+            self.state_cache.drop_guild(guild_id)
+            return await self.delete_many(where={"guild_id": guild_id})
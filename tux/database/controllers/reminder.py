@@ -4,6 +4,7 @@ from prisma.actions import GuildActions
 from prisma.models import Guild, Reminder
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
+from tux.utils.scheduler import scheduler
 
 
 class ReminderController(BaseController[Reminder]):
@@ -57,6 +58,16 @@ class ReminderController(BaseController[Reminder]):
         now = datetime.now(UTC)
         return await self.find_many(where={"reminder_sent": False, "reminder_expires_at": {"lte": now}})
 
+    async def get_pending_reminders(self) -> list[Reminder]:
+        """Get all unsent reminders, including those that have not expired yet.
+
+        Returns
+        -------
+        list[Reminder]
+            List of unsent reminders
+        """
+        return await self.find_many(where={"reminder_sent": False})
+
     async def insert_reminder(
         self,
         reminder_user_id: int,
@@ -85,7 +96,7 @@ class ReminderController(BaseController[Reminder]):
         Reminder
             The created reminder
         """
-        return await self.create(
+        reminder = await self.create(
             data={
                 "reminder_user_id": reminder_user_id,
                 "reminder_content": reminder_content,
@@ -96,6 +107,8 @@ class ReminderController(BaseController[Reminder]):
             },
             include={"guild": True},
         )
+        scheduler.schedule("reminder", reminder.reminder_id, reminder_expires_at)
+        return reminder
 
     async def delete_reminder_by_id(self, reminder_id: int) -> Reminder | None:
         """Delete a reminder by its ID.
@@ -110,6 +123,7 @@ class ReminderController(BaseController[Reminder]):
         Reminder | None
             The deleted reminder if found, None otherwise
         """
+        scheduler.cancel("reminder", reminder_id)
         return await self.delete(where={"reminder_id": reminder_id})
 
     async def update_reminder_by_id(
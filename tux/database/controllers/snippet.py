@@ -1,9 +1,46 @@
+import asyncio
 import datetime
+from collections import Counter
 
 from prisma.actions import GuildActions
 from prisma.models import Guild, Snippet
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
+from tux.utils.fuzzy import BKTree
+
+# Largest edit distance of a "did you mean" suggestion, by length of the missed name
+SHORT_NAME_LENGTH = 3
+SHORT_NAME_MAX_DISTANCE = 1
+SNIPPET_SUGGESTION_MAX_DISTANCE = 2
+
+
+class SnippetCache:
+    """Process-wide cache of each guild's snippets, plus buffered use counts.
+
+    A guild's snippets are loaded in one query on first use and kept until a
+    write through ``SnippetController`` invalidates the guild. Every
+    invalidation bumps the guild's generation, so a load that raced a write is
+    discarded instead of caching the stale rows. Uses are counted in memory
+    and persisted later by ``SnippetController.flush_snippet_uses``. The name
+    index of a guild is built from its cached snippets and dropped with them.
+    """
+
+    def __init__(self) -> None:
+        # guild_id -> lowercased snippet name -> snippet
+        self.guilds: dict[int, dict[str, Snippet]] = {}
+        # guild_id -> BK-tree of lowercased snippet names
+        self.name_indexes: dict[int, BKTree] = {}
+        self.generations: Counter[int] = Counter()
+        self.pending_uses: Counter[int] = Counter()
+        self.lock = asyncio.Lock()
+
+    def invalidate(self, guild_id: int) -> None:
+        self.guilds.pop(guild_id, None)
+        self.name_indexes.pop(guild_id, None)
+        self.generations[guild_id] += 1
+
+
+snippet_cache = SnippetCache()
 
 
 class SnippetController(BaseController[Snippet]):
@@ -110,11 +147,73 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The snippet if found, None otherwise
         """
-        include = {"guild": True} if include_guild else None
-        return await self.find_one(
-            where={"snippet_name": {"equals": snippet_name, "mode": "insensitive"}, "guild_id": guild_id},
-            include=include,
-        )
+        if include_guild:
+            return await self.find_one(
+                where={"snippet_name": {"equals": snippet_name, "mode": "insensitive"}, "guild_id": guild_id},
+                include={"guild": True},
+            )
+
+        return (await self._get_guild_snippets(guild_id)).get(snippet_name.lower())
+
+    async def suggest_snippet_names(self, snippet_name: str, guild_id: int, limit: int = 3) -> list[str]:
+        """Get the names of a guild's snippets closest to a name that was not found.
+
+        Parameters
+        ----------
+        snippet_name : str
+            The name that was looked up
+        guild_id : int
+            The ID of the guild to search
+        limit : int
+            Maximum number of names to return
+
+        Returns
+        -------
+        list[str]
+            Snippet names, closest first
+        """
+        snippets = await self._get_guild_snippets(guild_id)
+
+        if (index := snippet_cache.name_indexes.get(guild_id)) is None:
+            index = BKTree(snippets)
+
+            # Only keep the index if the snippets it was built from are still cached
+            if snippet_cache.guilds.get(guild_id) is snippets:
+                snippet_cache.name_indexes[guild_id] = index
+
+        query = snippet_name.lower()
+        max_distance = SHORT_NAME_MAX_DISTANCE if len(query) <= SHORT_NAME_LENGTH else SNIPPET_SUGGESTION_MAX_DISTANCE
+
+        return [snippets[name].snippet_name for _, name in index.search(query, max_distance, limit)]
+
+    async def _get_guild_snippets(self, guild_id: int) -> dict[str, Snippet]:
+        """Get a guild's snippets by lowercased name, loading them on first use.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to get snippets for
+
+        Returns
+        -------
+        dict[str, Snippet]
+            The guild's snippets and aliases by lowercased name
+        """
+        if (snippets := snippet_cache.guilds.get(guild_id)) is not None:
+            return snippets
+
+        generation = snippet_cache.generations[guild_id]
+        rows = await self.find_many(where={"guild_id": guild_id})
+        snippets = {row.snippet_name.lower(): row for row in rows}
+
+        # Apply uses recorded since the rows were last flushed
+        for snippet in snippets.values():
+            snippet.uses += snippet_cache.pending_uses.get(snippet.snippet_id, 0)
+
+        if snippet_cache.generations[guild_id] == generation:
+            snippet_cache.guilds[guild_id] = snippets
+
+        return snippets
 
     async def create_snippet(
         self,
@@ -145,7 +244,7 @@ class SnippetController(BaseController[Snippet]):
             The created snippet
         """
         # Use connect_or_create pattern instead of ensure_guild_exists
-        return await self.create(
+        snippet = await self.create(
             data={
                 "snippet_name": snippet_name,
                 "snippet_content": snippet_content,
@@ -158,6 +257,9 @@ class SnippetController(BaseController[Snippet]):
             include={"guild": True},
         )
 
+        snippet_cache.invalidate(guild_id)
+        return snippet
+
     async def get_snippet_by_id(self, snippet_id: int, include_guild: bool = False) -> Snippet | None:
         """Get a snippet by its ID.
 
@@ -189,7 +291,7 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The deleted snippet if found, None otherwise
         """
-        return await self.delete(where={"snippet_id": snippet_id})
+        return self._invalidate_for(await self.delete(where={"snippet_id": snippet_id}))
 
     async def create_snippet_alias(
         self,
@@ -220,7 +322,7 @@ class SnippetController(BaseController[Snippet]):
             The created snippet alias record.
         """
         # Use connect_or_create pattern for guild relation
-        return await self.create(
+        snippet = await self.create(
             data={
                 "snippet_name": snippet_name,
                 "alias": snippet_alias,  # Assuming 'alias' is the correct field name
@@ -233,6 +335,9 @@ class SnippetController(BaseController[Snippet]):
             include={"guild": True},
         )
 
+        snippet_cache.invalidate(guild_id)
+        return snippet
+
     async def get_all_aliases(self, snippet_name: str, guild_id: int) -> list[Snippet]:
         """Get all aliases for a snippet name within a guild.
 
@@ -267,15 +372,17 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The updated snippet if found, None otherwise
         """
-        return await self.update(
-            where={"snippet_id": snippet_id},
-            data={"snippet_content": snippet_content},
+        return self._invalidate_for(
+            await self.update(
+                where={"snippet_id": snippet_id},
+                data={"snippet_content": snippet_content},
+            ),
         )
 
     async def increment_snippet_uses(self, snippet_id: int) -> Snippet | None:
-        """Increment the use counter for a snippet.
+        """Increment the use counter for a snippet immediately.
 
-        This method uses a transaction to ensure atomicity.
+        Prefer ``record_snippet_use``, which buffers the increment.
 
         Parameters
         ----------
@@ -287,21 +394,72 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The updated snippet if found, None otherwise
         """
+        return self._invalidate_for(
+            await self.update(
+                where={"snippet_id": snippet_id},
+                data={"uses": {"increment": 1}},
+            ),
+        )
 
-        async def increment_tx():
-            snippet = await self.find_unique(where={"snippet_id": snippet_id})
-            if snippet is None:
-                return None
+    def record_snippet_use(self, snippet: Snippet) -> None:
+        """Count a use of a snippet in memory, to be persisted by ``flush_snippet_uses``.
 
-            # Safely get the current uses value
-            snippet_uses = self.safe_get_attr(snippet, "uses", 0)
+        Parameters
+        ----------
+        snippet : Snippet
+            The snippet that was used
+        """
+        snippet_cache.pending_uses[snippet.snippet_id] += 1
 
-            return await self.update(
-                where={"snippet_id": snippet_id},
-                data={"uses": snippet_uses + 1},
-            )
+        if (cached := snippet_cache.guilds.get(snippet.guild_id, {}).get(snippet.snippet_name.lower())) is not None:
+            cached.uses += 1
+
+    async def flush_snippet_uses(self) -> int:
+        """Persist buffered use counts, one ``uses = uses + n`` update per distinct count.
+
+        Returns
+        -------
+        int
+            The number of snippets whose counts were written
+        """
+        async with snippet_cache.lock:
+            pending = snippet_cache.pending_uses
+            if not pending:
+                return 0
 
-        return await self.execute_transaction(increment_tx)
+            snippet_cache.pending_uses = Counter()
+
+            by_count: dict[int, list[int]] = {}
+            for snippet_id, count in pending.items():
+                by_count.setdefault(count, []).append(snippet_id)
+
+            async def flush_batch() -> None:
+                async with db.client.batch_() as batcher:
+                    for count, snippet_ids in by_count.items():
+                        batcher.snippet.update_many(
+                            where={"snippet_id": {"in": snippet_ids}},
+                            data={"uses": {"increment": count}},
+                        )
+
+            try:
+                await self._execute_query(flush_batch, f"Failed to flush uses of {len(pending)} snippets")
+            except Exception:
+                # Keep the counts so the next flush retries them
+                snippet_cache.pending_uses.update(pending)
+                raise
+
+            return len(pending)
+
+    def invalidate_cache(self, guild_id: int) -> None:
+        """Drop the cached snippets of a guild."""
+        snippet_cache.invalidate(guild_id)
+
+    def _invalidate_for(self, snippet: Snippet | None) -> Snippet | None:
+        """Drop the cached snippets of the guild a written snippet belongs to."""
+        if snippet is not None:
+            snippet_cache.invalidate(snippet.guild_id)
+
+        return snippet
 
     async def lock_snippet_by_id(self, snippet_id: int) -> Snippet | None:
         """Lock a snippet.
@@ -316,9 +474,11 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The updated snippet if found, None otherwise
         """
-        return await self.update(
-            where={"snippet_id": snippet_id},
-            data={"locked": True},
+        return self._invalidate_for(
+            await self.update(
+                where={"snippet_id": snippet_id},
+                data={"locked": True},
+            ),
         )
 
     async def unlock_snippet_by_id(self, snippet_id: int) -> Snippet | None:
@@ -334,9 +494,11 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The updated snippet if found, None otherwise
         """
-        return await self.update(
-            where={"snippet_id": snippet_id},
-            data={"locked": False},
+        return self._invalidate_for(
+            await self.update(
+                where={"snippet_id": snippet_id},
+                data={"locked": False},
+            ),
         )
 
     async def toggle_snippet_lock_by_id(self, snippet_id: int) -> Snippet | None:
@@ -368,7 +530,7 @@ class SnippetController(BaseController[Snippet]):
                 data={"locked": not is_locked},
             )
 
-        return await self.execute_transaction(toggle_lock_tx)
+        return self._invalidate_for(await self.execute_transaction(toggle_lock_tx))
 
     async def count_snippets_by_guild_id(self, guild_id: int) -> int:
         """Count the number of snippets in a guild.
@@ -398,4 +560,6 @@ class SnippetController(BaseController[Snippet]):
         int
             The number of snippets deleted
         """
-        return await self.delete_many(where={"guild_id": guild_id})
+        deleted = await self.delete_many(where={"guild_id": guild_id})
+        snippet_cache.invalidate(guild_id)
+        return deleted
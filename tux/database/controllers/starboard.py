@@ -2,9 +2,17 @@ from datetime import datetime
 
 from prisma.actions import GuildActions
 from prisma.models import Guild, Starboard, StarboardMessage
+from tux.database.cache import RowCache
 from tux.database.client import db
 from tux.database.controllers.base import BaseController
 
+STARBOARD_MESSAGE_CACHE_SIZE = 10_000
+
+starboard_cache: RowCache[int, Starboard] = RowCache()
+starboard_message_cache: RowCache[tuple[int, int], StarboardMessage] = RowCache(
+    STARBOARD_MESSAGE_CACHE_SIZE,
+)
+
 
 class StarboardController(BaseController[Starboard]):
     """Controller for managing starboards.
@@ -41,7 +49,13 @@ class StarboardController(BaseController[Starboard]):
         Starboard | None
             The starboard if found, None otherwise
         """
-        return await self.find_unique(where={"guild_id": guild_id})
+        found, starboard = starboard_cache.get(guild_id)
+        if found:
+            return starboard
+
+        starboard = await self.find_unique(where={"guild_id": guild_id})
+        starboard_cache.fill(guild_id, starboard)
+        return starboard
 
     async def create_or_update_starboard(
         self,
@@ -68,7 +82,7 @@ class StarboardController(BaseController[Starboard]):
         Starboard
             The created or updated starboard
         """
-        return await self.upsert(
+        starboard = await self.upsert(
             where={"guild_id": guild_id},
             create={
                 "starboard_channel_id": starboard_channel_id,
@@ -82,6 +96,8 @@ class StarboardController(BaseController[Starboard]):
                 "starboard_threshold": starboard_threshold,
             },
         )
+        starboard_cache.set(guild_id, starboard)
+        return starboard
 
     async def delete_starboard_by_guild_id(self, guild_id: int) -> Starboard | None:
         """Delete a starboard by guild ID.
@@ -96,7 +112,13 @@ class StarboardController(BaseController[Starboard]):
         Starboard | None
             The deleted starboard if found, None otherwise
         """
-        return await self.delete(where={"guild_id": guild_id})
+        starboard = await self.delete(where={"guild_id": guild_id})
+        starboard_cache.set(guild_id, None)
+        return starboard
+
+    def invalidate_cache(self, guild_id: int) -> None:
+        """Drop the cached starboard of a guild."""
+        starboard_cache.pop(guild_id)
 
     async def count_starboards(self) -> int:
         """Count all starboards.
@@ -121,6 +143,11 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         super().__init__("starboardmessage")
         self.guild_table: GuildActions[Guild] = db.client.guild
 
+    @staticmethod
+    def _store(message_id: int, guild_id: int, message: StarboardMessage | None) -> StarboardMessage | None:
+        starboard_message_cache.set((guild_id, message_id), message)
+        return message
+
     async def get_starboard_message(self, message_id: int, guild_id: int) -> StarboardMessage | None:
         """Get a starboard message by message ID and guild ID.
 
@@ -136,9 +163,15 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         StarboardMessage | None
             The starboard message if found, None otherwise
         """
-        return await self.find_unique(
+        found, message = starboard_message_cache.get((guild_id, message_id))
+        if found:
+            return message
+
+        message = await self.find_unique(
             where={"message_id_message_guild_id": {"message_id": message_id, "message_guild_id": guild_id}},
         )
+        starboard_message_cache.fill((guild_id, message_id), message)
+        return message
 
     async def create_or_update_starboard_message(
         self,
@@ -203,7 +236,9 @@ class StarboardMessageController(BaseController[StarboardMessage]):
                 },
             )
 
-        return await self.execute_transaction(create_or_update_tx)
+        message = await self.execute_transaction(create_or_update_tx)
+        self._store(message_id, message_guild_id, message)
+        return message
 
     async def delete_starboard_message(self, message_id: int, guild_id: int) -> StarboardMessage | None:
         """Delete a starboard message by message ID and guild ID.
@@ -220,9 +255,11 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         StarboardMessage | None
             The deleted starboard message if found, None otherwise
         """
-        return await self.delete(
+        message = await self.delete(
             where={"message_id_message_guild_id": {"message_id": message_id, "message_guild_id": guild_id}},
         )
+        self._store(message_id, guild_id, None)
+        return message
 
     async def get_all_starboard_messages(
         self,
@@ -271,10 +308,11 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         StarboardMessage | None
             The updated starboard message if found, None otherwise
         """
-        return await self.update(
+        message = await self.update(
             where={"message_id_message_guild_id": {"message_id": message_id, "message_guild_id": guild_id}},
             data={"star_count": new_star_count},
         )
+        return self._store(message_id, guild_id, message)
 
     async def get_starboard_message_by_id(self, message_id: int, guild_id: int) -> StarboardMessage | None:
         """Get a starboard message by its ID and guild ID.
@@ -293,7 +331,7 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         StarboardMessage | None
             The starboard message if found, None otherwise
         """
-        return await self.find_one(where={"message_id": message_id, "message_guild_id": guild_id})
+        return await self.get_starboard_message(message_id, guild_id)
 
     async def increment_star_count(self, message_id: int, guild_id: int) -> StarboardMessage | None:
         """Increment the star count of a starboard message.
@@ -372,7 +410,13 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         int
             The number of messages deleted
         """
-        return await self.delete_many(where={"message_guild_id": guild_id})
+        count = await self.delete_many(where={"message_guild_id": guild_id})
+        self.invalidate_cache(guild_id)
+        return count
+
+    def invalidate_cache(self, guild_id: int) -> None:
+        """Drop the cached starboard messages of a guild."""
+        starboard_message_cache.discard(lambda key: key[0] == guild_id)
 
     async def get_messages_for_user(
         self,
@@ -10,12 +10,11 @@ notifying Sentry for unexpected issues.
 
 import contextlib
 import traceback
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
 from typing import Any
 
 import discord
-import Levenshtein
 import sentry_sdk
 from discord import app_commands
 from discord.ext import commands
@@ -32,6 +31,7 @@ from tux.utils.exceptions import (
     PermissionLevelError,
     UnsupportedLanguageError,
 )
+from tux.utils.fuzzy import BKTree
 
 # --- Constants and Configuration ---
 
@@ -106,6 +106,56 @@ class ErrorHandlerConfig:
     send_to_sentry: bool = True
 
 
+class CommandSuggestionIndex:
+    """
+    Lowercased names and aliases of the visible commands, indexed for suggestions.
+
+    Names live in a BK-tree, so a lookup only computes the distance to the few
+    names that can still be within range instead of to every command.
+    """
+
+    def __init__(self, bot_commands: Iterable[commands.Command[Any, ..., Any]]) -> None:
+        # Lowercased name or alias -> qualified names of the commands it belongs to
+        self.qualified_names: dict[str, list[str]] = {}
+
+        for cmd in bot_commands:
+            # Do not suggest hidden commands.
+            if cmd.hidden:
+                continue
+
+            for name in {cmd.qualified_name.lower(), *(alias.lower() for alias in cmd.aliases)}:
+                self.qualified_names.setdefault(name, []).append(cmd.qualified_name)
+
+        self.tree = BKTree(self.qualified_names)
+
+    def suggest(self, command_name: str, max_distance: int, limit: int) -> list[str]:
+        """
+        Get the qualified names of the commands closest to a mistyped name.
+
+        Parameters
+        ----------
+        command_name : str
+            The name the user typed.
+        max_distance : int
+            The largest Levenshtein distance to any of a command's names.
+        limit : int
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        list[str]
+            Qualified command names, closest first.
+        """
+        # Matches come closest first, so the first one seen for a command is its minimum distance.
+        suggestions: dict[str, None] = {}
+
+        for _, name in self.tree.search(command_name.lower(), max_distance):
+            for qualified_name in self.qualified_names[name]:
+                suggestions.setdefault(qualified_name)
+
+        return list(suggestions)[:limit]
+
+
 # --- Helper Functions ---
 
 
@@ -582,6 +632,10 @@ class ErrorHandler(commands.Cog):
         # main bot file define their own `tree.on_error`.
         self._old_tree_error = None
 
+        # Built on the first unknown command and rebuilt once the bot's command tree changes.
+        self._suggestion_index: CommandSuggestionIndex | None = None
+        self._suggestion_index_version = -1
+
     async def cog_load(self) -> None:
         """
         Overrides the bot's application command tree error handler when the cog is loaded.
@@ -1159,13 +1213,30 @@ class ErrorHandler(commands.Cog):
 
     # --- Command Suggestion Logic ---
 
+    def _get_suggestion_index(self) -> CommandSuggestionIndex:
+        """
+        Returns the command suggestion index, rebuilding it if commands were added or removed.
+
+        Returns
+        -------
+        CommandSuggestionIndex
+            An index of the currently registered commands.
+        """
+        if self._suggestion_index is None or self._suggestion_index_version != self.bot.command_version:
+            self._suggestion_index = CommandSuggestionIndex(self.bot.walk_commands())
+            self._suggestion_index_version = self.bot.command_version
+            logger.debug(f"Built command suggestion index of {len(self._suggestion_index.tree)} names.")
+
+        return self._suggestion_index
+
     async def _suggest_command(self, ctx: commands.Context[Tux]) -> list[str] | None:
         """
         Attempts to find similar command names when a CommandNotFound error occurs.
 
-        Uses the Levenshtein distance algorithm to compare the invoked command name
-        against all registered command names and aliases. Returns a list of the
-        closest matches within configured distance thresholds.
+        Looks the invoked command name up in the command suggestion index, which
+        holds all registered command names and aliases and is searched by
+        Levenshtein distance. Returns a list of the closest matches within
+        configured distance thresholds.
 
         Parameters
         ----------
@@ -1199,45 +1270,13 @@ class ErrorHandler(commands.Cog):
 
         logger.bind(**log_context).debug("Attempting command suggestion.")
 
-        # Store potential matches: {qualified_name: min_distance}
-        command_distances: dict[str, int] = {}
-
-        # Iterate through all commands registered with the bot.
-        for cmd in self.bot.walk_commands():
-            # Do not suggest hidden commands.
-            if cmd.hidden:
-                continue
-
-            min_dist_for_cmd = max_distance + 1
-            qualified_name = cmd.qualified_name
-            # Check against the command's main name and all its aliases.
-            names_to_check = [qualified_name, *cmd.aliases]
-
-            # Find the minimum distance between the user's input and any of the command's names.
-            for name in names_to_check:
-                # Perform case-insensitive comparison.
-                distance = Levenshtein.distance(command_name.lower(), name.lower())
-                min_dist_for_cmd = min(min_dist_for_cmd, distance)
-
-            # If the command is close enough, store its distance.
-            if min_dist_for_cmd <= max_distance:
-                # If we found a closer match for this command (e.g., via an alias)
-                # than previously stored, update the distance.
-                current_min = command_distances.get(qualified_name, max_distance + 1)
-                if min_dist_for_cmd < current_min:
-                    command_distances[qualified_name] = min_dist_for_cmd
+        final_suggestions = self._get_suggestion_index().suggest(command_name, max_distance, max_suggestions)
 
         # If no commands were within the distance threshold.
-        if not command_distances:
+        if not final_suggestions:
             logger.bind(**log_context).debug("No close command matches found for suggestion.")
             return None
 
-        # Sort the found commands by distance (closest first).
-        sorted_suggestions = sorted(command_distances.items(), key=lambda item: item[1])
-
-        # Take the top N suggestions based on the configured limit.
-        final_suggestions = [cmd_name for cmd_name, _ in sorted_suggestions[:max_suggestions]]
-
         log_context["suggestions_found"] = final_suggestions
         logger.bind(**log_context).debug("Command suggestions generated.")
         # Return the list of names, or None if the list is empty (shouldn't happen here, but safety check).
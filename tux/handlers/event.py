@@ -3,6 +3,7 @@ from discord.ext import commands
 
 from tux.bot import Tux
 from tux.database.controllers import DatabaseController
+from tux.handlers.message import MessageContext, message_processor
 from tux.ui.embeds import EmbedCreator, EmbedType
 from tux.utils.functions import is_harmful, strip_formatting
 
@@ -19,9 +20,14 @@ class EventHandler(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         await self.db.guild.delete_guild_by_id(guild.id)
+        self.db.guild_config.invalidate_cache(guild.id)
+        self.db.afk.invalidate_index(guild.id)
+        self.db.snippet.invalidate_cache(guild.id)
+        self.db.starboard.invalidate_cache(guild.id)
+        self.db.starboard_message.invalidate_cache(guild.id)
 
     @staticmethod
-    async def handle_harmful_message(message: discord.Message) -> None:
+    async def handle_harmful_message(message: discord.Message, content: str | None = None) -> None:
         """
         This function detects harmful linux commands and replies to the user with a warning.
 
@@ -29,6 +35,8 @@ class EventHandler(commands.Cog):
         ----------
         message : discord.Message
             The message to check.
+        content : str | None
+            The message content with formatting already stripped, if available.
 
         Returns
         -------
@@ -38,7 +46,7 @@ class EventHandler(commands.Cog):
         if message.author.bot:
             return
 
-        stripped_content = strip_formatting(message.content)
+        stripped_content = strip_formatting(message.content) if content is None else content
         harmful = is_harmful(stripped_content)
 
         if harmful == "RM_COMMAND":
@@ -66,9 +74,9 @@ class EventHandler(commands.Cog):
         if not is_harmful(before.content) and is_harmful(after.content):
             await self.handle_harmful_message(after)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        await self.handle_harmful_message(message)
+    @message_processor
+    async def harmful_message_processor(self, context: MessageContext) -> None:
+        await self.handle_harmful_message(context.message, context.content)
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
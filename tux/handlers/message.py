@@ -0,0 +1,176 @@
+"""
+Message pipeline shared by every cog that reacts to regular messages.
+
+Rather than each cog registering its own ``on_message`` listener and deriving the
+author, guild config and command state again, cogs mark lightweight processors
+with :func:`message_processor`. :class:`MessageHandler` listens once, builds a
+:class:`MessageContext` per message and runs every processor concurrently,
+recording how long each one takes.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any
+
+import discord
+from discord.ext import commands
+from loguru import logger
+
+from prisma.models import GuildConfig
+from tux.bot import Tux
+from tux.database.controllers import DatabaseController
+from tux.utils.config import CONFIG
+from tux.utils.functions import strip_formatting
+
+type MessageProcessor = Callable[[MessageContext], Coroutine[Any, Any, None]]
+
+PROCESSOR_ATTRIBUTE = "__message_processor__"
+
+# Processors taking longer than this (in seconds) on a single message are logged
+SLOW_PROCESSOR_THRESHOLD = 0.5
+
+
+def message_processor[T: Callable[..., Coroutine[Any, Any, None]]](func: T) -> T:
+    """Mark a cog method as a message pipeline processor.
+
+    The method is called with a :class:`MessageContext` for every message the
+    bot receives, including messages from bots and in DMs.
+    """
+    setattr(func, PROCESSOR_ATTRIBUTE, True)
+    return func
+
+
+@dataclass
+class MessageContext:
+    """Facts about a message, computed once and shared by every processor."""
+
+    message: discord.Message
+    member: discord.Member | None
+    guild_config: GuildConfig | None
+    content: str
+    is_command: bool
+
+    @property
+    def guild(self) -> discord.Guild | None:
+        return self.message.guild
+
+    @property
+    def is_bot(self) -> bool:
+        return self.message.author.bot
+
+
+@dataclass
+class ProcessorStats:
+    """Running timing totals of a single processor."""
+
+    calls: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class MessageHandler(commands.Cog):
+    def __init__(self, bot: Tux) -> None:
+        self.bot = bot
+        self.db = DatabaseController()
+        self.stats: dict[str, ProcessorStats] = {}
+        self._processors: list[tuple[str, MessageProcessor]] = []
+        self._loaded_cogs: tuple[int, ...] = ()
+
+    def get_processors(self) -> list[tuple[str, MessageProcessor]]:
+        """
+        Get the processors of every loaded cog, rediscovering them when cogs change.
+
+        Returns
+        -------
+        list[tuple[str, MessageProcessor]]
+            The qualified name and bound method of every processor.
+        """
+        loaded_cogs = tuple(id(cog) for cog in self.bot.cogs.values())
+
+        if loaded_cogs != self._loaded_cogs:
+            self._loaded_cogs = loaded_cogs
+            self._processors = [
+                (f"{cog.qualified_name}.{name}", getattr(cog, name))
+                for cog in self.bot.cogs.values()
+                for name in dir(type(cog))
+                if getattr(getattr(type(cog), name, None), PROCESSOR_ATTRIBUTE, False)
+            ]
+            logger.debug(f"Message pipeline processors: {', '.join(name for name, _ in self._processors)}")
+
+        return self._processors
+
+    async def build_context(self, message: discord.Message) -> MessageContext:
+        """
+        Compute the shared facts about a message.
+
+        Parameters
+        ----------
+        message : discord.Message
+            The message to build the context for.
+
+        Returns
+        -------
+        MessageContext
+            The context passed to every processor.
+        """
+        member: discord.Member | None = None
+        guild_config: GuildConfig | None = None
+
+        if message.guild:
+            member = (
+                message.author
+                if isinstance(message.author, discord.Member)
+                else message.guild.get_member(message.author.id)
+            )
+
+            try:
+                guild_config = await self.db.guild_config.get_guild_config(message.guild.id)
+            except Exception as e:
+                logger.error(f"Error getting guild config: {e}")
+
+        prefix = guild_config.prefix if guild_config and guild_config.prefix else CONFIG.DEFAULT_PREFIX
+
+        return MessageContext(
+            message=message,
+            member=member,
+            guild_config=guild_config,
+            content=strip_formatting(message.content),
+            is_command=message.content.startswith(prefix),
+        )
+
+    async def _run_processor(self, name: str, processor: MessageProcessor, context: MessageContext) -> None:
+        stats = self.stats.setdefault(name, ProcessorStats())
+        start = time.perf_counter()
+
+        try:
+            await processor(context)
+        except Exception:
+            stats.failures += 1
+            logger.exception(f"Message processor {name} failed on message {context.message.id}")
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+
+            if elapsed > SLOW_PROCESSOR_THRESHOLD:
+                logger.warning(f"Message processor {name} took {elapsed:.3f}s on message {context.message.id}")
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        if not (processors := self.get_processors()):
+            return
+
+        context = await self.build_context(message)
+        await asyncio.gather(*(self._run_processor(name, processor, context) for name, processor in processors))
+
+
+async def setup(bot: Tux) -> None:
+    await bot.add_cog(MessageHandler(bot))
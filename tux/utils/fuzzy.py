@@ -0,0 +1,98 @@
+"""
+Fuzzy name lookup for "did you mean" suggestions.
+
+A BK-tree indexes names by Levenshtein distance. Because the distance is a
+metric, a search for names within ``d`` of a query only descends into children
+whose edge distance lies within ``d`` of the query's distance to their parent,
+so most of the tree is never compared against the query.
+"""
+
+from collections.abc import Iterable
+
+import Levenshtein
+
+
+class _Node:
+    __slots__ = ("children", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Children keyed by their distance to this node
+        self.children: dict[int, _Node] = {}
+
+
+class BKTree:
+    """BK-tree of names under the Levenshtein distance."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._root: _Node | None = None
+        self._size = 0
+
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, name: str) -> None:
+        """
+        Insert a name, ignoring duplicates.
+
+        Parameters
+        ----------
+        name : str
+            The name to insert.
+        """
+        if self._root is None:
+            self._root = _Node(name)
+            self._size = 1
+            return
+
+        node = self._root
+        while (distance := Levenshtein.distance(name, node.name)) != 0:
+            if (child := node.children.get(distance)) is None:
+                node.children[distance] = _Node(name)
+                self._size += 1
+                return
+
+            node = child
+
+    def search(self, query: str, max_distance: int, limit: int | None = None) -> list[tuple[int, str]]:
+        """
+        Find the names within a distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The name to look up.
+        max_distance : int
+            The largest Levenshtein distance to include.
+        limit : int | None
+            Maximum number of results.
+
+        Returns
+        -------
+        list[tuple[int, str]]
+            ``(distance, name)`` pairs, closest first and then alphabetically.
+        """
+        if self._root is None:
+            return []
+
+        matches: list[tuple[int, str]] = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            distance = Levenshtein.distance(query, node.name)
+
+            if distance <= max_distance:
+                matches.append((distance, node.name))
+
+            stack.extend(
+                child
+                for edge, child in node.children.items()
+                if distance - max_distance <= edge <= distance + max_distance
+            )
+
+        matches.sort()
+        return matches[:limit]
@@ -0,0 +1,157 @@
+"""
+Image processing off the event loop.
+
+Decoding, transforming and encoding images with Pillow is CPU-bound and holds
+the GIL, so it runs in a small process pool. Jobs take the raw bytes of an
+image and return encoded bytes, which keeps them cheap to send between
+processes. Workers are started by a forkserver rather than forked from the
+bot, so they never inherit its threads, and they only import this module, which
+has no Discord dependencies.
+"""
+
+import asyncio
+import io
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PIL import Image, ImageEnhance, ImageOps
+
+# Largest accepted download, in bytes
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+# Images are downscaled while decoding so neither side exceeds this
+MAX_IMAGE_DIMENSION = 2048
+# Images whose header claims more pixels than this are rejected before decoding
+MAX_IMAGE_PIXELS = 40_000_000
+
+IMAGE_WORKERS = 2
+
+
+class ImageTooLargeError(ValueError):
+    """Raised when an image exceeds the accepted byte or pixel limits."""
+
+
+def open_image(data: bytes) -> Image.Image:
+    """
+    Decode an image, downscaling it to fit within MAX_IMAGE_DIMENSION.
+
+    JPEG images are scaled down by the decoder itself through ``Image.draft``,
+    so large photos are never fully decoded.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded image.
+
+    Returns
+    -------
+    Image.Image
+        The decoded RGB image.
+
+    Raises
+    ------
+    ImageTooLargeError
+        If the image is larger than the accepted limits.
+    """
+    if len(data) > MAX_IMAGE_BYTES:
+        msg = f"Image is {len(data)} bytes, the limit is {MAX_IMAGE_BYTES}"
+        raise ImageTooLargeError(msg)
+
+    try:
+        image = Image.open(io.BytesIO(data))
+    except Image.DecompressionBombError as e:
+        # Pillow refuses headers claiming far more pixels than its own limit before ours is checked
+        raise ImageTooLargeError(str(e)) from e
+
+    if image.width * image.height > MAX_IMAGE_PIXELS:
+        msg = f"Image is {image.width}x{image.height}, the limit is {MAX_IMAGE_PIXELS} pixels"
+        raise ImageTooLargeError(msg)
+
+    image.draft("RGB", (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+    image = image.convert("RGB")
+    image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+
+    return image
+
+
+def deepfry_image(pil_image: Image.Image) -> Image.Image:
+    pil_image = pil_image.resize((int(pil_image.width * 0.25), int(pil_image.height * 0.25)))
+    pil_image = ImageEnhance.Sharpness(pil_image).enhance(100.0)
+
+    r = pil_image.split()[0]
+    r = ImageEnhance.Contrast(r).enhance(2.0)
+    r = ImageEnhance.Brightness(r).enhance(1.5)
+
+    black_color = f"#{254:02x}{0:02x}{2:02x}"  # (254, 0, 2) as hex
+    white_color = f"#{255:02x}{255:02x}{15:02x}"  # (255, 255, 15) as hex
+
+    r = ImageOps.colorize(r, black_color, white_color)
+    pil_image = Image.blend(pil_image, r, 0.75)
+
+    return pil_image.resize((int(pil_image.width * 4), int(pil_image.height * 4)))
+
+
+def deepfry(data: bytes) -> bytes:
+    """
+    Deepfry an encoded image.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded image.
+
+    Returns
+    -------
+    bytes
+        The deepfried image, encoded as a JPEG.
+    """
+    output = io.BytesIO()
+    deepfry_image(open_image(data)).save(output, format="JPEG", quality=1)
+    return output.getvalue()
+
+
+class ImagePool:
+    """Process pool running image jobs, started on first use."""
+
+    def __init__(self, max_workers: int = IMAGE_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def run(self, func: Callable[[bytes], bytes], data: bytes) -> bytes:
+        """
+        Run an image job in a worker process.
+
+        Parameters
+        ----------
+        func : Callable[[bytes], bytes]
+            A module-level function taking and returning encoded image bytes.
+        data : bytes
+            The encoded input image.
+
+        Returns
+        -------
+        bytes
+            The encoded output image.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, data)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool for the next job
+            self._executor = None
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, without waiting for running jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+image_pool = ImagePool()
@@ -0,0 +1,153 @@
+"""
+In-process timer scheduler for actions that fire at a known deadline.
+
+Timers are identified by a ``(kind, key)`` pair, for example ``("reminder", 42)``,
+and kept in a single heap ordered by deadline. One background task sleeps until
+the earliest deadline and dispatches each due timer to the handler registered
+for its kind, so expirations fire on time without polling the database.
+
+Controllers schedule timers as rows are written, and cogs register the handlers
+that act on them. Timers whose kind has no handler yet are held back and fired
+as soon as one is registered.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Coroutine, Hashable
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+type TimerHandler = Callable[[Any], Coroutine[Any, Any, None]]
+
+# Upper bound on a single sleep so wall-clock adjustments are picked up
+MAX_SLEEP_SECONDS = 300.0
+
+
+class Scheduler:
+    """Heap-based scheduler that fires keyed timers at their deadlines."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str, Hashable]] = []
+        self._timers: dict[tuple[str, Hashable], int] = {}
+        self._handlers: dict[str, TimerHandler] = {}
+        self._held: dict[str, set[Hashable]] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def schedule(self, kind: str, key: Hashable, when: datetime) -> None:
+        """Schedule a timer, replacing any existing timer with the same kind and key.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of timer, used to look up its handler.
+        key : Hashable
+            The identifier passed to the handler, unique within its kind.
+        when : datetime
+            When the timer should fire. Past deadlines fire immediately.
+        """
+        sequence = next(self._sequence)
+        self._timers[kind, key] = sequence
+        heapq.heappush(self._heap, (when.timestamp(), sequence, kind, key))
+        self._compact()
+        self._wake()
+
+    def cancel(self, kind: str, key: Hashable) -> bool:
+        """Cancel a pending timer.
+
+        Returns
+        -------
+        bool
+            True if a timer was pending, False otherwise.
+        """
+        held = self._held.get(kind)
+        if held is not None and key in held:
+            held.discard(key)
+            return True
+
+        # The heap entry is skipped lazily once it reaches the top
+        return self._timers.pop((kind, key), None) is not None
+
+    def register(self, kind: str, handler: TimerHandler) -> None:
+        """Register the coroutine that handles timers of a kind.
+
+        Timers of this kind that came due while no handler was registered
+        are fired right away.
+        """
+        self._handlers[kind] = handler
+
+        for key in self._held.pop(kind, set()):
+            self._dispatch(kind, key)
+
+        self._wake()
+
+    def unregister(self, kind: str) -> None:
+        """Remove the handler of a kind; its timers are held until a new one is registered."""
+        self._handlers.pop(kind, None)
+
+    def pending(self, kind: str | None = None) -> int:
+        """Return the number of pending timers, optionally of a single kind."""
+        timers = sum(1 for timer_kind, _ in self._timers if kind in (None, timer_kind))
+        held = sum(len(keys) for held_kind, keys in self._held.items() if kind in (None, held_kind))
+        return timers + held
+
+    def _wake(self) -> None:
+        """Make the run loop re-evaluate the earliest deadline, starting it if needed."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="tux-scheduler")
+
+        self._wakeup.set()
+
+    def _compact(self) -> None:
+        """Rebuild the heap once cancelled and replaced entries dominate it."""
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._timers):
+            self._heap = [entry for entry in self._heap if self._timers.get((entry[2], entry[3])) == entry[1]]
+            heapq.heapify(self._heap)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+
+            while self._heap and self._heap[0][0] <= now:
+                _, sequence, kind, key = heapq.heappop(self._heap)
+
+                # Skip entries that were cancelled or replaced by a newer deadline
+                if self._timers.get((kind, key)) != sequence:
+                    continue
+
+                del self._timers[kind, key]
+                self._dispatch(kind, key)
+
+            timeout = min(self._heap[0][0] - now, MAX_SLEEP_SECONDS) if self._heap else None
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+    def _dispatch(self, kind: str, key: Hashable) -> None:
+        handler = self._handlers.get(kind)
+
+        if handler is None:
+            self._held.setdefault(kind, set()).add(key)
+            return
+
+        task = asyncio.get_running_loop().create_task(self._fire(kind, key, handler), name=f"tux-scheduler:{kind}")
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    @staticmethod
+    async def _fire(kind: str, key: Hashable, handler: TimerHandler) -> None:
+        try:
+            await handler(key)
+        except Exception as e:
+            logger.error(f"Scheduled {kind} timer {key!r} failed: {e}")
+
+
+scheduler = Scheduler()
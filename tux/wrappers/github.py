@@ -1,3 +1,7 @@
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
 import httpx
 from githubkit import AppInstallationAuthStrategy, GitHub, Response
 from githubkit.versions.latest.models import (
@@ -17,9 +21,61 @@ from tux.utils.exceptions import (
     APIResourceNotFoundError,
 )
 
+# How long (in seconds) a read is reused without contacting GitHub. Older entries are
+# refetched through githubkit's HTTP cache, which revalidates with If-None-Match, and
+# GitHub does not count the resulting 304 responses against the rate limit.
+GITHUB_CACHE_FRESHNESS = 60
+
+
+class GithubResponseCache:
+    """
+    Short-lived cache of parsed GitHub reads.
+
+    Repeated ``git`` commands within the freshness window are answered from
+    memory, skipping both the round-trip and parsing the response again.
+    """
+
+    def __init__(self, freshness: float = GITHUB_CACHE_FRESHNESS) -> None:
+        self.freshness = freshness
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    async def get_or_fetch[T](self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return a fresh cached value, fetching and caching it otherwise.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key of the read.
+        fetch : Callable[[], Awaitable[T]]
+            Performs the read.
+
+        Returns
+        -------
+        T
+            The cached or fetched value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] <= self.freshness:
+            return entry[1]
+
+        value = await fetch()
+        self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop cached reads made stale by a write."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+github_response_cache = GithubResponseCache()
+
 
 class GithubService:
     def __init__(self) -> None:
+        # githubkit's HTTP cache (on by default, spelled out because GithubResponseCache relies
+        # on it) revalidates stored responses with If-None-Match and serves 304s from them
         self.github = GitHub(
             AppInstallationAuthStrategy(
                 CONFIG.GITHUB_APP_ID,
@@ -28,6 +84,7 @@ class GithubService:
                 CONFIG.GITHUB_CLIENT_ID,
                 CONFIG.GITHUB_CLIENT_SECRET,
             ),
+            http_cache=True,
         )
 
     async def get_repo(self) -> FullRepository:
@@ -39,6 +96,10 @@ class GithubService:
         FullRepository
             The repository.
         """
+        return await github_response_cache.get_or_fetch(("repo",), self._fetch_repo)
+
+    async def _fetch_repo(self) -> FullRepository:
+        """Fetch the repository from GitHub."""
         try:
             response: Response[FullRepository] = await self.github.rest.repos.async_get(
                 CONFIG.GITHUB_REPO_OWNER,
@@ -111,6 +172,7 @@ class GithubService:
             raise
 
         else:
+            github_response_cache.invalidate(("repo",), ("issues", "open"))
             return created_issue
 
     async def create_issue_comment(self, issue_number: int, body: str) -> IssueComment:
@@ -159,6 +221,7 @@ class GithubService:
             raise
 
         else:
+            github_response_cache.invalidate(("issue", issue_number))
             return created_issue_comment
 
     async def close_issue(self, issue_number: int) -> Issue:
@@ -205,6 +268,12 @@ class GithubService:
             raise
 
         else:
+            github_response_cache.invalidate(
+                ("repo",),
+                ("issue", issue_number),
+                ("issues", "open"),
+                ("issues", "closed"),
+            )
             return closed_issue
 
     async def get_issue(self, issue_number: int) -> Issue:
@@ -221,6 +290,12 @@ class GithubService:
         Issue
             The issue.
         """
+        return await github_response_cache.get_or_fetch(
+            ("issue", issue_number), lambda: self._fetch_issue(issue_number)
+        )
+
+    async def _fetch_issue(self, issue_number: int) -> Issue:
+        """Fetch an issue from GitHub."""
 
         try:
             response: Response[Issue] = await self.github.rest.issues.async_get(
@@ -260,6 +335,10 @@ class GithubService:
         list[Issue]
             The list of open issues.
         """
+        return await github_response_cache.get_or_fetch(("issues", "open"), self._fetch_open_issues)
+
+    async def _fetch_open_issues(self) -> list[Issue]:
+        """Fetch the open issues from GitHub."""
 
         try:
             response: Response[list[Issue]] = await self.github.rest.issues.async_list_for_repo(
@@ -294,6 +373,10 @@ class GithubService:
         list[Issue]
             The list of closed issues.
         """
+        return await github_response_cache.get_or_fetch(("issues", "closed"), self._fetch_closed_issues)
+
+    async def _fetch_closed_issues(self) -> list[Issue]:
+        """Fetch the closed issues from GitHub."""
 
         try:
             response: Response[list[Issue]] = await self.github.rest.issues.async_list_for_repo(
@@ -7,6 +7,9 @@ from tux.utils.exceptions import (
     APIRequestError,
     APIResourceNotFoundError,
 )
+from tux.wrappers.http_client import http_clients
+
+http_client = http_clients.get("godbolt")
 
 
 class CompilerFilters(TypedDict):
@@ -43,7 +46,6 @@ class Payload(TypedDict):
     allowStoreCodeDebug: bool
 
 
-client = httpx.Client(timeout=15)
 url = "https://godbolt.org"
 
 
@@ -74,7 +76,7 @@ def checkresponse(res: httpx.Response) -> str | None:
         raise APIRequestError(service_name="Godbolt", status_code=e.response.status_code, reason=e.response.text) from e
 
 
-def sendresponse(url: str) -> str | None:
+async def sendresponse(url: str) -> str | None:
     """
     Send the response from the Godbolt API.
 
@@ -90,7 +92,7 @@ def sendresponse(url: str) -> str | None:
     """
 
     try:
-        response = client.get(url)
+        response = await http_client.get(url)
         response.raise_for_status()
     except httpx.ReadTimeout:
         return None
@@ -104,7 +106,7 @@ def sendresponse(url: str) -> str | None:
         return response.text if response.status_code == 200 else None
 
 
-def getlanguages() -> str | None:
+async def getlanguages() -> str | None:
     """
     Get the languages from the Godbolt API.
 
@@ -114,10 +116,10 @@ def getlanguages() -> str | None:
         The languages from the Godbolt API if successful, otherwise None.
     """
     url_lang = f"{url}/api/languages"
-    return sendresponse(url_lang)
+    return await sendresponse(url_lang)
 
 
-def getcompilers() -> str | None:
+async def getcompilers() -> str | None:
     """
     Get the compilers from the Godbolt API.
 
@@ -128,10 +130,10 @@ def getcompilers() -> str | None:
     """
 
     url_comp = f"{url}/api/compilers"
-    return sendresponse(url_comp)
+    return await sendresponse(url_comp)
 
 
-def getspecificcompiler(lang: str) -> str | None:
+async def getspecificcompiler(lang: str) -> str | None:
     """
     Get a specific compiler from the Godbolt API.
 
@@ -147,10 +149,10 @@ def getspecificcompiler(lang: str) -> str | None:
     """
 
     url_comp = f"{url}/api/compilers/{lang}"
-    return sendresponse(url_comp)
+    return await sendresponse(url_comp)
 
 
-def getoutput(code: str, lang: str, compileroptions: str | None = None) -> str | None:
+async def getoutput(code: str, lang: str, compileroptions: str | None = None) -> str | None:
     """
     This function sends a POST request to the Godbolt API to get the output of the given code.
 
@@ -170,8 +172,8 @@ def getoutput(code: str, lang: str, compileroptions: str | None = None) -> str |
 
     Raises
     ------
-    httpx.ReadTimeout
-        If the request times out.
+    APIConnectionError
+        If the request fails or times out.
     """
 
     url_comp = f"{url}/api/compiler/{lang}/compile"
@@ -202,10 +204,9 @@ def getoutput(code: str, lang: str, compileroptions: str | None = None) -> str |
         "lang": f"{lang}",
         "allowStoreCodeDebug": True,
     }
-    uri = client.post(url_comp, json=payload)
 
     try:
-        return uri.text if uri.status_code == 200 else None
+        uri = await http_client.post(url_comp, json=payload)
 
     except httpx.ReadTimeout as e:
         raise APIConnectionError(service_name="Godbolt", original_error=e) from e
@@ -215,9 +216,11 @@ def getoutput(code: str, lang: str, compileroptions: str | None = None) -> str |
         if e.response.status_code == 404:
             raise APIResourceNotFoundError(service_name="Godbolt", resource_identifier=lang) from e
         raise APIRequestError(service_name="Godbolt", status_code=e.response.status_code, reason=e.response.text) from e
+    else:
+        return uri.text if uri.status_code == 200 else None
 
 
-def generateasm(code: str, lang: str, compileroptions: str | None = None) -> str | None:
+async def generateasm(code: str, lang: str, compileroptions: str | None = None) -> str | None:
     """
     Generate assembly code from the given code.
 
@@ -237,8 +240,8 @@ def generateasm(code: str, lang: str, compileroptions: str | None = None) -> str
 
     Raises
     ------
-    httpx.ReadTimeout
-        If the request times out.
+    APIConnectionError
+        If the request fails or times out.
     """
 
     url_comp = f"{url}/api/compiler/{lang}/compile"
@@ -270,10 +273,8 @@ def generateasm(code: str, lang: str, compileroptions: str | None = None) -> str
         "allowStoreCodeDebug": True,
     }
 
-    uri = client.post(url_comp, json=payload)
-
     try:
-        return uri.text if uri.status_code == 200 else None
+        uri = await http_client.post(url_comp, json=payload)
 
     except httpx.ReadTimeout as e:
         raise APIConnectionError(service_name="Godbolt", original_error=e) from e
@@ -283,3 +284,5 @@ def generateasm(code: str, lang: str, compileroptions: str | None = None) -> str
         if e.response.status_code == 404:
             raise APIResourceNotFoundError(service_name="Godbolt", resource_identifier=lang) from e
         raise APIRequestError(service_name="Godbolt", status_code=e.response.status_code, reason=e.response.text) from e
+    else:
+        return uri.text if uri.status_code == 200 else None
@@ -0,0 +1,213 @@
+"""
+Shared asynchronous HTTP clients for the API wrappers and cogs.
+
+Each service gets a named, pooled ``httpx.AsyncClient`` from the registry, so
+connections to a service are kept alive and reused between requests instead of
+paying for a new connection and TLS handshake per command. Requests never block
+the event loop and are cancelled along with the task awaiting them. Each host
+is limited to a few concurrent requests, so a slow service cannot take up the
+whole connection pool, and every client records request counts and timings.
+
+The registry is owned by the bot (``Tux.http_clients``) and closed on shutdown.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+HTTP_TIMEOUT = httpx.Timeout(15.0)
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Maximum number of requests in flight to a single host
+MAX_REQUESTS_PER_HOST = 4
+
+
+@dataclass(frozen=True)
+class HTTPClientConfig:
+    """Connection settings of a named client."""
+
+    timeout: httpx.Timeout = field(default_factory=lambda: HTTP_TIMEOUT)
+    limits: httpx.Limits = field(default_factory=lambda: HTTP_LIMITS)
+    max_requests_per_host: int = MAX_REQUESTS_PER_HOST
+    follow_redirects: bool = False
+
+
+# Services whose settings differ from the defaults; every other name gets HTTPClientConfig()
+SERVICE_CLIENT_CONFIGS: dict[str, HTTPClientConfig] = {
+    # Images from Discord's CDN and other user-provided URLs
+    "media": HTTPClientConfig(timeout=httpx.Timeout(10.0), max_requests_per_host=8, follow_redirects=True),
+    "mail": HTTPClientConfig(timeout=httpx.Timeout(10.0)),
+    "wolfram": HTTPClientConfig(timeout=httpx.Timeout(10.0)),
+}
+
+
+@dataclass
+class RequestMetrics:
+    """Running request totals of a single client."""
+
+    requests: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    status_codes: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    def record(self, elapsed: float, response: httpx.Response | None) -> None:
+        self.requests += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+        if response is None:
+            self.failures += 1
+        else:
+            self.status_codes[response.status_code] = self.status_codes.get(response.status_code, 0) + 1
+
+
+class HTTPClient:
+    """Pooled async HTTP client with a per-host concurrency limit."""
+
+    def __init__(self, name: str = "default", config: HTTPClientConfig | None = None) -> None:
+        self.name = name
+        self.config = config or HTTPClientConfig()
+        self.metrics = RequestMetrics()
+        self._client: httpx.AsyncClient | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying client, created on first use so it binds to the running loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=self.config.limits,
+                follow_redirects=self.config.follow_redirects,
+            )
+
+        return self._client
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, waiting for a free slot on its host first.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL to request.
+        **kwargs : Any
+            Extra arguments passed to ``httpx.AsyncClient.request``.
+
+        Returns
+        -------
+        httpx.Response
+            The response.
+        """
+        async with self._host_limit(url):
+            response: httpx.Response | None = None
+            start = time.perf_counter()
+
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            finally:
+                self.metrics.record(time.perf_counter() - start, response)
+
+            return response
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request whose body is read incrementally.
+
+        The host slot is held until the context exits.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL to request.
+        **kwargs : Any
+            Extra arguments passed to ``httpx.AsyncClient.stream``.
+
+        Yields
+        ------
+        httpx.Response
+            The response, with its body not yet read.
+        """
+        async with self._host_limit(url):
+            response: httpx.Response | None = None
+            start = time.perf_counter()
+
+            try:
+                async with self.client.stream(method, url, **kwargs) as response:
+                    yield response
+            finally:
+                self.metrics.record(time.perf_counter() - start, response)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = httpx.URL(url).host
+        return self._host_limits.setdefault(
+            host,
+            asyncio.Semaphore(self.config.max_requests_per_host),
+        )
+
+
+class HTTPClientRegistry:
+    """Named HTTP clients, one connection pool per service."""
+
+    def __init__(self, configs: dict[str, HTTPClientConfig] | None = None) -> None:
+        self.configs = SERVICE_CLIENT_CONFIGS if configs is None else configs
+        self._clients: dict[str, HTTPClient] = {}
+
+    def get(self, name: str = "default") -> HTTPClient:
+        """
+        Get the client of a service, creating it on first use.
+
+        Parameters
+        ----------
+        name : str
+            The service name.
+
+        Returns
+        -------
+        HTTPClient
+            The service's client.
+        """
+        if (client := self._clients.get(name)) is None:
+            client = self._clients[name] = HTTPClient(name, self.configs.get(name))
+
+        return client
+
+    def metrics(self) -> dict[str, RequestMetrics]:
+        """Get the request metrics of every client."""
+        return {name: client.metrics for name, client in self._clients.items()}
+
+    async def aclose(self) -> None:
+        """Close the connections of every client."""
+        await asyncio.gather(*(client.aclose() for client in self._clients.values()))
+
+
+http_clients = HTTPClientRegistry()
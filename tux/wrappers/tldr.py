@@ -6,21 +6,39 @@ providing command documentation lookup with proper caching, localization, and pl
 This wrapper contains no Discord dependencies and can be used independently.
 """
 
+import asyncio
+import bisect
 import contextlib
+import itertools
 import os
 import re
 import shutil
+import tempfile
 import time
 import zipfile
-from io import BytesIO
+from collections.abc import Callable
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+import httpx
+
+from tux.utils.fuzzy import BKTree
+from tux.wrappers.http_client import http_clients
+
+http_client = http_clients.get("tldr")
 
 # Configuration constants following 12-factor app principles
 CACHE_DIR: Path = Path(os.getenv("TLDR_CACHE_DIR", ".cache/tldr"))
 MAX_CACHE_AGE_HOURS: int = int(os.getenv("TLDR_CACHE_AGE_HOURS", "168"))  # 7 days default
 REQUEST_TIMEOUT_SECONDS: int = int(os.getenv("TLDR_REQUEST_TIMEOUT", "10"))
+ARCHIVE_TIMEOUT_SECONDS: int = int(os.getenv("TLDR_ARCHIVE_TIMEOUT", "30"))
+
+# Size of the chunks written to disk while downloading an archive
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+# Largest edit distance of an autocomplete suggestion when nothing else matches
+SHORT_QUERY_LENGTH = 3
+SHORT_QUERY_MAX_DISTANCE = 1
+CLOSE_MATCH_MAX_DISTANCE = 2
 
 # TLDR API endpoints
 PAGES_SOURCE_URL = "https://raw.githubusercontent.com/tldr-pages/tldr/main/pages"
@@ -43,6 +61,235 @@ PLATFORM_MAPPINGS = {
 SUPPORTED_PLATFORMS = sorted([*set(PLATFORM_MAPPINGS.values()), "common"])
 
 
+def _pages_dir_name(language: str) -> str:
+    """Return the archive directory name of a normalized language code."""
+    return "pages" if language == "en" else f"pages.{language}"
+
+
+class TldrPageStore:
+    """
+    In-memory index of the extracted TLDR archives.
+
+    Each language is read from the cache directory once, off the event loop,
+    into a map of command to platform to page content, along with the sorted
+    command names of every platform. Page lookups and autocomplete are then
+    served from memory without touching the disk.
+    """
+
+    def __init__(self) -> None:
+        # language -> command -> platform -> page content
+        self._pages: dict[str, dict[str, dict[str, str]]] = {}
+        # language -> platform -> sorted command names
+        self._commands: dict[str, dict[str, list[str]]] = {}
+        # (language, platforms) -> merged command listing, used by autocomplete
+        self._listings: dict[tuple[str, tuple[str, ...]], list[str]] = {}
+        # (language, platforms) -> BK-tree of the listing, for close spellings
+        self._name_indexes: dict[tuple[str, tuple[str, ...]], BKTree] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def normalize_language(language: str) -> str:
+        """Treat regional English variants (en_US, en_GB, ...) as 'en'."""
+        return "en" if language.startswith("en") else language
+
+    @staticmethod
+    def read_language(language: str) -> tuple[dict[str, dict[str, str]], dict[str, list[str]]]:
+        """
+        Read every cached page of a language from disk.
+
+        This walks the cache directory and must be run off the event loop.
+
+        Parameters
+        ----------
+        language : str
+            Normalized language code.
+
+        Returns
+        -------
+        tuple[dict[str, dict[str, str]], dict[str, list[str]]]
+            The pages by command and platform, and the sorted commands by platform.
+        """
+        pages: dict[str, dict[str, str]] = {}
+        commands: dict[str, list[str]] = {}
+        language_dir = CACHE_DIR / _pages_dir_name(language)
+
+        with contextlib.suppress(OSError):
+            for platform_dir in language_dir.iterdir():
+                if not platform_dir.is_dir():
+                    continue
+
+                names: list[str] = []
+                for page_file in platform_dir.glob("*.md"):
+                    with contextlib.suppress(OSError, UnicodeDecodeError):
+                        pages.setdefault(page_file.stem, {})[platform_dir.name] = page_file.read_text(
+                            encoding="utf-8",
+                        )
+                        names.append(page_file.stem)
+
+                commands[platform_dir.name] = sorted(names)
+
+        return pages, commands
+
+    def is_loaded(self, language: str) -> bool:
+        """Check whether a language has been read into memory."""
+        return self.normalize_language(language) in self._pages
+
+    def has_pages(self, language: str) -> bool:
+        """Check whether a loaded language has any pages, i.e. whether its archive is present."""
+        return bool(self._pages.get(self.normalize_language(language)))
+
+    async def load(self, language: str) -> None:
+        """
+        Read a language into memory, replacing any previously loaded pages.
+
+        Parameters
+        ----------
+        language : str
+            Language code to load.
+        """
+        language = self.normalize_language(language)
+        pages, commands = await asyncio.to_thread(self.read_language, language)
+
+        self._pages[language] = pages
+        self._commands[language] = commands
+        self._drop_listings(language)
+
+    async def install(self, language: str, installer: Callable[[], None]) -> None:
+        """
+        Replace a language's files on disk, then reload it.
+
+        The load lock is held throughout, so a concurrent first load never reads
+        a directory that is being swapped.
+
+        Parameters
+        ----------
+        language : str
+            Language code being replaced.
+        installer : Callable[[], None]
+            Blocking function that swaps the files in; it is run in a thread.
+        """
+        async with self._lock:
+            await asyncio.to_thread(installer)
+            await self.load(language)
+
+    async def ensure_loaded(self, language: str) -> None:
+        """Load a language unless it is already in memory."""
+        if self.is_loaded(language):
+            return
+
+        async with self._lock:
+            if not self.is_loaded(language):
+                await self.load(language)
+
+    def get_page(self, command: str, platform: str, language: str) -> str | None:
+        """Return the content of a page, or None if it is not in memory."""
+        return self._pages.get(self.normalize_language(language), {}).get(command, {}).get(platform)
+
+    def add_page(self, page: str, command: str, platform: str, language: str) -> None:
+        """Add a page fetched outside of the archive to a loaded language."""
+        language = self.normalize_language(language)
+        if language not in self._pages:
+            return
+
+        platforms = self._pages[language].setdefault(command, {})
+        if platform not in platforms:
+            bisect.insort(self._commands[language].setdefault(platform, []), command)
+            self._drop_listings(language)
+
+        platforms[platform] = page
+
+    def list_commands(self, language: str, platforms: list[str]) -> list[str]:
+        """
+        List the commands available on any of the given platforms.
+
+        Parameters
+        ----------
+        language : str
+            Language code, which should already be loaded.
+        platforms : list[str]
+            Platforms to include.
+
+        Returns
+        -------
+        list[str]
+            Sorted, de-duplicated command names.
+        """
+        language = self.normalize_language(language)
+        key = (language, tuple(platforms))
+
+        if (listing := self._listings.get(key)) is None:
+            by_platform = self._commands.get(language, {})
+            listing = sorted({command for platform in platforms for command in by_platform.get(platform, [])})
+            self._listings[key] = listing
+
+        return listing
+
+    def search_commands(self, language: str, platforms: list[str], query: str, limit: int = 25) -> list[str]:
+        """
+        Find commands for autocomplete.
+
+        Prefix matches are found by binary search on the sorted listing and come
+        first, followed by substring matches until the limit is reached. Close
+        spellings are looked up in a BK-tree of the listing only when nothing
+        matches at all.
+
+        Parameters
+        ----------
+        language : str
+            Language code, which should already be loaded.
+        platforms : list[str]
+            Platforms to include.
+        query : str
+            The text typed so far.
+        limit : int
+            Maximum number of results.
+
+        Returns
+        -------
+        list[str]
+            Matching command names, best matches first.
+        """
+        listing = self.list_commands(language, platforms)
+        query = query.lower()
+
+        if not query:
+            return listing[:limit]
+
+        matches: list[str] = []
+        index = bisect.bisect_left(listing, query)
+        while index < len(listing) and len(matches) < limit and listing[index].startswith(query):
+            matches.append(listing[index])
+            index += 1
+
+        if len(matches) < limit:
+            substring_matches = (command for command in listing if query in command and not command.startswith(query))
+            matches.extend(itertools.islice(substring_matches, limit - len(matches)))
+
+        if not matches:
+            max_distance = SHORT_QUERY_MAX_DISTANCE if len(query) <= SHORT_QUERY_LENGTH else CLOSE_MATCH_MAX_DISTANCE
+            index = self._name_index(language, platforms)
+            matches = [command for _, command in index.search(query, max_distance, limit)]
+
+        return matches
+
+    def _name_index(self, language: str, platforms: list[str]) -> BKTree:
+        """Return the BK-tree of a listing, building it on first use."""
+        key = (self.normalize_language(language), tuple(platforms))
+
+        if (index := self._name_indexes.get(key)) is None:
+            index = self._name_indexes[key] = BKTree(self.list_commands(language, platforms))
+
+        return index
+
+    def _drop_listings(self, language: str) -> None:
+        """Forget the merged listings of a language after its commands change."""
+        self._listings = {key: value for key, value in self._listings.items() if key[0] != language}
+        self._name_indexes = {key: value for key, value in self._name_indexes.items() if key[0] != language}
+
+
+page_store = TldrPageStore()
+
+
 class TldrClient:
     """
     Core TLDR client functionality for fetching and managing pages.
@@ -258,7 +505,7 @@ class TldrClient:
         return platforms_to_try
 
     @staticmethod
-    def fetch_tldr_page(
+    async def fetch_tldr_page(
         command: str,
         languages: list[str],
         platform_preference: str | None = None,
@@ -283,31 +530,44 @@ class TldrClient:
         Notes
         -----
         Follows TLDR spec priority: platform takes precedence over language.
-        Tries cache first, then remote fetch with automatic caching.
+        Pages are served from the in-memory page store. Pages are only fetched
+        remotely for languages whose archive is not in the cache.
         """
         platforms_to_try = TldrClient.get_platform_priority(platform_preference)
 
         for language in languages:
+            await page_store.ensure_loaded(language)
+
+            for platform in platforms_to_try:
+                if page_content := page_store.get_page(command, platform, language):
+                    return (page_content, platform)
+
+            # The archive holds every page of the language, so a miss means the page does not exist
+            if page_store.has_pages(language):
+                continue
+
+            suffix = f".{language}" if language != "en" else ""
+
             for platform in platforms_to_try:
-                # Check cache first
-                if TldrClient.have_recent_cache(command, platform, language) and (
-                    cache_content := TldrClient.load_page_from_cache(command, platform, language)
-                ):
-                    return (cache_content, platform)
-
-                # Fetch from remote
-                suffix = f".{language}" if language != "en" else ""
                 url = f"{PAGES_SOURCE_URL}{suffix}/{platform}/{command}.md"
 
                 try:
-                    req = Request(url, headers={"User-Agent": "tldr-python-client"})
-                    with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as resp:
-                        page_content = resp.read().decode("utf-8")
-                        TldrClient.store_page_to_cache(page_content, command, platform, language)
-                        return (page_content, platform)
-                except (HTTPError, URLError):
+                    response = await http_client.get(
+                        url,
+                        headers={"User-Agent": "tldr-python-client"},
+                        timeout=REQUEST_TIMEOUT_SECONDS,
+                    )
+                except httpx.HTTPError:
                     continue  # Try next platform/language combination
 
+                if response.status_code != 200:
+                    continue
+
+                page_content = response.text
+                await asyncio.to_thread(TldrClient.store_page_to_cache, page_content, command, platform, language)
+                page_store.add_page(page_content, command, platform, language)
+                return (page_content, platform)
+
         return None
 
     @staticmethod
@@ -326,12 +586,62 @@ class TldrClient:
         -------
         list[str]
             Sorted list of available command names.
+
+        Notes
+        -----
+        Served from the page store; the language must have been loaded with
+        ``page_store.ensure_loaded`` first.
         """
-        commands_set: set[str] = set()
+        return page_store.list_commands(language, TldrClient.get_listing_platforms(platform_filter))
 
-        normalized_lang_for_dir = "en" if language.startswith("en") else language
-        pages_dir_name = f"pages.{normalized_lang_for_dir}" if normalized_lang_for_dir != "en" else "pages"
+    @staticmethod
+    def search_tldr_commands(
+        query: str,
+        language: str = "en",
+        platform_filter: str | None = "linux",
+        limit: int = 25,
+    ) -> list[str]:
+        """
+        Search available TLDR commands for autocomplete.
 
+        Parameters
+        ----------
+        query : str
+            The text typed so far.
+        language : str
+            Language code to search.
+        platform_filter : str | None
+            Platform to filter by. If None, searches linux + common platforms.
+        limit : int
+            Maximum number of results.
+
+        Returns
+        -------
+        list[str]
+            Matching command names, prefix matches first.
+
+        Notes
+        -----
+        Served from the page store; the language must have been loaded with
+        ``page_store.ensure_loaded`` first.
+        """
+        return page_store.search_commands(language, TldrClient.get_listing_platforms(platform_filter), query, limit)
+
+    @staticmethod
+    def get_listing_platforms(platform_filter: str | None) -> list[str]:
+        """
+        Get the platforms whose commands are listed for a platform filter.
+
+        Parameters
+        ----------
+        platform_filter : str | None
+            Platform to filter by. If None, lists linux + common platforms.
+
+        Returns
+        -------
+        list[str]
+            Unique platforms to list, in order.
+        """
         # Handle platform filtering logic
         if platform_filter is None:
             # When no filter specified, search linux + common
@@ -351,21 +661,7 @@ class TldrClient:
                 unique_platforms_to_scan.append(platform)
                 seen_platforms.add(platform)
 
-        for platform in unique_platforms_to_scan:
-            path: Path = CACHE_DIR / pages_dir_name / platform
-
-            try:
-                # Skip if path doesn't exist
-                if not path.exists() or not path.is_dir():
-                    continue
-
-                # Collect all .md files
-                found_in_platform: set[str] = {file.stem for file in path.iterdir() if file.suffix == ".md"}
-                commands_set.update(found_in_platform)
-            except OSError:
-                continue
-
-        return sorted(commands_set)
+        return unique_platforms_to_scan
 
     @staticmethod
     def parse_placeholders(
@@ -586,7 +882,51 @@ class TldrClient:
         return f"No TLDR page found for `{command}`.\n[Request it on GitHub]({url})"
 
     @staticmethod
-    def update_tldr_cache(language: str = "en") -> str:
+    def _extract_archive(archive_path: Path, extract_dir: Path) -> None:
+        """Extract a downloaded archive into a staging directory."""
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(extract_dir)
+
+    @staticmethod
+    def _swap_cache_dir(extract_dir: Path, target_path: Path, previous_dir: Path) -> None:
+        """Move a freshly extracted directory into place, moving the old one aside."""
+        if target_path.exists():
+            target_path.rename(previous_dir)
+        extract_dir.rename(target_path)
+
+    @staticmethod
+    async def _download_archive(url: str, archive_path: Path) -> bool:
+        """
+        Stream an archive to disk without holding it in memory.
+
+        Returns
+        -------
+        bool
+            False if the server answered with an HTML page instead of an archive.
+        """
+        async with http_client.stream(
+            "GET",
+            url,
+            headers={"User-Agent": "tldr-python-client", "Accept": "application/zip"},
+            follow_redirects=True,
+            timeout=ARCHIVE_TIMEOUT_SECONDS,
+        ) as response:
+            response.raise_for_status()
+
+            with archive_path.open("wb") as archive_file:
+                first_chunk = True
+                async for chunk in response.aiter_bytes(ARCHIVE_CHUNK_SIZE):
+                    if first_chunk:
+                        if chunk.lstrip().lower().startswith((b"<!doctype html", b"<html>")):
+                            return False
+                        first_chunk = False
+
+                    await asyncio.to_thread(archive_file.write, chunk)
+
+        return True
+
+    @staticmethod
+    async def update_tldr_cache(language: str = "en") -> str:
         """
         Update the TLDR cache for a specific language.
 
@@ -603,59 +943,45 @@ class TldrClient:
         Notes
         -----
         Downloads from GitHub releases following TLDR spec v2.3.
-        Replaces existing cache completely to ensure consistency.
+        The archive is streamed to a temporary file and extracted into a
+        staging directory next to the cache, which is then swapped in by rename
+        and reloaded into the page store. A failed update leaves the existing
+        cache untouched.
         """
         suffix = "" if language.startswith("en") else f".{language}"
         pages_dir_name = "pages" if language.startswith("en") else f"pages.{language}"
 
         url = ARCHIVE_URL_TEMPLATE.format(suffix=suffix)
+        target_path = CACHE_DIR / pages_dir_name
+
+        # Staging lives inside the cache directory so the swap is a same-filesystem rename
+        await asyncio.to_thread(CACHE_DIR.mkdir, parents=True, exist_ok=True)
+        staging_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix=f".{pages_dir_name}-", dir=CACHE_DIR))
 
         try:
-            req = Request(url, headers={"User-Agent": "tldr-python-client", "Accept": "application/zip"})
-
-            with urlopen(req, timeout=30) as resp:
-                content = resp.read()
-
-                # Validate content
-                if content.strip().lower().startswith((b"<!doctype html", b"<html>")):
-                    return f"Failed to update cache for '{language}': Invalid content received"
-
-                target_path = CACHE_DIR / pages_dir_name
-
-                # More robust cache directory cleanup
-                if target_path.exists():
-                    try:
-                        shutil.rmtree(target_path)
-                    except OSError:
-                        # If rmtree fails, try to remove contents manually
-                        for item in target_path.rglob("*"):
-                            try:
-                                if item.is_file():
-                                    item.unlink()
-                                elif item.is_dir():
-                                    item.rmdir()
-                            except OSError:
-                                continue
-                        # Try final cleanup
-                        with contextlib.suppress(OSError):
-                            target_path.rmdir()
-
-                target_path.mkdir(parents=True, exist_ok=True)
-
-                # Extract archive
-                with zipfile.ZipFile(BytesIO(content)) as archive:
-                    archive.extractall(target_path)
-
-                return f"Cache updated for language `{language}` from {url}"
-
-        except HTTPError as e:
-            if e.code == 404:
+            if not await TldrClient._download_archive(url, staging_dir / "archive.zip"):
+                return f"Failed to update cache for '{language}': Invalid content received"
+
+            extract_dir = staging_dir / "pages"
+            await asyncio.to_thread(TldrClient._extract_archive, staging_dir / "archive.zip", extract_dir)
+            await page_store.install(
+                language,
+                lambda: TldrClient._swap_cache_dir(extract_dir, target_path, staging_dir / "previous"),
+            )
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 return f"Failed to update cache for '{language}': Archive not found (404)"
             return f"Failed to update cache for '{language}': {e}"
         except zipfile.BadZipFile:
             return f"Failed to update cache for '{language}': Invalid zip file"
         except Exception as e:
             return f"Failed to update cache for '{language}': {e}"
+        else:
+            return f"Cache updated for language `{language}` from {url}"
+        finally:
+            # Removes the archive, any partial extraction and the previous cache directory
+            await asyncio.to_thread(shutil.rmtree, staging_dir, ignore_errors=True)
 
     @staticmethod
     def cache_needs_update(language: str = "en") -> bool:
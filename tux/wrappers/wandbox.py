@@ -7,12 +7,14 @@ from tux.utils.exceptions import (
     APIRequestError,
     APIResourceNotFoundError,
 )
+from tux.wrappers.http_client import http_clients
+
+http_client = http_clients.get("wandbox")
 
-client = httpx.Client(timeout=15)
 url = "https://wandbox.org/api/compile.json"
 
 
-def getoutput(code: str, compiler: str, options: str | None) -> dict[str, Any] | None:
+async def getoutput(code: str, compiler: str, options: str | None) -> dict[str, Any] | None:
     """
     Compile and execute code using a specified compiler and return the output.
 
@@ -39,7 +41,7 @@ def getoutput(code: str, compiler: str, options: str | None) -> dict[str, Any] |
     payload = {"compiler": compiler, "code": code, "options": copt}
 
     try:
-        uri = client.post(url, json=payload, headers=headers)
+        uri = await http_client.post(url, json=payload, headers=headers)
         uri.raise_for_status()
     except httpx.ReadTimeout as e:
         # Changed to raise APIConnectionError for timeouts
@@ -1,7 +1,12 @@
+import asyncio
+import contextlib
 import datetime
 import json
+import os
 import random
+import time
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -12,6 +17,15 @@ from tux.utils.exceptions import (
     APIRequestError,
     APIResourceNotFoundError,
 )
+from tux.wrappers.http_client import http_clients
+
+http_client = http_clients.get("xkcd")
+
+# Published comics never change, so their metadata is cached on disk indefinitely
+CACHE_DIR: Path = Path(os.getenv("XKCD_CACHE_DIR", ".cache/xkcd"))
+
+# How long (in seconds) the ID of the latest comic is trusted before asking xkcd again
+LATEST_COMIC_TTL = 3600
 
 
 class HttpError(Exception):
@@ -128,6 +142,7 @@ class Client:
         self,
         api_url: str = "https://xkcd.com",
         explanation_wiki_url: str = "https://www.explainxkcd.com/wiki/index.php/",
+        cache_dir: Path = CACHE_DIR,
     ) -> None:
         """
         Initialize the Client.
@@ -138,10 +153,19 @@ class Client:
             The URL of the xkcd API, by default "https://xkcd.com"
         explanation_wiki_url : str, optional
             The URL of the xkcd explanation wiki, by default "https://www.explainxkcd.com/wiki/index.php/"
+        cache_dir : Path, optional
+            The directory comics are cached in, by default CACHE_DIR
         """
 
         self._api_url = api_url
         self._explanation_wiki_url = explanation_wiki_url
+        self._cache_dir = cache_dir
+
+        # Comic metadata by ID, filled from disk or the API
+        self._comics: dict[int, dict[str, Any]] = {}
+        # ID of the latest comic and the monotonic time it was fetched at
+        self._latest: tuple[int, float] | None = None
+        self._latest_lock = asyncio.Lock()
 
     def latest_comic_url(self) -> str:
         """
@@ -172,6 +196,28 @@ class Client:
 
         return f"{self._api_url}/{comic_id}/info.0.json"
 
+    def _build_comic(self, comic_dict: dict[str, Any], raw_image: bytes | None = None) -> Comic:
+        """
+        Build a Comic object from its metadata.
+
+        Parameters
+        ----------
+        comic_dict : dict[str, Any]
+            The comic metadata returned by the API.
+        raw_image : bytes | None, optional
+            The raw image data, by default None
+
+        Returns
+        -------
+        Comic
+            The comic object.
+        """
+
+        comic_url: str = f"{self._api_url}/{comic_dict['num']}/"
+        explanation_url: str = f"{self._explanation_wiki_url}{comic_dict['num']}"
+
+        return Comic(comic_dict, raw_image=raw_image, comic_url=comic_url, explanation_url=explanation_url)
+
     def _parse_response(self, response_text: str) -> Comic:
         """
         Parse the response text into a Comic object.
@@ -187,15 +233,97 @@ class Client:
             The parsed comic object.
         """
 
-        response_dict: dict[str, Any] = json.loads(response_text)
-        comic_url: str = f"{self._api_url}/{response_dict['num']}/"
-        explanation_url: str = f"{self._explanation_wiki_url}{response_dict['num']}"
+        return self._build_comic(json.loads(response_text))
+
+    def _metadata_path(self, comic_id: int) -> Path:
+        return self._cache_dir / "comics" / f"{comic_id}.json"
+
+    @staticmethod
+    def _read_cache_file(path: Path) -> bytes | None:
+        """Read a cache file, returning None if it is missing or unreadable."""
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_cache_file(path: Path, data: bytes) -> None:
+        """Write a cache file atomically; failures only cost a refetch later."""
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+
+    async def _get_comic_dict(self, comic_id: int) -> dict[str, Any]:
+        """
+        Get the metadata of a published comic, from memory, disk or the API.
+
+        Parameters
+        ----------
+        comic_id : int
+            The ID of the comic.
+
+        Returns
+        -------
+        dict[str, Any]
+            The comic metadata.
+        """
+
+        if (comic_dict := self._comics.get(comic_id)) is not None:
+            return comic_dict
 
-        return Comic(response_dict, comic_url=comic_url, explanation_url=explanation_url)
+        if cached := await asyncio.to_thread(self._read_cache_file, self._metadata_path(comic_id)):
+            with contextlib.suppress(ValueError):
+                comic_dict = json.loads(cached)
+                self._comics[comic_id] = comic_dict
+                return comic_dict
 
-    def _fetch_comic(self, comic_id: int, raw_comic_image: bool) -> Comic:
+        return await self._store_comic_dict(await self._request_comic(comic_id))
+
+    async def _store_comic_dict(self, response_text: str) -> dict[str, Any]:
         """
-        Fetch a comic from the xkcd API.
+        Cache the metadata of a comic in memory and on disk.
+
+        Parameters
+        ----------
+        response_text : str
+            The API response.
+
+        Returns
+        -------
+        dict[str, Any]
+            The comic metadata.
+        """
+
+        comic_dict: dict[str, Any] = json.loads(response_text)
+        comic_id = int(comic_dict["num"])
+
+        self._comics[comic_id] = comic_dict
+        await asyncio.to_thread(self._write_cache_file, self._metadata_path(comic_id), response_text.encode())
+
+        return comic_dict
+
+    async def _get_latest_comic_id(self) -> int:
+        """
+        Get the ID of the latest comic, asking the API at most once per LATEST_COMIC_TTL.
+
+        Returns
+        -------
+        int
+            The ID of the latest comic.
+        """
+
+        async with self._latest_lock:
+            if self._latest is None or time.monotonic() - self._latest[1] > LATEST_COMIC_TTL:
+                comic_dict = await self._store_comic_dict(await self._request_comic(0))
+                self._latest = (int(comic_dict["num"]), time.monotonic())
+
+            return self._latest[0]
+
+    async def _fetch_comic(self, comic_id: int, raw_comic_image: bool) -> Comic:
+        """
+        Fetch a comic, serving it from the cache when possible.
 
         Parameters
         ----------
@@ -210,15 +338,26 @@ class Client:
             The fetched comic.
         """
 
-        comic = self._parse_response(self._request_comic(comic_id))
+        if comic_id <= 0:
+            comic_id = await self._get_latest_comic_id()
+
+        comic_dict = await self._get_comic_dict(comic_id)
+        raw_image = await self._request_raw_image(comic_dict.get("img")) if raw_comic_image else None
+
+        return self._build_comic(comic_dict, raw_image)
 
-        if raw_comic_image:
-            raw_image = self._request_raw_image(comic.image_url)
-            comic.update_raw_image(raw_image)
+    async def prefetch_latest_comic(self) -> None:
+        """
+        Refresh the latest comic pointer and cache that comic.
+
+        Called periodically so requests for the latest or a random comic are
+        served from the cache.
+        """
 
-        return comic
+        self._latest = None
+        await self._get_latest_comic_id()
 
-    def get_latest_comic(self, raw_comic_image: bool = False) -> Comic:
+    async def get_latest_comic(self, raw_comic_image: bool = False) -> Comic:
         """
         Get the latest xkcd comic.
 
@@ -233,9 +372,9 @@ class Client:
             The latest xkcd comic.
         """
 
-        return self._fetch_comic(0, raw_comic_image)
+        return await self._fetch_comic(0, raw_comic_image)
 
-    def get_comic(self, comic_id: int, raw_comic_image: bool = False) -> Comic:
+    async def get_comic(self, comic_id: int, raw_comic_image: bool = False) -> Comic:
         """
         Get a specific xkcd comic.
 
@@ -252,9 +391,9 @@ class Client:
             The fetched xkcd comic.
         """
 
-        return self._fetch_comic(comic_id, raw_comic_image)
+        return await self._fetch_comic(comic_id, raw_comic_image)
 
-    def get_random_comic(self, raw_comic_image: bool = False) -> Comic:
+    async def get_random_comic(self, raw_comic_image: bool = False) -> Comic:
         """
         Get a random xkcd comic.
 
@@ -269,12 +408,12 @@ class Client:
             The random xkcd comic.
         """
 
-        latest_comic_id: int = self._parse_response(self._request_comic(0)).id or 0
+        latest_comic_id: int = await self._get_latest_comic_id()
         random_id: int = random.randint(1, latest_comic_id)
 
-        return self._fetch_comic(random_id, raw_comic_image)
+        return await self._fetch_comic(random_id, raw_comic_image)
 
-    def _request_comic(self, comic_id: int) -> str:
+    async def _request_comic(self, comic_id: int) -> str:
         """
         Request the comic data from the xkcd API.
 
@@ -297,7 +436,7 @@ class Client:
         comic_url = self.latest_comic_url() if comic_id <= 0 else self.comic_id_url(comic_id)
 
         try:
-            response = httpx.get(comic_url)
+            response = await http_client.get(comic_url)
             response.raise_for_status()
 
         except httpx.HTTPStatusError as exc:
@@ -314,7 +453,7 @@ class Client:
         return response.text
 
     @staticmethod
-    def _request_raw_image(raw_image_url: str | None) -> bytes:
+    async def _request_raw_image(raw_image_url: str | None) -> bytes:
         """
         Request the raw image data from the xkcd API.
 
@@ -338,7 +477,7 @@ class Client:
             raise APIResourceNotFoundError(service_name="xkcd", resource_identifier="image_url_not_provided")
 
         try:
-            response = httpx.get(raw_image_url)
+            response = await http_client.get(raw_image_url)
             response.raise_for_status()
 
         except httpx.HTTPStatusError as exc: